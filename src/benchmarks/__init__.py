@@ -0,0 +1,12 @@
+"""Seed a database and load-test the API hot paths.
+
+Run from ``src`` against the database of ``POSTGRES_URI``::
+
+    python -m benchmarks seed --users 10 --transactions 10000
+    python -m benchmarks run --concurrency 1 8 32 --output after.json
+    python -m benchmarks compare before.json after.json
+
+``run`` serves the ASGI application in process, or drives a server that
+is already running with ``--url``. SQL queries per request are read from
+the ``Server-Timing`` header of the responses.
+"""
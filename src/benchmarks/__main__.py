@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from benchmarks.load import (
+    SCENARIOS,
+    InProcessServer,
+    run_benchmark,
+)
+from benchmarks.report import (
+    compare,
+    format_table,
+    load_results,
+    save_results,
+)
+from benchmarks.seed import SeedOptions, seed
+
+
+def _seed(args: argparse.Namespace) -> int:
+    created = asyncio.run(
+        seed(
+            SeedOptions(
+                users=args.users,
+                categories=args.categories,
+                transactions=args.transactions,
+                days=args.days,
+                seed=args.seed,
+            )
+        )
+    )
+    print(f"Created {created} of {args.users} users")
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = InProcessServer(args.host, args.port)
+        server.start()
+        base_url = server.url
+
+    print(format_table([]))
+    try:
+        results = run_benchmark(
+            base_url,
+            [SCENARIOS[name] for name in args.scenarios],
+            concurrency_levels=args.concurrency,
+            requests=args.requests,
+            warmup=args.warmup,
+            accounts=args.users,
+            seed=args.seed,
+            on_result=lambda result: print(
+                format_table([result]).splitlines()[-1], flush=True
+            ),
+        )
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.output is not None:
+        save_results(
+            args.output,
+            results,
+            {
+                "url": args.url,
+                "scenarios": args.scenarios,
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+                "warmup": args.warmup,
+                "users": args.users,
+                "seed": args.seed,
+            },
+        )
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    current = load_results(args.current)
+    print(format_table(current))
+    regressions = compare(
+        load_results(args.baseline), current, threshold=args.threshold
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="create benchmark data")
+    seed_parser.add_argument("--users", type=int, default=10)
+    seed_parser.add_argument("--categories", type=int, default=20)
+    seed_parser.add_argument(
+        "--transactions", type=int, default=1000, help="per user"
+    )
+    seed_parser.add_argument("--days", type=int, default=365)
+    seed_parser.add_argument("--seed", type=int, default=0)
+    seed_parser.set_defaults(handler=_seed)
+
+    run_parser = commands.add_parser("run", help="load-test the API")
+    run_parser.add_argument(
+        "--url", help="a running server; by default one is started"
+    )
+    run_parser.add_argument("--host", default="127.0.0.1")
+    run_parser.add_argument("--port", type=int, default=8765)
+    run_parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        default=list(SCENARIOS),
+    )
+    run_parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 8, 32]
+    )
+    run_parser.add_argument(
+        "--requests",
+        type=int,
+        default=500,
+        help="per scenario and concurrency level",
+    )
+    run_parser.add_argument("--warmup", type=int, default=20)
+    run_parser.add_argument(
+        "--users", type=int, default=10, help="seeded users to log in as"
+    )
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--output", type=Path)
+    run_parser.set_defaults(handler=_run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="find regressions between two runs"
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.set_defaults(handler=_compare)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
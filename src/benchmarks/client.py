@@ -0,0 +1,137 @@
+import http.client
+import json
+import re
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from typing import Any
+
+
+CSRF_TOKEN = re.compile(r'name="csrf_token"[^>]*value="([^"]+)"')
+SERVER_TIMING_QUERIES = re.compile(r'\bdb;[^,]*desc="(\d+) queries"')
+
+
+@dataclass(frozen=True)
+class Request:
+    method: str
+    path: str
+    body: bytes | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @staticmethod
+    def json(method: str, path: str, data: Any) -> "Request":
+        return Request(
+            method,
+            path,
+            json.dumps(data).encode(),
+            {"Content-Type": "application/json"},
+        )
+
+
+@dataclass(frozen=True)
+class Response:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    seconds: float
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    @property
+    def queries(self) -> int | None:
+        """The number of SQL queries the server reported running."""
+        match = SERVER_TIMING_QUERIES.search(
+            self.headers.get("server-timing", "")
+        )
+        return int(match.group(1)) if match is not None else None
+
+
+class BenchmarkClient:
+    """HTTP client of one benchmark user.
+
+    Keeps a single keep-alive connection and the cookies set by the
+    server, so requests after ``login`` are authenticated.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30):
+        url = urllib.parse.urlsplit(base_url)
+        self._host = url.hostname or "127.0.0.1"
+        self._port = url.port or 80
+        self._timeout = timeout
+        self._connection: http.client.HTTPConnection | None = None
+        self._cookies: SimpleCookie = SimpleCookie()
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        if self._connection is None:
+            self._connection = http.client.HTTPConnection(
+                self._host, self._port, timeout=self._timeout
+            )
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def send(self, request: Request) -> Response:
+        headers = dict(request.headers)
+        if self._cookies:
+            headers["Cookie"] = "; ".join(
+                f"{name}={morsel.value}"
+                for name, morsel in self._cookies.items()
+            )
+        connection = self._get_connection()
+        started = time.perf_counter()
+        try:
+            connection.request(
+                request.method, request.path, request.body, headers
+            )
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError):
+            # The server may close an idle keep-alive connection
+            self.close()
+            raise
+        seconds = time.perf_counter() - started
+        for header in response.headers.get_all("Set-Cookie") or ():
+            self._cookies.load(header)
+        if response.will_close:
+            self.close()
+        return Response(
+            status=response.status,
+            headers={
+                name.lower(): value for name, value in response.getheaders()
+            },
+            body=body,
+            seconds=seconds,
+        )
+
+    def get_login_request(self, email: str, password: str) -> Request:
+        """Fetch the login form and return the request that submits it."""
+        self._cookies.clear()
+        form = self.send(Request("GET", "/login"))
+        match = CSRF_TOKEN.search(form.body.decode())
+        if match is None:
+            raise RuntimeError("The login form has no CSRF token")
+        return Request(
+            "POST",
+            "/login",
+            urllib.parse.urlencode(
+                {
+                    "email": email,
+                    "password": password,
+                    "csrf_token": match.group(1),
+                }
+            ).encode(),
+            {"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+    def login(self, email: str, password: str) -> None:
+        response = self.send(self.get_login_request(email, password))
+        # A successful login redirects, a failed one renders the form again
+        if response.status != 302:
+            raise RuntimeError(
+                f"Logging in as {email} failed with {response.status}"
+            )
@@ -0,0 +1,297 @@
+import asyncio
+import datetime
+import http.client
+import itertools
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from benchmarks.client import BenchmarkClient, Request, Response
+from benchmarks.report import ScenarioResult, summarize
+from benchmarks.seed import (
+    BENCHMARK_PASSWORD,
+    DESCRIPTIONS,
+    get_benchmark_email,
+)
+
+
+@dataclass
+class VirtualUser:
+    client: BenchmarkClient
+    email: str
+    rng: random.Random
+    category_ids: list[str] = field(default_factory=list)
+    currency_ids: list[str] = field(default_factory=list)
+    created_ids: list[str] = field(default_factory=list)
+
+    def login(self) -> None:
+        self.client.login(self.email, BENCHMARK_PASSWORD)
+        self.category_ids = [
+            item["value"]
+            for item in self.client.send(
+                Request("GET", "/api/v1/categories/autocomplete")
+            ).json()
+        ]
+        self.currency_ids = [
+            item["value"]
+            for item in self.client.send(
+                Request("GET", "/api/v1/currencies/autocomplete")
+            ).json()
+        ]
+
+    def get_create_request(self) -> Request:
+        date = datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+            days=self.rng.randint(0, 365)
+        )
+        return Request.json(
+            "POST",
+            "/api/v1/transactions",
+            {
+                "category_id": self.rng.choice(self.category_ids),
+                "currency_id": self.rng.choice(self.currency_ids),
+                "amount": f"{self.rng.randint(100, 500_000) / 100:.2f}",
+                "description": self.rng.choice(DESCRIPTIONS),
+                "date": date.isoformat(),
+            },
+        )
+
+    def remember_created(self, response: Response) -> None:
+        if response.status == 201:
+            self.created_ids.append(
+                response.json()["transaction"]["transaction_id"]
+            )
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    # Builds the measured request; may send untimed requests to set it up
+    prepare: Callable[[VirtualUser], Request]
+    expected_status: int
+    handle: Callable[[VirtualUser, Response], None] | None = None
+
+
+def _prepare_delete(user: VirtualUser) -> Request:
+    if not user.created_ids:
+        user.remember_created(user.client.send(user.get_create_request()))
+    return Request("DELETE", f"/api/v1/transactions/{user.created_ids.pop()}")
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "autocomplete",
+            lambda user: Request("GET", "/api/v1/categories/autocomplete"),
+            200,
+        ),
+        Scenario(
+            "list",
+            lambda user: Request("GET", "/api/v1/transactions/me?limit=50"),
+            200,
+        ),
+        Scenario(
+            "create",
+            VirtualUser.get_create_request,
+            201,
+            VirtualUser.remember_created,
+        ),
+        Scenario("delete", _prepare_delete, 200),
+        # Last, as a failed login leaves the user signed out
+        Scenario(
+            "login",
+            lambda user: user.client.get_login_request(
+                user.email, BENCHMARK_PASSWORD
+            ),
+            302,
+        ),
+    )
+}
+
+
+class InProcessServer:
+    """Serve the ASGI application with hypercorn on a background thread."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._thread = threading.Thread(
+            target=self._run, name="benchmark-server", daemon=True
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stopped: asyncio.Event | None = None
+        self._started = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+
+        from presentation.app.app import asgi_app
+
+        config = Config()
+        config.bind = [f"{self.host}:{self.port}"]
+        config.accesslog = None
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self._started.set()
+        await serve(
+            asgi_app,  # type: ignore[arg-type]
+            config,
+            shutdown_trigger=self._stopped.wait,  # type: ignore[arg-type]
+        )
+
+    def start(self, timeout: float = 30) -> None:
+        self._thread.start()
+        self._started.wait(timeout)
+        deadline = time.monotonic() + timeout
+        client = BenchmarkClient(self.url)
+        while True:
+            try:
+                client.send(Request("GET", "/login"))
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+            finally:
+                client.close()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._stopped is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        self._thread.join()
+
+
+@dataclass
+class _Measurement:
+    latencies: list[float] = field(default_factory=list)
+    failures: int = 0
+    # None once a response did not report its queries
+    queries: int | None = 0
+    seconds: float = 0.0
+
+    def add(self, other: "_Measurement") -> None:
+        self.latencies.extend(other.latencies)
+        self.failures += other.failures
+        self.queries = (
+            self.queries + other.queries
+            if self.queries is not None and other.queries is not None
+            else None
+        )
+
+
+def _run_users(
+    scenario: Scenario, users: list[VirtualUser], requests: int
+) -> _Measurement:
+    """Send ``requests`` requests from all ``users`` at once."""
+    counter = itertools.count()
+    measurement = _Measurement()
+    lock = threading.Lock()
+
+    def run(user: VirtualUser) -> None:
+        user_measurement = _Measurement()
+        while next(counter) < requests:
+            request = scenario.prepare(user)
+            started = time.perf_counter()
+            try:
+                response = user.client.send(request)
+            except (http.client.HTTPException, OSError):
+                user_measurement.latencies.append(
+                    time.perf_counter() - started
+                )
+                user_measurement.failures += 1
+                continue
+            user_measurement.latencies.append(response.seconds)
+            if response.status != scenario.expected_status:
+                user_measurement.failures += 1
+            if user_measurement.queries is not None:
+                queries = response.queries
+                user_measurement.queries = (
+                    user_measurement.queries + queries
+                    if queries is not None
+                    else None
+                )
+            if scenario.handle is not None:
+                scenario.handle(user, response)
+        with lock:
+            measurement.add(user_measurement)
+
+    threads = [
+        threading.Thread(target=run, args=(user,), name="benchmark-user")
+        for user in users
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    measurement.seconds = time.perf_counter() - started
+    return measurement
+
+
+def run_scenario(
+    scenario: Scenario,
+    users: list[VirtualUser],
+    requests: int,
+    warmup: int = 0,
+) -> ScenarioResult:
+    if warmup:
+        _run_users(scenario, users, warmup)
+    measurement = _run_users(scenario, users, requests)
+    return summarize(
+        scenario.name,
+        concurrency=len(users),
+        latencies=measurement.latencies,
+        failures=measurement.failures,
+        seconds=measurement.seconds,
+        queries=measurement.queries,
+    )
+
+
+def run_benchmark(
+    base_url: str,
+    scenarios: list[Scenario],
+    concurrency_levels: list[int],
+    requests: int,
+    warmup: int,
+    accounts: int,
+    seed: int = 0,
+    on_result: Callable[[ScenarioResult], None] | None = None,
+) -> list[ScenarioResult]:
+    """Run every scenario at every concurrency level, in order.
+
+    At a concurrency level of ``n`` there are ``n`` virtual users, each
+    with its own connection and session, logged in as one of the first
+    ``accounts`` seeded users.
+    """
+    results = []
+    for concurrency in concurrency_levels:
+        users = [
+            VirtualUser(
+                client=BenchmarkClient(base_url),
+                email=get_benchmark_email(number % accounts),
+                rng=random.Random(f"{seed}:{concurrency}:{number}"),
+            )
+            for number in range(concurrency)
+        ]
+        try:
+            for user in users:
+                user.login()
+            for scenario in scenarios:
+                result = run_scenario(scenario, users, requests, warmup)
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        finally:
+            for user in users:
+                user.client.close()
+    return results
@@ -0,0 +1,164 @@
+import datetime
+import json
+import math
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    scenario: str
+    concurrency: int
+    requests: int
+    failures: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries_per_request: float | None
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return self.scenario, self.concurrency
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of sorted ``values``."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(values)), 1)
+    return values[rank - 1]
+
+
+def summarize(
+    scenario: str,
+    concurrency: int,
+    latencies: list[float],
+    failures: int,
+    seconds: float,
+    queries: int | None,
+) -> ScenarioResult:
+    latencies = sorted(latencies)
+    requests = len(latencies)
+    return ScenarioResult(
+        scenario=scenario,
+        concurrency=concurrency,
+        requests=requests,
+        failures=failures,
+        seconds=round(seconds, 3),
+        throughput=round(requests / seconds, 1) if seconds else 0.0,
+        p50_ms=round(percentile(latencies, 0.50) * 1000, 2),
+        p95_ms=round(percentile(latencies, 0.95) * 1000, 2),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 2),
+        queries_per_request=(
+            round(queries / requests, 2)
+            if queries is not None and requests
+            else None
+        ),
+    )
+
+
+def format_table(results: list[ScenarioResult]) -> str:
+    header = (
+        f"{'scenario':<14}{'conc':>6}{'reqs':>7}{'fail':>6}"
+        f"{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'q/req':>7}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        queries = (
+            f"{result.queries_per_request:.2f}"
+            if result.queries_per_request is not None
+            else "-"
+        )
+        lines.append(
+            f"{result.scenario:<14}{result.concurrency:>6}"
+            f"{result.requests:>7}{result.failures:>6}"
+            f"{result.throughput:>9.1f}{result.p50_ms:>9.2f}"
+            f"{result.p95_ms:>9.2f}{result.p99_ms:>9.2f}{queries:>7}"
+        )
+    return "\n".join(lines)
+
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(
+    path: Path, results: list[ScenarioResult], options: dict[str, Any]
+) -> None:
+    """Write the results with the commit and options they were run with."""
+    path.write_text(
+        json.dumps(
+            {
+                "commit": _get_commit(),
+                "created_at": datetime.datetime.now(datetime.UTC).isoformat(),
+                "options": options,
+                "results": [result.to_dict() for result in results],
+            },
+            indent=2,
+        )
+    )
+
+
+def load_results(path: Path) -> list[ScenarioResult]:
+    data = json.loads(path.read_text())
+    return [ScenarioResult(**result) for result in data["results"]]
+
+
+def compare(
+    baseline: list[ScenarioResult],
+    current: list[ScenarioResult],
+    threshold: float = 0.1,
+) -> list[str]:
+    """Return the regressions of ``current`` against ``baseline``.
+
+    Throughput and p95 latency regress when they are worse by more than
+    ``threshold``; any rise in queries per request or in failures is a
+    regression too. Results are only compared for the same scenario and
+    concurrency level.
+    """
+    baseline_by_key = {result.key: result for result in baseline}
+    regressions = []
+    for result in current:
+        before = baseline_by_key.get(result.key)
+        if before is None:
+            continue
+        name = f"{result.scenario} at concurrency {result.concurrency}"
+        if result.throughput < before.throughput * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {before.throughput} -> "
+                f"{result.throughput} req/s"
+            )
+        if result.p95_ms > before.p95_ms * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {before.p95_ms} -> {result.p95_ms} ms"
+            )
+        if (
+            result.queries_per_request is not None
+            and before.queries_per_request is not None
+            and result.queries_per_request > before.queries_per_request
+        ):
+            regressions.append(
+                f"{name}: queries per request "
+                f"{before.queries_per_request} -> "
+                f"{result.queries_per_request}"
+            )
+        if result.failures > before.failures:
+            regressions.append(
+                f"{name}: failures {before.failures} -> {result.failures}"
+            )
+    return regressions
@@ -0,0 +1,214 @@
+import datetime
+import random
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from loguru import logger
+
+from core.application.user.factories.user import UserFactory
+from core.domain.transaction.entities.category import CategoryEntity
+from core.domain.transaction.entities.currency import CurrencyEntity
+from core.domain.transaction.entities.operation import OperationEntity
+from core.domain.transaction.entities.transaction import TransactionEntity
+from core.domain.transaction.enums.operation import OperationType
+from core.domain.transaction.value_objects.money import Money
+from core.domain.user.entities.role import RoleEntity
+from core.infrastructure.database.core import SessionContextManager
+from core.infrastructure.repositories.category import CategoryRepository
+from core.infrastructure.repositories.currency import CurrencyRepository
+from core.infrastructure.repositories.operation import OperationRepository
+from core.infrastructure.repositories.transaction import TransactionRepository
+from core.infrastructure.repositories.user import UserRepository
+from core.infrastructure.services.cryptography import (
+    CryptographyService,
+    ExecutorCryptographyService,
+)
+from core.shared.exceptions import NotFoundException
+
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+OPERATIONS = (
+    ("Benchmark income", OperationType.INCOME),
+    ("Benchmark expense", OperationType.EXPENSE),
+)
+CURRENCIES = (
+    ("UAH", "Ukrainian hryvnia", "₴"),
+    ("USD", "US dollar", "$"),
+    ("EUR", "Euro", "€"),
+)
+DESCRIPTIONS = (
+    "Groceries at the market",
+    "Monthly salary payment",
+    "Coffee with colleagues",
+    "Public transport card",
+    "Electricity and water bill",
+    "Online subscription renewal",
+    "Dinner at a restaurant",
+    "Transfer from savings",
+)
+
+# Transactions of one user are written in chunks of this size
+SEED_CHUNK_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class SeedOptions:
+    users: int = 10
+    categories: int = 20
+    transactions: int = 1000
+    days: int = 365
+    seed: int = 0
+
+
+def get_benchmark_email(number: int) -> str:
+    return f"bench_user_{number}@example.com"
+
+
+async def _get_operations(session) -> list[OperationEntity]:
+    repository = OperationRepository(session)
+    existing = {
+        operation.operation_name: operation
+        for operation in await repository.get_all()
+    }
+    operations = []
+    for name, operation_type in OPERATIONS:
+        operation = existing.get(name)
+        if operation is None:
+            operation = await repository.save(
+                OperationEntity(
+                    operation_id=uuid4(),
+                    operation_name=name,
+                    operation_type=operation_type,
+                )
+            )
+        operations.append(operation)
+    return operations
+
+
+async def _get_categories(
+    session, operations: list[OperationEntity], count: int
+) -> list[CategoryEntity]:
+    repository = CategoryRepository(session)
+    existing = {
+        (category.operation.operation_id, category.category_name): category
+        for category in await repository.get_all()
+    }
+    categories = []
+    for number in range(count):
+        operation = operations[number % len(operations)]
+        name = f"Benchmark category {number}"
+        category = existing.get((operation.operation_id, name))
+        if category is None:
+            category = await repository.save(
+                CategoryEntity(
+                    category_id=uuid4(),
+                    category_name=name,
+                    operation=operation,
+                )
+            )
+        categories.append(category)
+    return categories
+
+
+async def _get_currencies(session) -> list[CurrencyEntity]:
+    repository = CurrencyRepository(session)
+    existing = {
+        currency.currency_code: currency
+        for currency in await repository.get_all()
+    }
+    currencies = []
+    for code, name, symbol in CURRENCIES:
+        currency = existing.get(code)
+        if currency is None:
+            currency = await repository.save(
+                CurrencyEntity(
+                    currency_id=uuid4(),
+                    currency_name=name,
+                    currency_code=code,
+                    currency_symbol=symbol,
+                )
+            )
+        currencies.append(currency)
+    return currencies
+
+
+def _make_transactions(
+    user_id: UUID,
+    categories: list[CategoryEntity],
+    currencies: list[CurrencyEntity],
+    options: SeedOptions,
+    rng: random.Random,
+) -> list[TransactionEntity]:
+    now = datetime.datetime.now(datetime.UTC).replace(microsecond=0)
+    return [
+        TransactionEntity(
+            transaction_id=UUID(int=rng.getrandbits(128), version=4),
+            user_id=user_id,
+            category=rng.choice(categories),
+            money=Money(
+                amount=Decimal(rng.randint(100, 500_000)) / 100,
+                currency=rng.choice(currencies),
+            ),
+            date=now
+            - datetime.timedelta(seconds=rng.randint(0, options.days * 86400)),
+            description=rng.choice(DESCRIPTIONS),
+        )
+        for _ in range(options.transactions)
+    ]
+
+
+async def seed(options: SeedOptions) -> int:
+    """Create the benchmark users and their transactions.
+
+    Reference data is created when missing. Users that already exist are
+    left as they are, so seeding again with the same options gives the
+    same data set; the transactions of a user only depend on ``seed``
+    and the user's number.
+
+    :arg options: What to create.
+    :return: The number of users created.
+    """
+    user_factory = UserFactory(
+        ExecutorCryptographyService(CryptographyService())
+    )
+    member_role = RoleEntity.create("member")
+    created = 0
+    async with SessionContextManager() as session:
+        operations = await _get_operations(session)
+        categories = await _get_categories(
+            session, operations, options.categories
+        )
+        currencies = await _get_currencies(session)
+
+        user_repository = UserRepository(session)
+        transaction_repository = TransactionRepository(session)
+        for number in range(options.users):
+            email = get_benchmark_email(number)
+            try:
+                await user_repository.get_by_email(email)
+                continue
+            except NotFoundException:
+                pass
+            user = await user_factory.create_user(
+                username=f"bench_user_{number}",
+                email=email,
+                password=BENCHMARK_PASSWORD,
+                roles=[member_role],
+            )
+            await user_repository.save(user)
+
+            rng = random.Random(f"{options.seed}:{number}")
+            transactions = _make_transactions(
+                user.user_id, categories, currencies, options, rng
+            )
+            for start in range(0, len(transactions), SEED_CHUNK_SIZE):
+                await transaction_repository.save_many(
+                    transactions[start:start + SEED_CHUNK_SIZE]
+                )
+            created += 1
+            logger.info(
+                f"Seeded {email} with {len(transactions)} transactions"
+            )
+    return created
@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from core.domain.transaction.enums.autocomplete import AutocompleteMatch
+
+
+DEFAULT_AUTOCOMPLETE_LIMIT = 20
+MAX_AUTOCOMPLETE_LIMIT = 100
+
+
+class AutocompleteRequestDTO(BaseModel):
+    q: str = Field(default="", max_length=64)
+    limit: int = Field(
+        default=DEFAULT_AUTOCOMPLETE_LIMIT, ge=1, le=MAX_AUTOCOMPLETE_LIMIT
+    )
+    match: AutocompleteMatch = AutocompleteMatch.FOLDED
+
+
+class AutocompleteItemDTO(BaseModel):
+    label: str
+    value: UUID
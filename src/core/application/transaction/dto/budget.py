@@ -0,0 +1,119 @@
+import datetime
+from decimal import Decimal
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from core.domain.transaction.entities.budget import BudgetEntity
+from core.domain.transaction.entities.budget_alert import BudgetAlertEntity
+from core.domain.transaction.enums.budget import BudgetPeriod
+
+
+class CreateBudgetDTO(BaseModel):
+    user_id: UUID
+    category_id: UUID | None = None
+    operation_id: UUID | None = None
+    currency_id: UUID
+    period: BudgetPeriod
+    limit: Decimal = Field(gt=0, le=Decimal("9999999999999999"))
+    thresholds: list[Annotated[int, Field(ge=1, le=1000)]] = Field(
+        default=[80, 100], min_length=1, max_length=10
+    )
+
+    @model_validator(mode="after")
+    def _validate_target(self) -> "CreateBudgetDTO":
+        if (self.category_id is None) == (self.operation_id is None):
+            raise ValueError(
+                "Exactly one of category_id and operation_id is required"
+            )
+        return self
+
+
+class BudgetDTO(BaseModel):
+    budget_id: UUID
+    user_id: UUID
+    category_id: UUID | None
+    operation_id: UUID | None
+    currency_id: UUID
+    currency_code: str
+    currency_symbol: str
+    period: BudgetPeriod
+    limit: Decimal
+    thresholds: list[int]
+    created_at: datetime.datetime
+
+    @staticmethod
+    def from_entity(entity: BudgetEntity) -> "BudgetDTO":
+        return BudgetDTO(
+            budget_id=entity.budget_id,
+            user_id=entity.user_id,
+            category_id=entity.category_id,
+            operation_id=entity.operation_id,
+            currency_id=entity.limit.currency.currency_id,
+            currency_code=entity.limit.currency.currency_code,
+            currency_symbol=entity.limit.currency.currency_symbol,
+            period=entity.period,
+            limit=entity.limit.amount,
+            thresholds=entity.thresholds,
+            created_at=entity.created_at,
+        )
+
+
+class BudgetStatusDTO(BaseModel):
+    budget: BudgetDTO
+    period_start: datetime.datetime
+    spent: Decimal
+    remaining: Decimal
+    percent_used: Decimal
+    thresholds_reached: list[int]
+
+    @staticmethod
+    def from_entity(
+        entity: BudgetEntity, period_start: datetime.datetime, spent: Decimal
+    ) -> "BudgetStatusDTO":
+        limit = entity.limit.amount
+        return BudgetStatusDTO(
+            budget=BudgetDTO.from_entity(entity),
+            period_start=period_start,
+            spent=spent,
+            remaining=limit - spent,
+            percent_used=round(spent * 100 / limit, 2),
+            thresholds_reached=[
+                threshold
+                for threshold in entity.thresholds
+                if spent * 100 >= limit * threshold
+            ],
+        )
+
+
+class BudgetAlertDTO(BaseModel):
+    alert_id: UUID
+    budget_id: UUID
+    user_id: UUID
+    period_start: datetime.datetime
+    threshold: int
+    limit: Decimal
+    spent: Decimal
+    currency_code: str
+    created_at: datetime.datetime
+
+    @staticmethod
+    def from_entity(entity: BudgetAlertEntity) -> "BudgetAlertDTO":
+        return BudgetAlertDTO(
+            alert_id=entity.alert_id,
+            budget_id=entity.budget.budget_id,
+            user_id=entity.budget.user_id,
+            period_start=entity.period_start,
+            threshold=entity.threshold,
+            limit=entity.budget.limit.amount,
+            spent=entity.spent,
+            currency_code=entity.budget.limit.currency.currency_code,
+            created_at=entity.created_at,
+        )
+
+
+class BudgetAlertRunDTO(BaseModel):
+    """What one pass of the alert dispatcher did."""
+
+    delivered: int
@@ -0,0 +1,49 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+MAX_CONVERSION_BATCH_SIZE = 1000
+
+
+class ExchangeRateRowDTO(BaseModel):
+    """One rate read from a rates file: ``rate`` units of the currency per
+    unit of the file's reference currency."""
+
+    date: datetime.date
+    currency_code: str
+    rate: Decimal
+
+
+class ExchangeRateLoadResultDTO(BaseModel):
+    loaded: int
+    unknown_currency_codes: list[str]
+
+
+class ConvertAmountDTO(BaseModel):
+    currency_id: UUID
+    amount: Decimal = Field(ge=0, max_digits=18, decimal_places=2)
+    date: datetime.date
+
+
+class ConvertMoneyRequestDTO(BaseModel):
+    currency_id: UUID
+    amounts: list[ConvertAmountDTO] = Field(
+        min_length=1, max_length=MAX_CONVERSION_BATCH_SIZE
+    )
+
+
+class ConvertedAmountDTO(ConvertAmountDTO):
+    converted_amount: Decimal
+
+
+class ConvertedMoneyDTO(BaseModel):
+    """Amounts converted to one currency, each at the rates of its date."""
+
+    currency_id: UUID
+    currency_code: str
+    currency_symbol: str
+    amounts: list[ConvertedAmountDTO]
+    total: Decimal
@@ -0,0 +1,96 @@
+import datetime
+from decimal import Decimal
+from typing import Any, Self
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.domain.transaction.value_objects.amount_range import AmountRange
+from core.domain.transaction.value_objects.data_range import DataRange
+
+
+MAX_FILTER_IDS = 100
+
+
+class TransactionFiltersDTO(BaseModel):
+    currency_ids: list[UUID] | None = Field(
+        default=None, max_length=MAX_FILTER_IDS
+    )
+    operation_ids: list[UUID] | None = Field(
+        default=None, max_length=MAX_FILTER_IDS
+    )
+    category_ids: list[UUID] | None = Field(
+        default=None, max_length=MAX_FILTER_IDS
+    )
+    date_from: datetime.datetime | None = None
+    date_to: datetime.datetime | None = None
+    amount_min: Decimal | None = Field(default=None, ge=0)
+    amount_max: Decimal | None = Field(default=None, ge=0)
+
+    @field_validator("date_from", "date_to", mode="before")
+    @classmethod
+    def _expand_dates(cls, value: Any, info: ValidationInfo) -> Any:
+        # A plain date selects the whole UTC day, so date_to ends with it
+        if not isinstance(value, str):
+            return value
+        try:
+            date = datetime.date.fromisoformat(value)
+        except ValueError:
+            return value
+        start = datetime.datetime.combine(date, datetime.time(), datetime.UTC)
+        if info.field_name == "date_to":
+            return start + datetime.timedelta(days=1, microseconds=-1)
+        return start
+
+    @field_validator("date_from", "date_to")
+    @classmethod
+    def _make_aware(
+        cls, value: datetime.datetime | None
+    ) -> datetime.datetime | None:
+        # Naive values are read as UTC, so bounds can always be compared
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=datetime.UTC)
+        return value
+
+    @model_validator(mode="after")
+    def _validate_ranges(self) -> Self:
+        if (
+            self.date_from is not None
+            and self.date_to is not None
+            and self.date_from > self.date_to
+        ):
+            raise ValueError("date_from must not be later than date_to")
+        if (
+            self.amount_min is not None
+            and self.amount_max is not None
+            and self.amount_min > self.amount_max
+        ):
+            raise ValueError("amount_min must not be greater than amount_max")
+        return self
+
+    def to_filters(self, user_id: UUID) -> TransactionFilters:
+        data_range = None
+        if self.date_from is not None or self.date_to is not None:
+            data_range = DataRange(
+                start_date=self.date_from, end_date=self.date_to
+            )
+        amount_range = None
+        if self.amount_min is not None or self.amount_max is not None:
+            amount_range = AmountRange(
+                min_amount=self.amount_min, max_amount=self.amount_max
+            )
+        return TransactionFilters(
+            user_id=user_id,
+            currency_ids=self.currency_ids or None,
+            operation_ids=self.operation_ids or None,
+            category_ids=self.category_ids or None,
+            data_range=data_range,
+            amount_range=amount_range,
+        )
@@ -0,0 +1,67 @@
+import base64
+import binascii
+import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from core.application.transaction.dto.transaction import TransactionDTO
+from core.application.transaction.exceptions.invalid_cursor import (
+    InvalidCursorException,
+)
+from core.domain.transaction.value_objects.transaction_cursor import (
+    TransactionCursor,
+    TransactionSearchCursor,
+)
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(cursor: TransactionCursor) -> str:
+    raw = f"{cursor.date.isoformat()}|{cursor.transaction_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(value: str) -> TransactionCursor:
+    try:
+        raw = base64.urlsafe_b64decode(value.encode("ascii")).decode("utf-8")
+        date, transaction_id = raw.split("|")
+        return TransactionCursor(
+            date=datetime.datetime.fromisoformat(date),
+            transaction_id=UUID(transaction_id),
+        )
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorException(f"Invalid cursor {value!r}") from e
+
+
+def encode_search_cursor(cursor: TransactionSearchCursor) -> str:
+    # repr round-trips the rank exactly
+    raw = (
+        f"{cursor.rank!r}|{cursor.date.isoformat()}|{cursor.transaction_id}"
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_search_cursor(value: str) -> TransactionSearchCursor:
+    try:
+        raw = base64.urlsafe_b64decode(value.encode("ascii")).decode("utf-8")
+        rank, date, transaction_id = raw.split("|")
+        return TransactionSearchCursor(
+            rank=float(rank),
+            date=datetime.datetime.fromisoformat(date),
+            transaction_id=UUID(transaction_id),
+        )
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorException(f"Invalid cursor {value!r}") from e
+
+
+class TransactionPageRequestDTO(BaseModel):
+    limit: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: str | None = None
+
+
+class TransactionPageDTO(BaseModel):
+    transactions: list[TransactionDTO]
+    next_cursor: str | None
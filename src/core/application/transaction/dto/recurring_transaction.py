@@ -0,0 +1,87 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+
+from core.domain.transaction.entities.recurring_transaction import (
+    RecurringTransactionEntity,
+)
+from core.domain.transaction.enums.operation import OperationType
+from core.domain.transaction.value_objects.recurrence_rule import (
+    RecurrenceRule,
+)
+
+
+class CreateRecurringTransactionDTO(BaseModel):
+    user_id: UUID
+    category_id: UUID
+    currency_id: UUID
+    amount: Decimal = Field(gt=0, le=Decimal("99999999"))
+    description: str | None = Field(
+        default=None, min_length=10, max_length=255
+    )
+    rule: str = Field(
+        min_length=1, max_length=255, examples=["FREQ=MONTHLY;BYMONTHDAY=1"]
+    )
+    start_date: datetime.datetime
+
+    @field_validator("rule")
+    @classmethod
+    def _validate_rule(cls, rule: str) -> str:
+        # Stored in canonical form
+        return str(RecurrenceRule.parse(rule))
+
+    @field_validator("start_date")
+    @classmethod
+    def _validate_start_date(
+        cls, start_date: datetime.datetime
+    ) -> datetime.datetime:
+        if start_date.tzinfo is None:
+            return start_date.replace(tzinfo=datetime.UTC)
+        return start_date
+
+
+class RecurringTransactionDTO(BaseModel):
+    recurring_transaction_id: UUID
+    user_id: UUID
+    category_id: UUID
+    category_name: str
+    operation_type: OperationType
+    currency_id: UUID
+    currency_code: str
+    currency_symbol: str
+    amount: Decimal
+    description: str | None
+    rule: str
+    start_date: datetime.datetime
+    occurrence_count: int
+    next_run_at: datetime.datetime | None
+
+    @staticmethod
+    def from_entity(
+        entity: RecurringTransactionEntity,
+    ) -> "RecurringTransactionDTO":
+        return RecurringTransactionDTO(
+            recurring_transaction_id=entity.recurring_transaction_id,
+            user_id=entity.user_id,
+            category_id=entity.category.category_id,
+            category_name=entity.category.category_name,
+            operation_type=entity.category.operation.operation_type,
+            currency_id=entity.money.currency.currency_id,
+            currency_code=entity.money.currency.currency_code,
+            currency_symbol=entity.money.currency.currency_symbol,
+            amount=entity.money.amount,
+            description=entity.description,
+            rule=str(entity.rule),
+            start_date=entity.start_date,
+            occurrence_count=entity.occurrence_count,
+            next_run_at=entity.next_run_at,
+        )
+
+
+class RecurringTransactionRunDTO(BaseModel):
+    """What one pass of the scheduler did."""
+
+    templates: int
+    created: int
@@ -0,0 +1,46 @@
+import re
+
+from pydantic import BaseModel, Field, field_validator
+
+from core.application.transaction.dto.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+)
+from core.application.transaction.dto.transaction import TransactionDTO
+
+
+MAX_SEARCH_WORDS = 10
+
+SEARCH_WORD_PATTERN = re.compile(r"\w+")
+
+
+def get_search_words(query: str) -> list[str]:
+    """Split a search query into lowercase words, ignoring punctuation."""
+    return SEARCH_WORD_PATTERN.findall(query.lower())
+
+
+class TransactionSearchRequestDTO(BaseModel):
+    q: str = Field(min_length=1, max_length=100)
+    limit: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+    cursor: str | None = None
+
+    @field_validator("q")
+    @classmethod
+    def _validate_q(cls, q: str) -> str:
+        words = get_search_words(q)
+        if not words:
+            raise ValueError("Query must contain at least one word")
+        if len(words) > MAX_SEARCH_WORDS:
+            raise ValueError(
+                f"Query must not contain more than {MAX_SEARCH_WORDS} words"
+            )
+        return " ".join(q.split())
+
+
+class TransactionSearchResultDTO(TransactionDTO):
+    rank: float
+
+
+class TransactionSearchPageDTO(BaseModel):
+    transactions: list[TransactionSearchResultDTO]
+    next_cursor: str | None
@@ -0,0 +1,82 @@
+import datetime
+from decimal import Decimal
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, Field, StringConstraints
+
+from core.application.transaction.dto.transaction import (
+    MAX_TRANSACTION_BATCH_SIZE,
+)
+from core.domain.transaction.enums.statement import StatementFormat
+
+
+class StatementRowDTO(BaseModel):
+    """One transaction read from a bank statement.
+
+    ``row`` is the line number for CSV and the position of the record for
+    other formats. Rows that could not be read have ``error`` set and the
+    fields that failed left ``None``.
+    """
+
+    row: int
+    date: datetime.datetime | None = None
+    amount: Decimal | None = None
+    description: str | None = None
+    label: str | None = None
+    currency_code: str | None = None
+    error: str | None = None
+
+
+class StatementImportRequestDTO(BaseModel):
+    user_id: UUID
+    format: StatementFormat
+    currency_id: UUID
+    income_category_id: UUID | None = None
+    expense_category_id: UUID | None = None
+    chunk_size: int = Field(default=1000, ge=1, le=MAX_TRANSACTION_BATCH_SIZE)
+    encoding: str = "utf-8-sig"
+    # CSV only
+    delimiter: str = Field(default=",", min_length=1, max_length=1)
+    date_column: str = "date"
+    amount_column: str = "amount"
+    description_column: str = "description"
+    category_column: str = "category"
+    currency_column: str = "currency"
+    # Formats without fixed date layout (CSV, QIF), ``strptime`` syntax
+    date_format: str | None = None
+    decimal_separator: str = Field(default=".", pattern=r"^[.,]$")
+
+
+class StatementRowErrorDTO(BaseModel):
+    row: int
+    errors: dict[str, str]
+
+
+class StatementImportProgressDTO(BaseModel):
+    """Running totals of an import, with the errors since the last one."""
+
+    processed: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[StatementRowErrorDTO] = Field(default_factory=list)
+    done: bool = False
+
+
+class CategoryMappingDTO(BaseModel):
+    label: str
+    category_id: UUID
+
+
+class SaveCategoryMappingsDTO(BaseModel):
+    user_id: UUID
+    # ``None`` removes the mapping of a label
+    mappings: dict[
+        Annotated[
+            str,
+            StringConstraints(
+                strip_whitespace=True, min_length=1, max_length=255
+            ),
+        ],
+        UUID | None,
+    ] = Field(max_length=1000)
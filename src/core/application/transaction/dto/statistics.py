@@ -0,0 +1,63 @@
+import datetime
+from decimal import Decimal
+from typing import Self
+from uuid import UUID
+
+from pydantic import BaseModel, Field, model_validator
+
+from core.domain.transaction.enums.operation import OperationType
+from core.domain.transaction.enums.statistics import (
+    StatisticsGroup,
+    StatisticsPeriod,
+)
+
+
+class TransactionStatisticsRequestDTO(BaseModel):
+    period: StatisticsPeriod = StatisticsPeriod.MONTH
+    group_by: list[StatisticsGroup] = Field(
+        default_factory=lambda: [StatisticsGroup.OPERATION_TYPE],
+        max_length=len(StatisticsGroup),
+    )
+    # Currency to convert every total to, at the rate of each day
+    convert_to: UUID | None = None
+
+    @model_validator(mode="after")
+    def _validate_conversion(self) -> Self:
+        if (
+            self.convert_to is not None
+            and StatisticsGroup.CURRENCY in self.group_by
+        ):
+            raise ValueError(
+                "Totals converted to one currency cannot be grouped by "
+                "currency"
+            )
+        return self
+
+
+class TransactionStatisticsRowDTO(BaseModel):
+    """Totals of one period and group.
+
+    Amounts in different currencies are never summed together, so the
+    currency is always part of the group, unless the totals were converted
+    to one currency. Fields of dimensions that were not requested are
+    ``None``.
+    """
+
+    period_start: datetime.datetime
+    currency_id: UUID
+    currency_code: str
+    currency_symbol: str
+    operation_type: OperationType | None = None
+    operation_id: UUID | None = None
+    operation_name: str | None = None
+    category_id: UUID | None = None
+    category_name: str | None = None
+    total: Decimal
+    count: int
+
+
+class TransactionStatisticsDTO(BaseModel):
+    period: StatisticsPeriod
+    group_by: list[StatisticsGroup]
+    convert_to: UUID | None = None
+    rows: list[TransactionStatisticsRowDTO]
@@ -51,3 +51,12 @@ class TransactionDTO(BaseModel):
             description=entity.description,
             date=entity.date,
         )
+
+
+MAX_TRANSACTION_BATCH_SIZE = 10_000
+EXPORT_CHUNK_SIZE = 1000
+
+
+class TransactionBatchResultDTO(BaseModel):
+    created: int
+    transaction_ids: list[UUID]
@@ -0,0 +1,8 @@
+class InvalidTransactionBatchException(Exception):
+    def __init__(
+        self,
+        errors: dict[int, dict[str, str]],
+        message: str = "Invalid transaction batch",
+    ):
+        super().__init__(message)
+        self.errors = errors
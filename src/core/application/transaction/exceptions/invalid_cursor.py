@@ -0,0 +1,3 @@
+class InvalidCursorException(Exception):
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message)
@@ -0,0 +1,3 @@
+class InvalidExchangeRatesException(Exception):
+    def __init__(self, message: str = "Invalid exchange rates file"):
+        super().__init__(message)
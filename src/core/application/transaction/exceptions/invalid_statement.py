@@ -0,0 +1,3 @@
+class InvalidStatementException(Exception):
+    def __init__(self, message: str = "Invalid statement file"):
+        super().__init__(message)
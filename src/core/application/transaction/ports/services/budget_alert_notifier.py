@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from core.application.transaction.dto.budget import BudgetAlertDTO
+
+
+class IBudgetAlertNotifier(ABC):
+    """Tell users their budgets reached a threshold."""
+
+    @abstractmethod
+    async def notify(self, alerts: list[BudgetAlertDTO]) -> None:
+        """Deliver ``alerts``.
+
+        Raising leaves all of them queued for the next attempt, so
+        delivery is at least once.
+        """
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import IO, Iterator
+
+from core.application.transaction.dto.exchange_rate import (
+    ExchangeRateRowDTO,
+)
+
+
+class IExchangeRateParser(ABC):
+    """Read dated exchange rates from a file one row at a time."""
+
+    @abstractmethod
+    def parse(self, stream: IO[bytes]) -> Iterator[ExchangeRateRowDTO]:
+        """Yield the rates of ``stream`` without reading it all at once.
+
+        :raise InvalidExchangeRatesException: If the file or one of its
+            rows cannot be read.
+        """
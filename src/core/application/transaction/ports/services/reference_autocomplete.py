@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from core.application.transaction.dto.autocomplete import (
+    AutocompleteItemDTO,
+    AutocompleteRequestDTO,
+)
+
+
+class IReferenceAutocompleteService(ABC):
+    """Suggest reference data whose labels start with what was typed.
+
+    A query matches a label when it is a prefix of the label or of one of
+    its words. Suggestions are ordered by the word they matched, then by
+    label.
+    """
+
+    @abstractmethod
+    async def get_operations(
+        self, request: AutocompleteRequestDTO
+    ) -> list[AutocompleteItemDTO]: ...
+
+    @abstractmethod
+    async def get_categories(
+        self, request: AutocompleteRequestDTO, operation_id: UUID | None
+    ) -> list[AutocompleteItemDTO]: ...
+
+    @abstractmethod
+    async def get_currencies(
+        self, request: AutocompleteRequestDTO
+    ) -> list[AutocompleteItemDTO]:
+        """Currencies are also matched by name, e.g. ``dol`` for USD."""
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import IO, Iterator
+
+from core.application.transaction.dto.statement_import import (
+    StatementRowDTO,
+)
+
+
+class IStatementParser(ABC):
+    """Read transactions from a bank statement one row at a time."""
+
+    @abstractmethod
+    def parse(self, stream: IO[bytes]) -> Iterator[StatementRowDTO]:
+        """Yield the rows of ``stream`` without reading it all at once.
+
+        :raise InvalidStatementException: If the file cannot be read at
+            all, e.g. required CSV columns are missing.
+        """
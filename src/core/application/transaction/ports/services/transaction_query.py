@@ -0,0 +1,79 @@
+from abc import ABC, abstractmethod
+from typing import AsyncGenerator
+from uuid import UUID
+
+from core.application.transaction.dto.search import (
+    TransactionSearchResultDTO,
+)
+from core.application.transaction.dto.statistics import (
+    TransactionStatisticsRowDTO,
+)
+from core.application.transaction.dto.transaction import TransactionDTO
+from core.domain.transaction.enums.statistics import (
+    StatisticsGroup,
+    StatisticsPeriod,
+)
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.domain.transaction.value_objects.transaction_cursor import (
+    TransactionCursor,
+    TransactionSearchCursor,
+)
+
+
+class ITransactionQueryService(ABC):
+    """Read side of transactions, returning flat DTOs without entities."""
+
+    @abstractmethod
+    async def get_by_filters(
+        self, filters: TransactionFilters
+    ) -> list[TransactionDTO]: ...
+
+    @abstractmethod
+    async def get_page_by_filters(
+        self,
+        filters: TransactionFilters,
+        limit: int,
+        after: TransactionCursor | None = None,
+    ) -> list[TransactionDTO]: ...
+
+    @abstractmethod
+    async def search(
+        self,
+        filters: TransactionFilters,
+        query: str,
+        limit: int,
+        after: TransactionSearchCursor | None = None,
+    ) -> list[TransactionSearchResultDTO]:
+        """Find transactions whose description matches ``query``.
+
+        Descriptions match when each word of the query starts one of
+        their words, or when they are close to the query despite typos.
+        Best matches come first, then the newest.
+        """
+
+    @abstractmethod
+    def stream_by_filters(
+        self, filters: TransactionFilters, chunk_size: int
+    ) -> AsyncGenerator[list[TransactionDTO], None]:
+        """Yield the transactions newest first, ``chunk_size`` at a time.
+
+        Rows are fetched through a server-side cursor, so only one chunk
+        is in memory at a time.
+        """
+
+    @abstractmethod
+    async def get_statistics(
+        self,
+        filters: TransactionFilters,
+        period: StatisticsPeriod,
+        group_by: list[StatisticsGroup],
+        convert_to: UUID | None = None,
+    ) -> list[TransactionStatisticsRowDTO]:
+        """Sum the transactions per period and group in the database.
+
+        With ``convert_to``, each transaction is converted to that
+        currency at the rates of its day before summing.
+
+        :raise ExchangeRateNotFoundException: If a transaction could not
+            be converted for lack of a rate.
+        """
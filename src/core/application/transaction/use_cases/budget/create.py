@@ -0,0 +1,61 @@
+from uuid import uuid4
+
+from core.application.transaction.dto.budget import BudgetDTO, CreateBudgetDTO
+from core.domain.transaction.entities.budget import BudgetEntity
+from core.domain.transaction.repositories.budget import IBudgetRepository
+from core.domain.transaction.repositories.category import ICategoryRepository
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+from core.domain.transaction.repositories.operation import (
+    IOperationRepository,
+)
+from core.domain.transaction.value_objects.money import Money
+
+
+class CreateBudgetUseCase:
+    def __init__(
+        self,
+        budget_repository: IBudgetRepository,
+        category_repository: ICategoryRepository,
+        operation_repository: IOperationRepository,
+        currency_repository: ICurrencyRepository,
+    ):
+        self._budget_repository = budget_repository
+        self._category_repository = category_repository
+        self._operation_repository = operation_repository
+        self._currency_repository = currency_repository
+
+    async def execute(self, request: CreateBudgetDTO) -> BudgetDTO:
+        """Create a budget.
+
+        The spend of its current period so far is counted right away.
+
+        :arg request: The budget to create.
+        :raise CategoryNotFoundException: If the category does not exist.
+        :raise OperationNotFoundException: If the operation does not
+            exist.
+        :raise CurrencyNotFoundException: If the currency does not exist.
+        :return: The created budget.
+        """
+        if request.category_id is not None:
+            await self._category_repository.get_by_id(
+                category_id=request.category_id
+            )
+        if request.operation_id is not None:
+            await self._operation_repository.get_by_id(
+                operation_id=request.operation_id
+            )
+        currency = await self._currency_repository.get_by_id(
+            currency_id=request.currency_id
+        )
+
+        entity = BudgetEntity(
+            budget_id=uuid4(),
+            user_id=request.user_id,
+            category_id=request.category_id,
+            operation_id=request.operation_id,
+            period=request.period,
+            limit=Money(amount=request.limit, currency=currency),
+            thresholds=request.thresholds,
+        )
+        entity = await self._budget_repository.save(entity)
+        return BudgetDTO.from_entity(entity)
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from core.domain.transaction.repositories.budget import IBudgetRepository
+from core.shared.exceptions import ForbiddenException
+
+
+class DeleteBudgetUseCase:
+    def __init__(self, budget_repository: IBudgetRepository):
+        self._budget_repository = budget_repository
+
+    async def execute(self, user_id: UUID, budget_id: UUID) -> None:
+        """Delete a budget with its spend and pending alerts.
+
+        :arg user_id: The user id that is trying to delete it.
+        :arg budget_id: The budget id.
+        :raise ForbiddenException: If it belongs to another user.
+        :raise BudgetNotFoundException: If it does not exist.
+        """
+        budget = await self._budget_repository.get_by_id(budget_id)
+        if budget.user_id != user_id:
+            raise ForbiddenException(
+                "You are not allowed to delete this budget"
+            )
+        await self._budget_repository.delete(budget_id)
@@ -0,0 +1,46 @@
+from core.application.transaction.dto.budget import (
+    BudgetAlertDTO,
+    BudgetAlertRunDTO,
+)
+from core.application.transaction.ports.services.budget_alert_notifier import (  # noqa: E501
+    IBudgetAlertNotifier,
+)
+from core.domain.transaction.repositories.budget_alert import (
+    IBudgetAlertRepository,
+)
+
+
+class DeliverBudgetAlertsUseCase:
+    def __init__(
+        self,
+        budget_alert_repository: IBudgetAlertRepository,
+        notifier: IBudgetAlertNotifier,
+    ):
+        self._budget_alert_repository = budget_alert_repository
+        self._notifier = notifier
+
+    async def execute(self, batch_size: int) -> BudgetAlertRunDTO:
+        """Deliver one batch of queued budget alerts.
+
+        The alerts stay locked until they are marked delivered, so
+        concurrent workers never deliver the same alert twice; if the
+        notifier fails, the batch is delivered again later.
+
+        :arg batch_size: The maximum number of alerts delivered.
+        :raise ValueError: If ``batch_size`` is less than 1.
+        :return: The number of alerts delivered.
+        """
+        # Nothing would ever be delivered, so the caller would loop forever
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        alerts = await self._budget_alert_repository.lock_undelivered(
+            batch_size
+        )
+        if alerts:
+            await self._notifier.notify(
+                [BudgetAlertDTO.from_entity(alert) for alert in alerts]
+            )
+        await self._budget_alert_repository.mark_delivered(
+            [alert.alert_id for alert in alerts]
+        )
+        return BudgetAlertRunDTO(delivered=len(alerts))
@@ -0,0 +1,18 @@
+from uuid import UUID
+
+from core.application.transaction.dto.budget import BudgetDTO
+from core.domain.transaction.repositories.budget import IBudgetRepository
+
+
+class GetAllBudgetsByUserUseCase:
+    def __init__(self, budget_repository: IBudgetRepository):
+        self._budget_repository = budget_repository
+
+    async def execute(self, user_id: UUID) -> list[BudgetDTO]:
+        """Get the budgets of a user.
+
+        :arg user_id: The user id.
+        :return: The budgets, oldest first.
+        """
+        budgets = await self._budget_repository.get_by_user(user_id)
+        return [BudgetDTO.from_entity(budget) for budget in budgets]
@@ -0,0 +1,47 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from core.application.transaction.dto.budget import BudgetStatusDTO
+from core.domain.transaction.repositories.budget import IBudgetRepository
+from core.shared.exceptions import ForbiddenException
+
+
+class GetBudgetStatusUseCase:
+    def __init__(self, budget_repository: IBudgetRepository):
+        self._budget_repository = budget_repository
+
+    async def execute(
+        self,
+        user_id: UUID,
+        budget_id: UUID,
+        now: datetime.datetime | None = None,
+    ) -> BudgetStatusDTO:
+        """Get the spend of a budget in its current period.
+
+        Read from the running spend, so it costs two primary key lookups
+        however many transactions the period holds.
+
+        :arg user_id: The user id that is asking.
+        :arg budget_id: The budget id.
+        :arg now: The date whose period is reported, now by default.
+        :raise ForbiddenException: If the budget belongs to another user.
+        :raise BudgetNotFoundException: If the budget does not exist.
+        :return: The budget and its current spend.
+        """
+        budget = await self._budget_repository.get_by_id(budget_id)
+        if budget.user_id != user_id:
+            raise ForbiddenException(
+                "You are not allowed to view this budget"
+            )
+        period_start = budget.get_period_start(
+            now or datetime.datetime.now(datetime.UTC)
+        )
+        spent = await self._budget_repository.get_spent(
+            [(budget_id, period_start)]
+        )
+        return BudgetStatusDTO.from_entity(
+            budget,
+            period_start,
+            spent.get((budget_id, period_start), Decimal(0)),
+        )
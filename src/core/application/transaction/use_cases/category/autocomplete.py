@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from core.application.transaction.dto.autocomplete import (
+    AutocompleteItemDTO,
+    AutocompleteRequestDTO,
+)
+from core.application.transaction.ports.services.reference_autocomplete import (  # noqa: E501
+    IReferenceAutocompleteService,
+)
+
+
+class AutocompleteCategoriesUseCase:
+    def __init__(self, autocomplete_service: IReferenceAutocompleteService):
+        self._autocomplete_service = autocomplete_service
+
+    async def execute(
+        self,
+        request: AutocompleteRequestDTO,
+        operation_id: UUID | None = None,
+    ) -> list[AutocompleteItemDTO]:
+        """Suggest categories for what the user has typed.
+
+        :arg request: The typed text, the number of suggestions and how
+            to match.
+        :arg operation_id: Only suggest categories of this operation.
+        :return: The suggestions.
+        """
+        return await self._autocomplete_service.get_categories(
+            request, operation_id
+        )
@@ -0,0 +1,31 @@
+from uuid import UUID
+
+from core.application.transaction.dto.statement_import import (
+    CategoryMappingDTO,
+)
+from core.domain.transaction.repositories.category_mapping import (
+    ICategoryMappingRepository,
+)
+
+
+class GetCategoryMappingsUseCase:
+    def __init__(
+        self, category_mapping_repository: ICategoryMappingRepository
+    ):
+        self._category_mapping_repository = category_mapping_repository
+
+    async def execute(self, user_id: UUID) -> list[CategoryMappingDTO]:
+        """Get the statement label to category mappings of a user.
+
+        :arg user_id: The user id.
+        :return: The mappings.
+        """
+        entities = await self._category_mapping_repository.get_by_user(
+            user_id
+        )
+        return [
+            CategoryMappingDTO(
+                label=entity.label, category_id=entity.category_id
+            )
+            for entity in entities
+        ]
@@ -0,0 +1,81 @@
+from core.application.transaction.dto.statement_import import (
+    CategoryMappingDTO,
+    SaveCategoryMappingsDTO,
+)
+from core.domain.transaction.entities.category_mapping import (
+    CategoryMappingEntity,
+)
+from core.domain.transaction.exceptions.category.not_found import (
+    CategoryNotFoundException,
+)
+from core.domain.transaction.repositories.category import ICategoryRepository
+from core.domain.transaction.repositories.category_mapping import (
+    ICategoryMappingRepository,
+)
+
+
+class SaveCategoryMappingsUseCase:
+    def __init__(
+        self,
+        category_mapping_repository: ICategoryMappingRepository,
+        category_repository: ICategoryRepository,
+    ):
+        self._category_mapping_repository = category_mapping_repository
+        self._category_repository = category_repository
+
+    async def execute(
+        self, request: SaveCategoryMappingsDTO
+    ) -> list[CategoryMappingDTO]:
+        """Add, change or remove statement label to category mappings.
+
+        Labels not in the request are left as they are.
+
+        :arg request: Categories by label, ``None`` to remove a label.
+        :raise CategoryNotFoundException: If a category does not exist.
+        :return: All mappings of the user.
+        """
+        category_ids = {
+            category_id
+            for category_id in request.mappings.values()
+            if category_id is not None
+        }
+        found = {
+            category.category_id
+            for category in await self._category_repository.get_by_ids(
+                list(category_ids)
+            )
+        }
+        missing = category_ids - found
+        if missing:
+            raise CategoryNotFoundException(
+                f"Category with id {str(missing.pop())!r} not found"
+            )
+
+        await self._category_mapping_repository.delete_by_labels(
+            request.user_id,
+            [
+                label
+                for label, category_id in request.mappings.items()
+                if category_id is None
+            ],
+        )
+        await self._category_mapping_repository.save_many(
+            [
+                CategoryMappingEntity(
+                    user_id=request.user_id,
+                    label=label,
+                    category_id=category_id,
+                )
+                for label, category_id in request.mappings.items()
+                if category_id is not None
+            ]
+        )
+        entities = await self._category_mapping_repository.get_by_user(
+            request.user_id
+        )
+        return [
+            CategoryMappingDTO(
+                label=entity.label, category_id=entity.category_id
+            )
+            for entity in entities
+        ]
@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+from core.application.transaction.dto.exchange_rate import (
+    ConvertedAmountDTO,
+    ConvertedMoneyDTO,
+    ConvertMoneyRequestDTO,
+)
+from core.domain.transaction.exceptions.currency.not_found import (
+    CurrencyNotFoundException,
+)
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+from core.domain.transaction.repositories.exchange_rate import (
+    IExchangeRateRepository,
+)
+from core.domain.transaction.value_objects.money import Money
+
+
+CENT = Decimal("0.01")
+
+
+class ConvertMoneyUseCase:
+    def __init__(
+        self,
+        exchange_rate_repository: IExchangeRateRepository,
+        currency_repository: ICurrencyRepository,
+    ):
+        self._exchange_rate_repository = exchange_rate_repository
+        self._currency_repository = currency_repository
+
+    async def execute(
+        self, request: ConvertMoneyRequestDTO
+    ) -> ConvertedMoneyDTO:
+        """Convert amounts in any currencies to one currency.
+
+        The rates of every currency involved are loaded once for the
+        whole date range; each amount is then looked up in memory.
+
+        :arg request: The target currency and the dated amounts.
+        :raise CurrencyNotFoundException: If a currency does not exist.
+        :raise ExchangeRateNotFoundException: If a currency has no rate
+            on or before the date of an amount.
+        :return: The converted amounts, rounded to cents, and their total.
+        """
+        currency = await self._currency_repository.get_by_id(
+            request.currency_id
+        )
+        source_ids = list({amount.currency_id for amount in request.amounts})
+        currencies = {
+            entity.currency_id: entity
+            for entity in await self._currency_repository.get_by_ids(
+                source_ids
+            )
+        }
+        missing = set(source_ids) - currencies.keys()
+        if missing:
+            raise CurrencyNotFoundException(
+                f"Currency with id {missing.pop()!r} not found"
+            )
+
+        dates = [amount.date for amount in request.amounts]
+        table = await self._exchange_rate_repository.get_table(
+            list(currencies.keys() | {currency.currency_id}),
+            min(dates),
+            max(dates),
+        )
+        total = Money(currency, Decimal(0))
+        converted = []
+        for amount in request.amounts:
+            money = table.convert(
+                Money(currencies[amount.currency_id], amount.amount),
+                currency,
+                amount.date,
+            )
+            money = Money(currency, money.amount.quantize(CENT))
+            total += money
+            converted.append(
+                ConvertedAmountDTO(
+                    **amount.model_dump(), converted_amount=money.amount
+                )
+            )
+        return ConvertedMoneyDTO(
+            currency_id=currency.currency_id,
+            currency_code=currency.currency_code,
+            currency_symbol=currency.currency_symbol,
+            amounts=converted,
+            total=total.amount,
+        )
@@ -0,0 +1,86 @@
+import itertools
+from decimal import Decimal
+from typing import Iterable
+
+from core.application.transaction.dto.exchange_rate import (
+    ExchangeRateLoadResultDTO,
+    ExchangeRateRowDTO,
+)
+from core.domain.transaction.entities.exchange_rate import ExchangeRateEntity
+from core.domain.transaction.exceptions.currency.not_found import (
+    CurrencyNotFoundException,
+)
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+from core.domain.transaction.repositories.exchange_rate import (
+    IExchangeRateRepository,
+)
+
+
+class LoadExchangeRatesUseCase:
+    def __init__(
+        self,
+        exchange_rate_repository: IExchangeRateRepository,
+        currency_repository: ICurrencyRepository,
+    ):
+        self._exchange_rate_repository = exchange_rate_repository
+        self._currency_repository = currency_repository
+
+    async def execute(
+        self,
+        rows: Iterable[ExchangeRateRowDTO],
+        base_currency_code: str,
+        chunk_size: int = 5000,
+    ) -> ExchangeRateLoadResultDTO:
+        """Bulk load exchange rates quoted against one currency.
+
+        The base currency gets a rate of 1 on every date of the file.
+        Rows are written ``chunk_size`` at a time; rows of currencies that
+        are not in the currency table are skipped and reported.
+
+        :arg rows: The rates, in units of currency per unit of the base.
+        :arg base_currency_code: The currency the rates are quoted against.
+        :arg chunk_size: The number of rates written per statement.
+        :raise CurrencyNotFoundException: If the base currency is unknown.
+        :return: The number of rates written and the unknown currencies.
+        """
+        currencies = {
+            currency.currency_code: currency
+            for currency in await self._currency_repository.get_all()
+        }
+        base_currency = currencies.get(base_currency_code)
+        if base_currency is None:
+            raise CurrencyNotFoundException(
+                f"Currency with code {base_currency_code!r} not found"
+            )
+
+        loaded = 0
+        unknown_currency_codes: set[str] = set()
+        rows_iterator = iter(rows)
+        while chunk := list(itertools.islice(rows_iterator, chunk_size)):
+            rates = []
+            for row in chunk:
+                currency = currencies.get(row.currency_code)
+                if currency is None:
+                    unknown_currency_codes.add(row.currency_code)
+                elif currency is not base_currency:
+                    rates.append(
+                        ExchangeRateEntity(
+                            currency_id=currency.currency_id,
+                            valid_from=row.date,
+                            rate=row.rate,
+                        )
+                    )
+            rates.extend(
+                ExchangeRateEntity(
+                    currency_id=base_currency.currency_id,
+                    valid_from=date,
+                    rate=Decimal(1),
+                )
+                for date in {row.date for row in chunk}
+            )
+            loaded += await self._exchange_rate_repository.save_many(rates)
+
+        return ExchangeRateLoadResultDTO(
+            loaded=loaded,
+            unknown_currency_codes=sorted(unknown_currency_codes),
+        )
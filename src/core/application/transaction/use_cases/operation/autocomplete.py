@@ -0,0 +1,23 @@
+from core.application.transaction.dto.autocomplete import (
+    AutocompleteItemDTO,
+    AutocompleteRequestDTO,
+)
+from core.application.transaction.ports.services.reference_autocomplete import (  # noqa: E501
+    IReferenceAutocompleteService,
+)
+
+
+class AutocompleteOperationsUseCase:
+    def __init__(self, autocomplete_service: IReferenceAutocompleteService):
+        self._autocomplete_service = autocomplete_service
+
+    async def execute(
+        self, request: AutocompleteRequestDTO
+    ) -> list[AutocompleteItemDTO]:
+        """Suggest operations for what the user has typed.
+
+        :arg request: The typed text, the number of suggestions and how
+            to match.
+        :return: The suggestions.
+        """
+        return await self._autocomplete_service.get_operations(request)
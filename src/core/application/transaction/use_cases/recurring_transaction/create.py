@@ -0,0 +1,63 @@
+from uuid import uuid4
+
+from core.application.transaction.dto.recurring_transaction import (
+    CreateRecurringTransactionDTO,
+    RecurringTransactionDTO,
+)
+from core.domain.transaction.entities.recurring_transaction import (
+    RecurringTransactionEntity,
+)
+from core.domain.transaction.repositories.category import ICategoryRepository
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+from core.domain.transaction.repositories.recurring_transaction import (
+    IRecurringTransactionRepository,
+)
+from core.domain.transaction.value_objects.money import Money
+from core.domain.transaction.value_objects.recurrence_rule import (
+    RecurrenceRule,
+)
+
+
+class CreateRecurringTransactionUseCase:
+    def __init__(
+        self,
+        recurring_transaction_repository: IRecurringTransactionRepository,
+        category_repository: ICategoryRepository,
+        currency_repository: ICurrencyRepository,
+    ):
+        self._recurring_transaction_repository = (
+            recurring_transaction_repository
+        )
+        self._category_repository = category_repository
+        self._currency_repository = currency_repository
+
+    async def execute(
+        self, request: CreateRecurringTransactionDTO
+    ) -> RecurringTransactionDTO:
+        """Create a recurring transaction.
+
+        Occurrences already due are created by the next scheduler run.
+
+        :arg request: The template and its schedule.
+        :raise CategoryNotFoundException: If the category does not exist.
+        :raise CurrencyNotFoundException: If the currency does not exist.
+        :return: The created recurring transaction.
+        """
+        category = await self._category_repository.get_by_id(
+            category_id=request.category_id
+        )
+        currency = await self._currency_repository.get_by_id(
+            currency_id=request.currency_id
+        )
+
+        entity = RecurringTransactionEntity(
+            recurring_transaction_id=uuid4(),
+            user_id=request.user_id,
+            category=category,
+            money=Money(amount=request.amount, currency=currency),
+            description=request.description,
+            rule=RecurrenceRule.parse(request.rule),
+            start_date=request.start_date,
+        )
+        entity = await self._recurring_transaction_repository.save(entity)
+        return RecurringTransactionDTO.from_entity(entity)
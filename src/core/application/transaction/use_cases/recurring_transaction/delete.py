@@ -0,0 +1,42 @@
+from uuid import UUID
+
+from core.domain.transaction.repositories.recurring_transaction import (
+    IRecurringTransactionRepository,
+)
+from core.shared.exceptions import ForbiddenException
+
+
+class DeleteRecurringTransactionUseCase:
+    def __init__(
+        self,
+        recurring_transaction_repository: IRecurringTransactionRepository,
+    ):
+        self._recurring_transaction_repository = (
+            recurring_transaction_repository
+        )
+
+    async def execute(
+        self, user_id: UUID, recurring_transaction_id: UUID
+    ) -> None:
+        """Stop a recurring transaction.
+
+        Transactions it already created are kept.
+
+        :arg user_id: The user id that is trying to delete it.
+        :arg recurring_transaction_id: The recurring transaction id.
+        :raise ForbiddenException: If it belongs to another user.
+        :raise RecurringTransactionNotFoundException: If it does not
+            exist.
+        """
+        recurring_transaction = (
+            await self._recurring_transaction_repository.get_by_id(
+                recurring_transaction_id
+            )
+        )
+        if recurring_transaction.user_id != user_id:
+            raise ForbiddenException(
+                "You are not allowed to delete this recurring transaction"
+            )
+        await self._recurring_transaction_repository.delete(
+            recurring_transaction_id
+        )
@@ -0,0 +1,31 @@
+from uuid import UUID
+
+from core.application.transaction.dto.recurring_transaction import (
+    RecurringTransactionDTO,
+)
+from core.domain.transaction.repositories.recurring_transaction import (
+    IRecurringTransactionRepository,
+)
+
+
+class GetRecurringTransactionsByUserUseCase:
+    def __init__(
+        self,
+        recurring_transaction_repository: IRecurringTransactionRepository,
+    ):
+        self._recurring_transaction_repository = (
+            recurring_transaction_repository
+        )
+
+    async def execute(self, user_id: UUID) -> list[RecurringTransactionDTO]:
+        """Get the recurring transactions of a user.
+
+        :arg user_id: The user id.
+        :return: The recurring transactions, oldest first.
+        """
+        entities = await self._recurring_transaction_repository.get_by_user(
+            user_id
+        )
+        return [
+            RecurringTransactionDTO.from_entity(entity) for entity in entities
+        ]
@@ -0,0 +1,67 @@
+import datetime
+
+from core.application.transaction.dto.recurring_transaction import (
+    RecurringTransactionRunDTO,
+)
+from core.domain.transaction.repositories.recurring_transaction import (
+    IRecurringTransactionRepository,
+)
+from core.domain.transaction.repositories.transaction import (
+    ITransactionRepository,
+)
+
+
+class MaterializeRecurringTransactionsUseCase:
+    def __init__(
+        self,
+        recurring_transaction_repository: IRecurringTransactionRepository,
+        transaction_repository: ITransactionRepository,
+    ):
+        self._recurring_transaction_repository = (
+            recurring_transaction_repository
+        )
+        self._transaction_repository = transaction_repository
+
+    async def execute(
+        self,
+        now: datetime.datetime,
+        batch_size: int,
+        max_occurrences: int,
+    ) -> RecurringTransactionRunDTO:
+        """Create the transactions of one batch of due templates.
+
+        The templates are locked, their occurrences inserted in one batch
+        and their schedules advanced in a single database transaction, so
+        concurrent workers never create the same occurrence twice.
+
+        :arg now: Occurrences up to this date are due.
+        :arg batch_size: The maximum number of templates handled.
+        :arg max_occurrences: The maximum number of occurrences created
+            per template; a template far behind catches up over several
+            batches.
+        :raise ValueError: If ``batch_size`` or ``max_occurrences`` is
+            less than 1.
+        :return: The number of templates handled and transactions created.
+        """
+        # Nothing would ever be handled, so the caller would loop forever
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if max_occurrences < 1:
+            raise ValueError("Max occurrences must be at least 1")
+        templates = await self._recurring_transaction_repository.lock_due(
+            now, batch_size
+        )
+        transactions = [
+            transaction
+            for template in templates
+            for transaction in template.materialize(now, max_occurrences)
+        ]
+        await self._recurring_transaction_repository.update_schedules(
+            templates
+        )
+        # Commits the schedules along with the transactions; a due
+        # template always yields at least one
+        await self._transaction_repository.save_many(transactions)
+        return RecurringTransactionRunDTO(
+            templates=len(templates), created=len(transactions)
+        )
@@ -0,0 +1,86 @@
+from uuid import uuid4
+
+from core.application.transaction.dto.transaction import (
+    CreateTransactionDTO,
+    TransactionBatchResultDTO,
+)
+from core.application.transaction.exceptions.invalid_batch import (
+    InvalidTransactionBatchException,
+)
+from core.domain.transaction.entities.transaction import TransactionEntity
+from core.domain.transaction.repositories.category import ICategoryRepository
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+from core.domain.transaction.repositories.transaction import (
+    ITransactionRepository,
+)
+from core.domain.transaction.value_objects.money import Money
+
+
+class CreateTransactionsBatchUseCase:
+    def __init__(
+        self,
+        transaction_repository: ITransactionRepository,
+        category_repository: ICategoryRepository,
+        currency_repository: ICurrencyRepository,
+    ):
+        self._transaction_repository = transaction_repository
+        self._category_repository = category_repository
+        self._currency_repository = currency_repository
+
+    async def execute(
+        self, requests: list[CreateTransactionDTO]
+    ) -> TransactionBatchResultDTO:
+        """Create many transactions at once.
+
+        Either every transaction is created or none is.
+
+        :arg requests: The transactions data.
+        :raise InvalidTransactionBatchException: If any transaction refers
+            to a category or currency that does not exist.
+        :return: The number and ids of the created transactions.
+        """
+        categories = {
+            category.category_id: category
+            for category in await self._category_repository.get_by_ids(
+                list({request.category_id for request in requests})
+            )
+        }
+        currencies = {
+            currency.currency_id: currency
+            for currency in await self._currency_repository.get_by_ids(
+                list({request.currency_id for request in requests})
+            )
+        }
+
+        errors: dict[int, dict[str, str]] = {}
+        for index, request in enumerate(requests):
+            if request.category_id not in categories:
+                errors.setdefault(index, {})[
+                    "category_id"
+                ] = "Category not found"
+            if request.currency_id not in currencies:
+                errors.setdefault(index, {})[
+                    "currency_id"
+                ] = "Currency not found"
+        if errors:
+            raise InvalidTransactionBatchException(errors)
+
+        entities = [
+            TransactionEntity(
+                transaction_id=uuid4(),
+                user_id=request.user_id,
+                category=categories[request.category_id],
+                money=Money(
+                    amount=request.amount,
+                    currency=currencies[request.currency_id],
+                ),
+                date=request.date,
+                description=request.description,
+            )
+            for request in requests
+        ]
+        entities = await self._transaction_repository.save_many(entities)
+        return TransactionBatchResultDTO(
+            created=len(entities),
+            transaction_ids=[entity.transaction_id for entity in entities],
+        )
@@ -0,0 +1,45 @@
+from contextlib import aclosing
+from typing import AsyncGenerator
+from uuid import UUID
+
+from core.application.transaction.dto.filters import TransactionFiltersDTO
+from core.application.transaction.dto.transaction import (
+    EXPORT_CHUNK_SIZE,
+    TransactionDTO,
+)
+from core.application.transaction.ports.services.transaction_query import (
+    ITransactionQueryService,
+)
+from core.domain.transaction.filters.transaction import TransactionFilters
+
+
+class ExportTransactionsByUserUseCase:
+    def __init__(self, transaction_query_service: ITransactionQueryService):
+        self._transaction_query_service = transaction_query_service
+
+    async def execute(
+        self,
+        user_id: UUID,
+        filters_dto: TransactionFiltersDTO | None = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> AsyncGenerator[list[TransactionDTO], None]:
+        """Stream all transactions of a user, newest first, in chunks.
+
+        :arg user_id: The user id.
+        :arg filters_dto: Optional filters narrowing the transactions.
+        :arg chunk_size: The number of transactions per chunk.
+        :return: Chunks of transactions.
+        """
+        filters = (
+            filters_dto.to_filters(user_id)
+            if filters_dto is not None
+            else TransactionFilters(user_id=user_id)
+        )
+        # Closes the database cursor as soon as the caller stops reading
+        async with aclosing(
+            self._transaction_query_service.stream_by_filters(
+                filters, chunk_size
+            )
+        ) as chunks:
+            async for chunk in chunks:
+                yield chunk
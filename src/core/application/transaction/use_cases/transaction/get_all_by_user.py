@@ -1,27 +1,29 @@
 from uuid import UUID
 
+from core.application.transaction.dto.filters import TransactionFiltersDTO
 from core.application.transaction.dto.transaction import TransactionDTO
-from core.domain.transaction.filters.transaction import TransactionFilters
-from core.domain.transaction.repositories.transaction import (
-    ITransactionRepository,
+from core.application.transaction.ports.services.transaction_query import (
+    ITransactionQueryService,
 )
+from core.domain.transaction.filters.transaction import TransactionFilters
 
 
 class GetAllTransactionsByUserUseCase:
-    def __init__(self, transaction_repository: ITransactionRepository):
-        self._transaction_repository = transaction_repository
+    def __init__(self, transaction_query_service: ITransactionQueryService):
+        self._transaction_query_service = transaction_query_service
 
-    async def execute(self, user_id: UUID) -> list[TransactionDTO]:
+    async def execute(
+        self, user_id: UUID, filters_dto: TransactionFiltersDTO | None = None
+    ) -> list[TransactionDTO]:
         """Get all transactions by user id.
 
         :arg user_id: The user id.
+        :arg filters_dto: Optional filters narrowing the transactions.
         :return: The transactions.
         """
-        filters = TransactionFilters(user_id=user_id)
-        transactions = await self._transaction_repository.get_by_filters(
-            filters
+        filters = (
+            filters_dto.to_filters(user_id)
+            if filters_dto is not None
+            else TransactionFilters(user_id=user_id)
         )
-        return [
-            TransactionDTO.from_entity(transaction)
-            for transaction in transactions
-        ]
+        return await self._transaction_query_service.get_by_filters(filters)
@@ -0,0 +1,63 @@
+from uuid import UUID
+
+from core.application.transaction.dto.filters import TransactionFiltersDTO
+from core.application.transaction.dto.pagination import (
+    TransactionPageDTO,
+    TransactionPageRequestDTO,
+    decode_cursor,
+    encode_cursor,
+)
+from core.application.transaction.ports.services.transaction_query import (
+    ITransactionQueryService,
+)
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.domain.transaction.value_objects.transaction_cursor import (
+    TransactionCursor,
+)
+
+
+class GetTransactionsPageByUserUseCase:
+    def __init__(self, transaction_query_service: ITransactionQueryService):
+        self._transaction_query_service = transaction_query_service
+
+    async def execute(
+        self,
+        user_id: UUID,
+        request: TransactionPageRequestDTO,
+        filters_dto: TransactionFiltersDTO | None = None,
+    ) -> TransactionPageDTO:
+        """Get a page of user transactions, newest first.
+
+        :arg user_id: The user id.
+        :arg request: The page size and the cursor of the previous page.
+        :arg filters_dto: Optional filters narrowing the transactions.
+        :raise InvalidCursorException: If the cursor cannot be decoded.
+        :return: The transactions and the cursor of the next page.
+        """
+        after = decode_cursor(request.cursor) if request.cursor else None
+        filters = (
+            filters_dto.to_filters(user_id)
+            if filters_dto is not None
+            else TransactionFilters(user_id=user_id)
+        )
+        # One extra row tells whether another page exists
+        transactions = (
+            await self._transaction_query_service.get_page_by_filters(
+                filters, limit=request.limit + 1, after=after
+            )
+        )
+
+        next_cursor = None
+        if len(transactions) > request.limit:
+            transactions = transactions[: request.limit]
+            last = transactions[-1]
+            next_cursor = encode_cursor(
+                TransactionCursor(
+                    date=last.date, transaction_id=last.transaction_id
+                )
+            )
+
+        return TransactionPageDTO(
+            transactions=transactions,
+            next_cursor=next_cursor,
+        )
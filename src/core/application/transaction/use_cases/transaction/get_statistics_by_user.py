@@ -0,0 +1,62 @@
+from uuid import UUID
+
+from core.application.transaction.dto.filters import TransactionFiltersDTO
+from core.application.transaction.dto.statistics import (
+    TransactionStatisticsDTO,
+    TransactionStatisticsRequestDTO,
+)
+from core.application.transaction.ports.services.transaction_query import (
+    ITransactionQueryService,
+)
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+
+
+class GetTransactionStatisticsByUserUseCase:
+    def __init__(
+        self,
+        transaction_query_service: ITransactionQueryService,
+        currency_repository: ICurrencyRepository,
+    ):
+        self._transaction_query_service = transaction_query_service
+        self._currency_repository = currency_repository
+
+    async def execute(
+        self,
+        user_id: UUID,
+        request: TransactionStatisticsRequestDTO,
+        filters_dto: TransactionFiltersDTO | None = None,
+    ) -> TransactionStatisticsDTO:
+        """Get user transaction totals per period and group.
+
+        :arg user_id: The user id.
+        :arg request: The period, the dimensions to group by and the
+            currency to convert the totals to, if any.
+        :arg filters_dto: Optional filters narrowing the transactions.
+        :raise CurrencyNotFoundException: If the currency to convert to
+            does not exist.
+        :raise ExchangeRateNotFoundException: If a transaction could not
+            be converted for lack of a rate.
+        :return: The totals, ordered by period.
+        """
+        filters = (
+            filters_dto.to_filters(user_id)
+            if filters_dto is not None
+            else TransactionFilters(user_id=user_id)
+        )
+        # Dimensions are deduplicated but keep the order they were asked in
+        group_by = list(dict.fromkeys(request.group_by))
+        if request.convert_to is not None:
+            await self._currency_repository.get_by_id(request.convert_to)
+        rows = await self._transaction_query_service.get_statistics(
+            filters,
+            period=request.period,
+            group_by=group_by,
+            convert_to=request.convert_to,
+        )
+        return TransactionStatisticsDTO(
+            period=request.period,
+            group_by=group_by,
+            convert_to=request.convert_to,
+            rows=rows,
+        )
@@ -0,0 +1,235 @@
+import itertools
+from typing import AsyncGenerator, Iterable
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from core.application.transaction.dto.statement_import import (
+    StatementImportProgressDTO,
+    StatementImportRequestDTO,
+    StatementRowDTO,
+    StatementRowErrorDTO,
+)
+from core.application.transaction.dto.transaction import CreateTransactionDTO
+from core.domain.transaction.entities.category_mapping import (
+    CategoryMappingEntity,
+)
+from core.domain.transaction.entities.currency import CurrencyEntity
+from core.domain.transaction.entities.transaction import TransactionEntity
+from core.domain.transaction.exceptions.category.not_found import (
+    CategoryNotFoundException,
+)
+from core.domain.transaction.exceptions.currency.not_found import (
+    CurrencyNotFoundException,
+)
+from core.domain.transaction.repositories.category import ICategoryRepository
+from core.domain.transaction.repositories.category_mapping import (
+    ICategoryMappingRepository,
+)
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+from core.domain.transaction.repositories.transaction import (
+    ITransactionRepository,
+)
+from core.domain.transaction.value_objects.money import Money
+
+
+# Limits of a transaction description; bank memos often fall outside them
+MIN_DESCRIPTION_LENGTH = 10
+MAX_DESCRIPTION_LENGTH = 255
+
+
+class ImportStatementUseCase:
+    def __init__(
+        self,
+        transaction_repository: ITransactionRepository,
+        category_repository: ICategoryRepository,
+        currency_repository: ICurrencyRepository,
+        category_mapping_repository: ICategoryMappingRepository,
+    ):
+        self._transaction_repository = transaction_repository
+        self._category_repository = category_repository
+        self._currency_repository = currency_repository
+        self._category_mapping_repository = category_mapping_repository
+
+    async def execute(
+        self,
+        rows: Iterable[StatementRowDTO],
+        request: StatementImportRequestDTO,
+    ) -> AsyncGenerator[StatementImportProgressDTO, None]:
+        """Import transactions read from a bank statement.
+
+        Rows are validated like single transactions and written in chunks
+        of ``request.chunk_size``, each chunk in its own database
+        transaction, so only one chunk is held in memory at a time. A
+        progress report is yielded before the first chunk and after every
+        chunk; rows that fail are reported and skipped.
+
+        The category of a row comes from the user's mapping of its label,
+        or else from the income or expense category of the request,
+        depending on the sign of the amount. Descriptions too short for a
+        transaction are dropped and long ones are truncated, rather than
+        failing the row.
+
+        :arg rows: The statement rows.
+        :arg request: The import options.
+        :raise CurrencyNotFoundException: If the default currency does not
+            exist.
+        :raise CategoryNotFoundException: If a default category does not
+            exist.
+        :raise InvalidStatementException: If the statement cannot be read.
+        :return: Progress reports, the last one with ``done`` set.
+        """
+        categories = {
+            category.category_id: category
+            for category in await self._category_repository.get_all()
+        }
+        currencies = await self._currency_repository.get_all()
+        currencies_by_code = {
+            currency.currency_code.upper(): currency
+            for currency in currencies
+        }
+        default_currency = next(
+            (
+                currency
+                for currency in currencies
+                if currency.currency_id == request.currency_id
+            ),
+            None,
+        )
+        if default_currency is None:
+            raise CurrencyNotFoundException(
+                f"Currency with id {str(request.currency_id)!r} not found"
+            )
+        for category_id in (
+            request.income_category_id,
+            request.expense_category_id,
+        ):
+            if category_id is not None and category_id not in categories:
+                raise CategoryNotFoundException(
+                    f"Category with id {str(category_id)!r} not found"
+                )
+        mappings = {
+            mapping.label: mapping.category_id
+            for mapping in await self._category_mapping_repository.get_by_user(
+                request.user_id
+            )
+        }
+
+        # Reading the first row checks the file before anything is written
+        iterator = iter(rows)
+        first_row = next(iterator, None)
+        if first_row is not None:
+            iterator = itertools.chain((first_row,), iterator)
+
+        progress = StatementImportProgressDTO()
+        yield progress.model_copy()
+
+        entities: list[TransactionEntity] = []
+        pending = 0
+        for row in iterator:
+            progress.processed += 1
+            pending += 1
+            errors: dict[str, str] = {}
+            if row.error is not None:
+                errors["row"] = row.error
+            else:
+                currency: CurrencyEntity | None = default_currency
+                if row.currency_code:
+                    currency = currencies_by_code.get(
+                        row.currency_code.strip().upper()
+                    )
+                    if currency is None:
+                        errors["currency_id"] = (
+                            f"Unknown currency {row.currency_code!r}"
+                        )
+
+                category_id = None
+                if row.label:
+                    category_id = mappings.get(
+                        CategoryMappingEntity.normalize_label(row.label)
+                    )
+                if category_id is None:
+                    category_id = (
+                        request.income_category_id
+                        if row.amount is not None and row.amount > 0
+                        else request.expense_category_id
+                    )
+                if category_id is None or category_id not in categories:
+                    errors["category_id"] = (
+                        f"No category mapped for label {row.label!r}"
+                        if row.label
+                        else "No label and no default category"
+                    )
+
+                if not errors:
+                    assert currency is not None and category_id is not None
+                    try:
+                        create_transaction_dto = (
+                            CreateTransactionDTO.model_validate(
+                                {
+                                    "user_id": request.user_id,
+                                    "category_id": category_id,
+                                    "currency_id": currency.currency_id,
+                                    "amount": (
+                                        abs(row.amount)
+                                        if row.amount is not None
+                                        else None
+                                    ),
+                                    "description": self._fit_description(
+                                        row.description
+                                    ),
+                                    "date": row.date,
+                                }
+                            )
+                        )
+                    except ValidationError as e:
+                        errors.update(
+                            (str(error["loc"][0]), error["msg"])
+                            for error in e.errors()
+                        )
+                    else:
+                        entities.append(
+                            TransactionEntity(
+                                transaction_id=uuid4(),
+                                user_id=create_transaction_dto.user_id,
+                                category=categories[category_id],
+                                money=Money(
+                                    amount=create_transaction_dto.amount,
+                                    currency=currency,
+                                ),
+                                date=create_transaction_dto.date,
+                                description=(
+                                    create_transaction_dto.description
+                                ),
+                            )
+                        )
+
+            if errors:
+                progress.failed += 1
+                progress.errors.append(
+                    StatementRowErrorDTO(row=row.row, errors=errors)
+                )
+            if pending >= request.chunk_size:
+                progress.created += len(
+                    await self._transaction_repository.save_many(entities)
+                )
+                yield progress.model_copy()
+                entities = []
+                pending = 0
+                progress.errors = []
+
+        if entities:
+            progress.created += len(
+                await self._transaction_repository.save_many(entities)
+            )
+        progress.done = True
+        yield progress
+
+    @staticmethod
+    def _fit_description(description: str | None) -> str | None:
+        if description is None:
+            return None
+        description = description.strip()
+        if len(description) < MIN_DESCRIPTION_LENGTH:
+            return None
+        return description[:MAX_DESCRIPTION_LENGTH].rstrip()
@@ -0,0 +1,69 @@
+from uuid import UUID
+
+from core.application.transaction.dto.filters import TransactionFiltersDTO
+from core.application.transaction.dto.pagination import (
+    decode_search_cursor,
+    encode_search_cursor,
+)
+from core.application.transaction.dto.search import (
+    TransactionSearchPageDTO,
+    TransactionSearchRequestDTO,
+)
+from core.application.transaction.ports.services.transaction_query import (
+    ITransactionQueryService,
+)
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.domain.transaction.value_objects.transaction_cursor import (
+    TransactionSearchCursor,
+)
+
+
+class SearchTransactionsByUserUseCase:
+    def __init__(self, transaction_query_service: ITransactionQueryService):
+        self._transaction_query_service = transaction_query_service
+
+    async def execute(
+        self,
+        user_id: UUID,
+        request: TransactionSearchRequestDTO,
+        filters_dto: TransactionFiltersDTO | None = None,
+    ) -> TransactionSearchPageDTO:
+        """Search the descriptions of user transactions, best match first.
+
+        :arg user_id: The user id.
+        :arg request: The query, the page size and the cursor of the
+            previous page.
+        :arg filters_dto: Optional filters narrowing the transactions.
+        :raise InvalidCursorException: If the cursor cannot be decoded.
+        :return: The matching transactions and the cursor of the next
+            page.
+        """
+        after = (
+            decode_search_cursor(request.cursor) if request.cursor else None
+        )
+        filters = (
+            filters_dto.to_filters(user_id)
+            if filters_dto is not None
+            else TransactionFilters(user_id=user_id)
+        )
+        # One extra row tells whether another page exists
+        transactions = await self._transaction_query_service.search(
+            filters, request.q, limit=request.limit + 1, after=after
+        )
+
+        next_cursor = None
+        if len(transactions) > request.limit:
+            transactions = transactions[: request.limit]
+            last = transactions[-1]
+            next_cursor = encode_search_cursor(
+                TransactionSearchCursor(
+                    rank=last.rank,
+                    date=last.date,
+                    transaction_id=last.transaction_id,
+                )
+            )
+
+        return TransactionSearchPageDTO(
+            transactions=transactions,
+            next_cursor=next_cursor,
+        )
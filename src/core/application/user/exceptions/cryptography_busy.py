@@ -0,0 +1,3 @@
+class CryptographyServiceBusyException(Exception):
+    def __init__(self, message: str = "Cryptography service is busy"):
+        super().__init__(message)
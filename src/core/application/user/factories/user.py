@@ -1,17 +1,17 @@
 from uuid import uuid4
 
 from core.application.user.ports.services.cryptography import (
-    ICryptographyService,
+    IAsyncCryptographyService,
 )
 from core.domain.user.entities.role import RoleEntity
 from core.domain.user.entities.user import UserEntity
 
 
 class UserFactory:
-    def __init__(self, cryptography_service: ICryptographyService):
+    def __init__(self, cryptography_service: IAsyncCryptographyService):
         self._cryptography_service = cryptography_service
 
-    def create_user(
+    async def create_user(
         self,
         username: str,
         email: str,
@@ -19,7 +19,7 @@ class UserFactory:
         roles: list[RoleEntity],
     ) -> UserEntity:
         salt = self._cryptography_service.generate_salt()
-        password_hash = self._cryptography_service.hash_password(
+        password_hash = await self._cryptography_service.hash_password(
             password=password, salt=salt
         )
         return UserEntity(
@@ -10,3 +10,16 @@ class ICryptographyService(ABC):
 
     @abstractmethod
     def verify_password(self, password: str, hashed_password: str) -> bool: ...
+
+
+class IAsyncCryptographyService(ABC):
+    @abstractmethod
+    def generate_salt(self) -> str: ...
+
+    @abstractmethod
+    async def hash_password(self, password: str, salt: str) -> str: ...
+
+    @abstractmethod
+    async def verify_password(
+        self, password: str, hashed_password: str
+    ) -> bool: ...
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from core.application.user.dto.user import UserDTO
+
+
+class IUserCacheService(ABC):
+    @abstractmethod
+    def get(self, user_id: UUID) -> UserDTO | None: ...
+
+    @abstractmethod
+    def set(self, user: UserDTO) -> None: ...
+
+    @abstractmethod
+    def invalidate(self, user_id: UUID) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
@@ -4,18 +4,33 @@ from loguru import logger
 from pydantic import ValidationError
 
 from core.application.user.dto.user import UserDTO
+from core.application.user.ports.services.user_cache import IUserCacheService
 from core.domain.user.repositories.user import IUserRepository
 
 
 class GetUserUseCase:
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        user_cache: IUserCacheService | None = None,
+    ):
         self._user_repository = user_repository
+        self._user_cache = user_cache
 
     async def execute(self, user_id: UUID) -> UserDTO:
+        if self._user_cache is not None:
+            cached_user = self._user_cache.get(user_id)
+            if cached_user is not None:
+                return cached_user
+
         user_entity = await self._user_repository.get_by_id(user_id)
         try:
-            return UserDTO.from_entity(user_entity)
+            user = UserDTO.from_entity(user_entity)
         except ValidationError as e:
             # Because if an error occurs, it is not a user error
             logger.error(f"Error converting user {user_id!r} to DTO")
             raise Exception("Error getting user") from e
+
+        if self._user_cache is not None:
+            self._user_cache.set(user)
+        return user
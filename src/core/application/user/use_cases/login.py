@@ -6,7 +6,7 @@ from core.application.user.exceptions.invalid_credentials import (
     UserInvalidCredentialsException,
 )
 from core.application.user.ports.services.cryptography import (
-    ICryptographyService,
+    IAsyncCryptographyService,
 )
 from core.domain.user.repositories.user import IUserRepository
 from core.shared.exceptions import NotFoundException
@@ -16,7 +16,7 @@ class LoginUserUseCase:
     def __init__(
         self,
         user_repository: IUserRepository,
-        cryptography_service: ICryptographyService,
+        cryptography_service: IAsyncCryptographyService,
     ):
         self._user_repository = user_repository
         self._cryptography_service = cryptography_service
@@ -29,7 +29,7 @@ class LoginUserUseCase:
                 "Invalid email or password"
             ) from e
 
-        if not self._cryptography_service.verify_password(
+        if not await self._cryptography_service.verify_password(
             password=login_data.password.get_secret_value(),
             hashed_password=user.password_hash,
         ):
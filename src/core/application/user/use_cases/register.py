@@ -52,7 +52,7 @@ class RegisterUserUseCase:
             logger.warning("Role 'member' not found, creating it")
             member_role = RoleEntity.create("member")
 
-        user = self._user_factory.create_user(
+        user = await self._user_factory.create_user(
             username=register_data.username,
             email=register_data.email,
             password=register_data.password.get_secret_value(),
@@ -0,0 +1,58 @@
+import datetime
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from core.domain.transaction.enums.budget import BudgetPeriod
+from core.domain.transaction.value_objects.money import Money
+
+
+@dataclass
+class BudgetEntity:
+    """A spending limit on a category or on a whole operation.
+
+    Only transactions in the currency of ``limit`` count towards it.
+    Spend is tracked per period from the period ``created_at`` falls in;
+    an alert is raised the first time it reaches each of ``thresholds``,
+    in percent of the limit.
+    """
+
+    budget_id: UUID
+    user_id: UUID
+    category_id: UUID | None
+    operation_id: UUID | None
+    period: BudgetPeriod
+    limit: Money
+    thresholds: list[int] = field(default_factory=lambda: [80, 100])
+    created_at: datetime.datetime = field(
+        default_factory=lambda: datetime.datetime.now(datetime.UTC)
+    )
+
+    def __post_init__(self):
+        self.thresholds = sorted(set(self.thresholds))
+        self._validate()
+
+    def _validate(self):
+        if (self.category_id is None) == (self.operation_id is None):
+            raise ValueError(
+                "Budget must have either a category or an operation"
+            )
+        if self.limit.amount <= 0:
+            raise ValueError("Limit must be greater than 0")
+        if not 1 <= len(self.thresholds) <= 10:
+            raise ValueError("Budget must have between 1 and 10 thresholds")
+        if not all(1 <= threshold <= 1000 for threshold in self.thresholds):
+            raise ValueError("Thresholds must be between 1 and 1000 percent")
+
+    def get_period_start(self, date: datetime.datetime) -> datetime.datetime:
+        """Return the first instant of the UTC period containing ``date``.
+
+        Weeks start on Monday, as with Postgres ``date_trunc``.
+        """
+        date = date.astimezone(datetime.UTC).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        if self.period == BudgetPeriod.WEEK:
+            return date - datetime.timedelta(days=date.weekday())
+        if self.period == BudgetPeriod.MONTH:
+            return date.replace(day=1)
+        return date.replace(month=1, day=1)
@@ -0,0 +1,18 @@
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+from core.domain.transaction.entities.budget import BudgetEntity
+
+
+@dataclass
+class BudgetAlertEntity:
+    """Spend of a budget period reached one of the budget's thresholds."""
+
+    alert_id: UUID
+    budget: BudgetEntity
+    period_start: datetime.datetime
+    threshold: int
+    spent: Decimal
+    created_at: datetime.datetime
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass
+class CategoryMappingEntity:
+    """Maps a category label found in a user's bank statements to one of
+    our categories."""
+
+    user_id: UUID
+    label: str
+    category_id: UUID
+
+    def __post_init__(self):
+        self.label = self.normalize_label(self.label)
+        self._validate()
+
+    @staticmethod
+    def normalize_label(label: str) -> str:
+        return " ".join(label.split()).casefold()
+
+    def _validate(self):
+        if not 1 <= len(self.label) <= 255:
+            raise ValueError("Label must be between 1 and 255 characters")
@@ -0,0 +1,25 @@
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+
+@dataclass
+class ExchangeRateEntity:
+    """Units of a currency worth one unit of the reference currency, from
+    ``valid_from`` until the next rate of the same currency.
+
+    All rates share one reference currency, whose own rate is 1, so any
+    two currencies convert through it: ``amount * rate(to) / rate(from)``.
+    """
+
+    currency_id: UUID
+    valid_from: datetime.date
+    rate: Decimal
+
+    def __post_init__(self):
+        self._validate()
+
+    def _validate(self):
+        if self.rate <= 0:
+            raise ValueError("Rate must be greater than 0")
@@ -0,0 +1,85 @@
+import datetime
+import uuid
+from dataclasses import dataclass
+from uuid import UUID
+
+from core.domain.transaction.entities.category import CategoryEntity
+from core.domain.transaction.entities.transaction import TransactionEntity
+from core.domain.transaction.value_objects.money import Money
+from core.domain.transaction.value_objects.recurrence_rule import (
+    RecurrenceRule,
+)
+
+
+@dataclass
+class RecurringTransactionEntity:
+    """A transaction repeated on a schedule, such as rent or a salary.
+
+    ``occurrence_count`` occurrences have been created as transactions
+    so far; the next one is due at ``next_run_at``, ``None`` once the
+    rule has ended.
+    """
+
+    recurring_transaction_id: UUID
+    user_id: UUID
+    category: CategoryEntity
+    money: Money
+    description: str | None
+    rule: RecurrenceRule
+    start_date: datetime.datetime
+    occurrence_count: int = 0
+
+    def __post_init__(self):
+        self._validate()
+
+    def _validate(self):
+        if (
+            self.description is not None
+            and not 10 <= len(self.description) <= 255
+        ):
+            raise ValueError(
+                "Description must be between 10 and 255 characters"
+            )
+        if self.start_date.tzinfo is None:
+            raise ValueError("Start date must have a time zone")
+
+    @property
+    def next_run_at(self) -> datetime.datetime | None:
+        return self.rule.get_occurrence(
+            self.start_date, self.occurrence_count
+        )
+
+    def get_transaction_id(self, index: int) -> UUID:
+        """Id of the transaction of occurrence ``index``.
+
+        Derived from the template, so creating an occurrence twice fails
+        on the primary key instead of duplicating it.
+        """
+        return uuid.uuid5(self.recurring_transaction_id, str(index))
+
+    def materialize(
+        self, now: datetime.datetime, limit: int
+    ) -> list[TransactionEntity]:
+        """Create the transactions of the occurrences due by ``now``.
+
+        At most ``limit`` are created at once; the rest stay due.
+        """
+        transactions: list[TransactionEntity] = []
+        while len(transactions) < limit:
+            date = self.next_run_at
+            if date is None or date > now:
+                break
+            transactions.append(
+                TransactionEntity(
+                    transaction_id=self.get_transaction_id(
+                        self.occurrence_count
+                    ),
+                    user_id=self.user_id,
+                    category=self.category,
+                    money=self.money,
+                    description=self.description,
+                    date=date,
+                )
+            )
+            self.occurrence_count += 1
+        return transactions
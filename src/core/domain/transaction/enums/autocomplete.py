@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class AutocompleteMatch(Enum):
+    # Case-insensitive prefix of a word of the label
+    PREFIX = "prefix"
+    # Also ignores accents, stress marks and apostrophes
+    FOLDED = "folded"
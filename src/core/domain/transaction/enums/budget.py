@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class BudgetPeriod(Enum):
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
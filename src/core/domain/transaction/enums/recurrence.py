@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class RecurrenceFrequency(Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+    YEARLY = "YEARLY"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class StatementFormat(Enum):
+    CSV = "csv"
+    OFX = "ofx"
+    QIF = "qif"
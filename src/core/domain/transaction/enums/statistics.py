@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class StatisticsPeriod(Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+class StatisticsGroup(Enum):
+    OPERATION_TYPE = "operation_type"
+    OPERATION = "operation"
+    CATEGORY = "category"
+    CURRENCY = "currency"
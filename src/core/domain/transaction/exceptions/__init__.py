@@ -1,3 +1,6 @@
+from core.domain.transaction.exceptions.budget.not_found import (
+    BudgetNotFoundException,
+)
 from core.domain.transaction.exceptions.category.already_exist import (
     CategoryAlreadyExistException,
 )
@@ -16,6 +19,9 @@ from core.domain.transaction.exceptions.currency.delete import (
 from core.domain.transaction.exceptions.currency.not_found import (
     CurrencyNotFoundException,
 )
+from core.domain.transaction.exceptions.exchange_rate.not_found import (
+    ExchangeRateNotFoundException,
+)
 from core.domain.transaction.exceptions.operation.already_exist import (
     OperationAlreadyExistException,
 )
@@ -25,6 +31,9 @@ from core.domain.transaction.exceptions.operation.delete import (
 from core.domain.transaction.exceptions.operation.not_found import (
     OperationNotFoundException,
 )
+from core.domain.transaction.exceptions.recurring_transaction.not_found import (  # noqa: E501
+    RecurringTransactionNotFoundException,
+)
 from core.domain.transaction.exceptions.transaction.not_found import (
     TransactionNotFoundException,
 )
@@ -41,4 +50,7 @@ __all__ = (
     "CurrencyNotDeletableException",
     "CurrencyAlreadyExistException",
     "TransactionNotFoundException",
+    "ExchangeRateNotFoundException",
+    "RecurringTransactionNotFoundException",
+    "BudgetNotFoundException",
 )
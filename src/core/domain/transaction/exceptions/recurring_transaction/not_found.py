@@ -0,0 +1,5 @@
+from core.shared.exceptions import NotFoundException
+
+
+class RecurringTransactionNotFoundException(NotFoundException):
+    pass
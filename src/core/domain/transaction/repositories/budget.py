@@ -0,0 +1,34 @@
+import datetime
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from uuid import UUID
+
+from core.domain.transaction.entities.budget import BudgetEntity
+
+
+class IBudgetRepository(ABC):
+
+    @abstractmethod
+    async def save(self, budget: BudgetEntity) -> BudgetEntity:
+        """Insert the budget with the spend of its current period so far.
+
+        Later spend is added as transactions are written.
+        """
+
+    @abstractmethod
+    async def get_by_id(self, budget_id: UUID) -> BudgetEntity: ...
+
+    @abstractmethod
+    async def get_by_user(self, user_id: UUID) -> list[BudgetEntity]: ...
+
+    @abstractmethod
+    async def delete(self, budget_id: UUID) -> None: ...
+
+    @abstractmethod
+    async def get_spent(
+        self, periods: list[tuple[UUID, datetime.datetime]]
+    ) -> dict[tuple[UUID, datetime.datetime], Decimal]:
+        """Read the running spend of ``(budget_id, period_start)`` pairs.
+
+        Periods without spend are left out.
+        """
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from core.domain.transaction.entities.budget_alert import BudgetAlertEntity
+
+
+class IBudgetAlertRepository(ABC):
+
+    @abstractmethod
+    async def lock_undelivered(self, limit: int) -> list[BudgetAlertEntity]:
+        """Lock up to ``limit`` undelivered alerts, oldest first.
+
+        Alerts locked by another worker are skipped, not waited for.
+        """
+
+    @abstractmethod
+    async def mark_delivered(self, alert_ids: list[UUID]) -> None: ...
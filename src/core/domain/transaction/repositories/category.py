@@ -12,6 +12,11 @@ class ICategoryRepository(ABC):
     @abstractmethod
     async def get_by_id(self, category_id: UUID) -> CategoryEntity: ...
 
+    @abstractmethod
+    async def get_by_ids(
+        self, category_ids: list[UUID]
+    ) -> list[CategoryEntity]: ...
+
     @abstractmethod
     async def get_by_name(self, name: str) -> CategoryEntity: ...
 
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from core.domain.transaction.entities.category_mapping import (
+    CategoryMappingEntity,
+)
+
+
+class ICategoryMappingRepository(ABC):
+
+    @abstractmethod
+    async def get_by_user(
+        self, user_id: UUID
+    ) -> list[CategoryMappingEntity]: ...
+
+    @abstractmethod
+    async def save_many(
+        self, mappings: list[CategoryMappingEntity]
+    ) -> list[CategoryMappingEntity]: ...
+
+    @abstractmethod
+    async def delete_by_labels(
+        self, user_id: UUID, labels: list[str]
+    ) -> None: ...
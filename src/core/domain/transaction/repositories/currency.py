@@ -12,6 +12,11 @@ class ICurrencyRepository(ABC):
     @abstractmethod
     async def get_by_id(self, currency_id: UUID) -> CurrencyEntity: ...
 
+    @abstractmethod
+    async def get_by_ids(
+        self, currency_ids: list[UUID]
+    ) -> list[CurrencyEntity]: ...
+
     @abstractmethod
     async def get_by_name(self, name: str) -> CurrencyEntity: ...
 
@@ -0,0 +1,28 @@
+import datetime
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from core.domain.transaction.entities.exchange_rate import ExchangeRateEntity
+from core.domain.transaction.value_objects.exchange_rates import (
+    ExchangeRateTable,
+)
+
+
+class IExchangeRateRepository(ABC):
+
+    @abstractmethod
+    async def save_many(self, rates: list[ExchangeRateEntity]) -> int:
+        """Insert the rates, replacing those of the same currency and day.
+
+        :return: The number of rates written.
+        """
+
+    @abstractmethod
+    async def get_table(
+        self,
+        currency_ids: list[UUID],
+        start_date: datetime.date,
+        end_date: datetime.date,
+    ) -> ExchangeRateTable:
+        """Load the rates of ``currency_ids`` in effect between the dates,
+        including the last one set before ``start_date``."""
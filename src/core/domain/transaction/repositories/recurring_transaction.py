@@ -0,0 +1,48 @@
+import datetime
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from core.domain.transaction.entities.recurring_transaction import (
+    RecurringTransactionEntity,
+)
+
+
+class IRecurringTransactionRepository(ABC):
+
+    @abstractmethod
+    async def save(
+        self, recurring_transaction: RecurringTransactionEntity
+    ) -> RecurringTransactionEntity: ...
+
+    @abstractmethod
+    async def get_by_id(
+        self, recurring_transaction_id: UUID
+    ) -> RecurringTransactionEntity: ...
+
+    @abstractmethod
+    async def get_by_user(
+        self, user_id: UUID
+    ) -> list[RecurringTransactionEntity]: ...
+
+    @abstractmethod
+    async def delete(self, recurring_transaction_id: UUID) -> None: ...
+
+    @abstractmethod
+    async def lock_due(
+        self, now: datetime.datetime, limit: int
+    ) -> list[RecurringTransactionEntity]:
+        """Lock up to ``limit`` templates due by ``now``, oldest first.
+
+        Templates locked by another worker are skipped, not waited for.
+        The locks are held until the session commits.
+        """
+
+    @abstractmethod
+    async def update_schedules(
+        self, recurring_transactions: list[RecurringTransactionEntity]
+    ) -> None:
+        """Store how far the templates have been materialized.
+
+        Not committed: the caller commits it together with the
+        transactions created, so an occurrence is never created twice.
+        """
@@ -3,6 +3,9 @@ from uuid import UUID
 
 from core.domain.transaction.entities.transaction import TransactionEntity
 from core.domain.transaction.filters.transaction import TransactionFilters
+from core.domain.transaction.value_objects.transaction_cursor import (
+    TransactionCursor,
+)
 
 
 class ITransactionRepository(ABC):
@@ -11,6 +14,11 @@ class ITransactionRepository(ABC):
         self, transaction: TransactionEntity
     ) -> TransactionEntity: ...
 
+    @abstractmethod
+    async def save_many(
+        self, transactions: list[TransactionEntity]
+    ) -> list[TransactionEntity]: ...
+
     @abstractmethod
     async def delete(self, transaction_id: UUID) -> None: ...
 
@@ -26,3 +34,11 @@ class ITransactionRepository(ABC):
     async def get_by_filters(
         self, filters: TransactionFilters
     ) -> list[TransactionEntity]: ...
+
+    @abstractmethod
+    async def get_page_by_filters(
+        self,
+        filters: TransactionFilters,
+        limit: int,
+        after: TransactionCursor | None = None,
+    ) -> list[TransactionEntity]: ...
@@ -4,5 +4,5 @@ from decimal import Decimal
 
 @dataclass(frozen=True)
 class AmountRange:
-    min_amount: Decimal
-    max_amount: Decimal
+    min_amount: Decimal | None = None
+    max_amount: Decimal | None = None
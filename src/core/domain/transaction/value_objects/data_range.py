@@ -4,5 +4,5 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True)
 class DataRange:
-    start_date: datetime.date
-    end_date: datetime.date
+    start_date: datetime.date | None = None
+    end_date: datetime.date | None = None
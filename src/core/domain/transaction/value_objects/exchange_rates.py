@@ -0,0 +1,70 @@
+import bisect
+import datetime
+from decimal import Decimal
+from typing import Iterable
+from uuid import UUID
+
+from core.domain.transaction.entities.currency import CurrencyEntity
+from core.domain.transaction.entities.exchange_rate import ExchangeRateEntity
+from core.domain.transaction.exceptions.exchange_rate.not_found import (
+    ExchangeRateNotFoundException,
+)
+from core.domain.transaction.value_objects.money import Money
+
+
+class ExchangeRateTable:
+    """Rates of several currencies over time, indexed by interval.
+
+    Each currency keeps its ``valid_from`` dates sorted, so the rate in
+    effect on a date is found by bisection in ``O(log n)``.
+    """
+
+    def __init__(self, rates: Iterable[ExchangeRateEntity]):
+        by_currency: dict[UUID, dict[datetime.date, Decimal]] = {}
+        for rate in rates:
+            by_currency.setdefault(rate.currency_id, {})[
+                rate.valid_from
+            ] = rate.rate
+        self._dates: dict[UUID, list[datetime.date]] = {}
+        self._rates: dict[UUID, list[Decimal]] = {}
+        for currency_id, currency_rates in by_currency.items():
+            dates = sorted(currency_rates)
+            self._dates[currency_id] = dates
+            self._rates[currency_id] = [currency_rates[d] for d in dates]
+
+    def __len__(self) -> int:
+        return sum(len(dates) for dates in self._dates.values())
+
+    def get_rate(
+        self, currency_id: UUID, date: datetime.date
+    ) -> Decimal | None:
+        """Return the rate of ``currency_id`` in effect on ``date``."""
+        dates = self._dates.get(currency_id)
+        if not dates:
+            return None
+        position = bisect.bisect_right(dates, date)
+        if position == 0:
+            return None
+        return self._rates[currency_id][position - 1]
+
+    def convert(
+        self, money: Money, currency: CurrencyEntity, date: datetime.date
+    ) -> Money:
+        """Convert ``money`` to ``currency`` at the rates of ``date``.
+
+        :raise ExchangeRateNotFoundException: If either currency has no
+            rate on or before ``date``.
+        """
+        if money.currency.currency_id == currency.currency_id:
+            return money
+        rates = []
+        for currency_entity in (money.currency, currency):
+            rate = self.get_rate(currency_entity.currency_id, date)
+            if rate is None:
+                raise ExchangeRateNotFoundException(
+                    f"No exchange rate for "
+                    f"{currency_entity.currency_code!r} on {date}"
+                )
+            rates.append(rate)
+        source_rate, target_rate = rates
+        return money.convert(currency, target_rate / source_rate)
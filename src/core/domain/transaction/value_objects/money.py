@@ -26,6 +26,10 @@ class Money:
             raise ValueError("Cannot subtract money with different currencies")
         return Money(self.currency, self.amount - other.amount)
 
+    def convert(self, currency: CurrencyEntity, rate: Decimal) -> "Money":
+        """Return the amount in ``currency``, ``rate`` units per unit."""
+        return Money(currency, self.amount * rate)
+
     def __mul__(self, other: Decimal | int | float) -> "Money":
         if not isinstance(other, (Decimal, int, float)):
             raise ValueError("Can only multiply by a Decimal, int or float")
@@ -0,0 +1,157 @@
+import calendar
+import datetime
+from dataclasses import dataclass
+
+from core.domain.transaction.enums.recurrence import RecurrenceFrequency
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """A schedule in the syntax of iCalendar ``RRULE``.
+
+    Only ``FREQ``, ``INTERVAL``, ``BYMONTHDAY`` (a single day of a monthly
+    rule, negative counting from the end of the month), ``COUNT`` and
+    ``UNTIL`` are supported. Unlike RFC 5545, a month day past the end of
+    a short month falls on its last day instead of being skipped, so rent
+    due on the 31st is still due in February.
+    """
+
+    frequency: RecurrenceFrequency
+    interval: int = 1
+    month_day: int | None = None
+    count: int | None = None
+    until: datetime.datetime | None = None
+
+    def __post_init__(self):
+        self._validate()
+
+    def _validate(self):
+        if self.interval < 1:
+            raise ValueError("Interval must be at least 1")
+        if self.month_day is not None:
+            # With FREQ=YEARLY, RFC 5545 repeats BYMONTHDAY every month
+            if self.frequency != RecurrenceFrequency.MONTHLY:
+                raise ValueError(
+                    "Month day is only allowed with a monthly frequency"
+                )
+            if not 1 <= abs(self.month_day) <= 31:
+                raise ValueError(
+                    "Month day must be between 1 and 31, or -31 and -1"
+                )
+        if self.count is not None and self.count < 1:
+            raise ValueError("Count must be at least 1")
+        if self.count is not None and self.until is not None:
+            raise ValueError("Count and until cannot both be set")
+        if self.until is not None and self.until.tzinfo is None:
+            raise ValueError("Until must have a time zone")
+
+    @classmethod
+    def parse(cls, value: str) -> "RecurrenceRule":
+        """Parse a rule such as ``FREQ=MONTHLY;BYMONTHDAY=1``.
+
+        :raise ValueError: If the rule is malformed or uses unsupported
+            parts.
+        """
+        value = value.strip().removeprefix("RRULE:")
+        parts: dict[str, str] = {}
+        for part in value.split(";"):
+            name, separator, part_value = part.partition("=")
+            if not separator or not part_value:
+                raise ValueError(f"Invalid rule part {part!r}")
+            parts[name.strip().upper()] = part_value.strip()
+
+        unsupported = parts.keys() - {
+            "FREQ",
+            "INTERVAL",
+            "BYMONTHDAY",
+            "COUNT",
+            "UNTIL",
+        }
+        if unsupported:
+            raise ValueError(
+                f"Unsupported rule parts: {', '.join(sorted(unsupported))}"
+            )
+        if "FREQ" not in parts:
+            raise ValueError("Rule must have a FREQ")
+
+        until = None
+        if "UNTIL" in parts:
+            if "T" in parts["UNTIL"]:
+                until = datetime.datetime.strptime(
+                    parts["UNTIL"].removesuffix("Z"), "%Y%m%dT%H%M%S"
+                ).replace(tzinfo=datetime.UTC)
+            else:
+                # A date is inclusive, so it ends with the last second of
+                # its UTC day, as precise as the rule can write it
+                until_date = datetime.datetime.strptime(
+                    parts["UNTIL"], "%Y%m%d"
+                ).date()
+                until = datetime.datetime.combine(
+                    until_date, datetime.time(23, 59, 59), datetime.UTC
+                )
+        return cls(
+            frequency=RecurrenceFrequency(parts["FREQ"].upper()),
+            interval=int(parts.get("INTERVAL", "1")),
+            month_day=(
+                int(parts["BYMONTHDAY"]) if "BYMONTHDAY" in parts else None
+            ),
+            count=int(parts["COUNT"]) if "COUNT" in parts else None,
+            until=until,
+        )
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.frequency.value}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.month_day is not None:
+            parts.append(f"BYMONTHDAY={self.month_day}")
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            until = self.until.astimezone(datetime.UTC)
+            parts.append(f"UNTIL={until:%Y%m%dT%H%M%SZ}")
+        return ";".join(parts)
+
+    def _shift_months(
+        self, start: datetime.datetime, months: int
+    ) -> datetime.datetime:
+        month_index = start.month - 1 + months
+        year = start.year + month_index // 12
+        month = month_index % 12 + 1
+        last_day = calendar.monthrange(year, month)[1]
+        day = self.month_day if self.month_day is not None else start.day
+        if day < 0:
+            day = max(last_day + day + 1, 1)
+        return start.replace(year=year, month=month, day=min(day, last_day))
+
+    def _get_period_start(
+        self, start: datetime.datetime, periods: int
+    ) -> datetime.datetime:
+        if self.frequency == RecurrenceFrequency.DAILY:
+            return start + datetime.timedelta(days=periods)
+        if self.frequency == RecurrenceFrequency.WEEKLY:
+            return start + datetime.timedelta(weeks=periods)
+        if self.frequency == RecurrenceFrequency.MONTHLY:
+            return self._shift_months(start, periods)
+        return self._shift_months(start, periods * 12)
+
+    def get_occurrence(
+        self, start: datetime.datetime, index: int
+    ) -> datetime.datetime | None:
+        """Return occurrence number ``index``, counted from 0.
+
+        Occurrences are computed from ``start`` rather than from each
+        other, so month-end clamping never drifts. ``None`` once the rule
+        has ended.
+        """
+        if self.count is not None and index >= self.count:
+            return None
+        periods = index * self.interval
+        # With a month day before the start day, the first occurrence is
+        # in the next period
+        if self._get_period_start(start, 0) < start:
+            periods += self.interval
+        occurrence = self._get_period_start(start, periods)
+        if self.until is not None and occurrence > self.until:
+            return None
+        return occurrence
@@ -0,0 +1,20 @@
+import datetime
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class TransactionCursor:
+    """Position of the last transaction on a page, ordered newest first."""
+
+    date: datetime.datetime
+    transaction_id: UUID
+
+
+@dataclass(frozen=True)
+class TransactionSearchCursor:
+    """Position of the last search result on a page, best match first."""
+
+    rank: float
+    date: datetime.datetime
+    transaction_id: UUID
@@ -1,9 +1,22 @@
 from core.infrastructure.database.models.base import Base
+from core.infrastructure.database.models.budget import Budget
+from core.infrastructure.database.models.budget_alert import BudgetAlert
+from core.infrastructure.database.models.budget_spend import BudgetSpend
 from core.infrastructure.database.models.category import Category
+from core.infrastructure.database.models.category_mapping import (
+    CategoryMapping,
+)
 from core.infrastructure.database.models.currency import Currency
+from core.infrastructure.database.models.exchange_rate import ExchangeRate
 from core.infrastructure.database.models.operation import Operation
+from core.infrastructure.database.models.recurring_transaction import (
+    RecurringTransaction,
+)
 from core.infrastructure.database.models.role import Role
 from core.infrastructure.database.models.transaction import Transaction
+from core.infrastructure.database.models.transaction_rollup import (
+    TransactionRollup,
+)
 from core.infrastructure.database.models.user import User
 from core.infrastructure.database.models.user_roles import UserRoles
 
@@ -14,7 +27,14 @@ __all__ = (
     "Role",
     "UserRoles",
     "Category",
+    "CategoryMapping",
     "Currency",
+    "ExchangeRate",
     "Operation",
     "Transaction",
+    "TransactionRollup",
+    "RecurringTransaction",
+    "Budget",
+    "BudgetSpend",
+    "BudgetAlert",
 )
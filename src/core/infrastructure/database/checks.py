@@ -0,0 +1,142 @@
+"""Verify that every transaction access path is backed by an index.
+
+Run with ``python -m core.infrastructure.database.checks`` from ``src``;
+exits with a non-zero status when a path is not covered.
+"""
+
+import sys
+from dataclasses import fields
+
+from sqlalchemy import (
+    Index,
+    PrimaryKeyConstraint,
+    Table,
+    UniqueConstraint,
+)
+from sqlalchemy.sql.elements import UnaryExpression
+
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.infrastructure.database.models.budget import Budget
+from core.infrastructure.database.models.budget_alert import BudgetAlert
+from core.infrastructure.database.models.budget_spend import BudgetSpend
+from core.infrastructure.database.models.category import Category
+from core.infrastructure.database.models.category_mapping import (
+    CategoryMapping,
+)
+from core.infrastructure.database.models.exchange_rate import ExchangeRate
+from core.infrastructure.database.models.recurring_transaction import (
+    RecurringTransaction,
+)
+from core.infrastructure.database.models.transaction import Transaction
+from core.infrastructure.database.models.transaction_rollup import (
+    TransactionRollup,
+)
+from core.infrastructure.repositories.transaction import TransactionRepository
+
+
+def _index_columns(index: Index) -> tuple[str, ...]:
+    names = []
+    for expression in index.expressions:
+        # Descending columns are wrapped in a UnaryExpression
+        element = (
+            expression.element
+            if isinstance(expression, UnaryExpression)
+            else expression
+        )
+        names.append(getattr(element, "name", str(element)))
+    return tuple(names)
+
+
+def _indexed_column_lists(table: Table) -> list[tuple[str, ...]]:
+    column_lists = [_index_columns(index) for index in table.indexes]
+    # Primary keys and unique constraints are backed by an index too
+    for constraint in table.constraints:
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)):
+            column_lists.append(tuple(constraint.columns.keys()))
+    return column_lists
+
+
+def _is_covered(table: Table, columns: tuple[str, ...]) -> bool:
+    return any(
+        column_list[: len(columns)] == columns
+        for column_list in _indexed_column_lists(table)
+    )
+
+
+def find_unindexed_paths() -> list[str]:
+    table = Transaction.__table__
+    assert isinstance(table, Table)
+    access_paths = TransactionRepository.filter_access_paths
+    errors = []
+
+    for field in fields(TransactionFilters):
+        columns = access_paths.get(field.name)
+        if columns is None:
+            errors.append(
+                f"Filter {field.name!r} has no declared access path"
+            )
+        elif not _is_covered(table, columns):
+            errors.append(
+                f"Filter {field.name!r} needs an index on {columns!r}"
+            )
+
+    rollup_table = TransactionRollup.__table__
+    assert isinstance(rollup_table, Table)
+    mapping_table = CategoryMapping.__table__
+    assert isinstance(mapping_table, Table)
+    rate_table = ExchangeRate.__table__
+    assert isinstance(rate_table, Table)
+    recurring_table = RecurringTransaction.__table__
+    assert isinstance(recurring_table, Table)
+    budget_tables = [
+        model.__table__ for model in (Budget, BudgetSpend, BudgetAlert)
+    ]
+    for checked_table in (
+        table,
+        rollup_table,
+        mapping_table,
+        rate_table,
+        recurring_table,
+        *budget_tables,
+    ):
+        assert isinstance(checked_table, Table)
+        for foreign_key in checked_table.foreign_keys:
+            column = foreign_key.parent.name
+            if not _is_covered(checked_table, (column,)):
+                errors.append(
+                    f"Foreign key '{checked_table.name}.{column}' "
+                    "has no supporting index"
+                )
+
+    # Operation filters are resolved to category ids through categories
+    category_table = Category.__table__
+    assert isinstance(category_table, Table)
+    if not _is_covered(category_table, ("operation_id",)):
+        errors.append("Column 'categories.operation_id' has no index")
+
+    # Due recurring transactions are found by their next run
+    if not _is_covered(recurring_table, ("next_run_at",)):
+        errors.append(
+            "Column 'recurring_transactions.next_run_at' has no index"
+        )
+
+    # Search matches words and trigrams within one user's transactions
+    for columns in (
+        ("user_id", "search_vector"),
+        ("user_id", "description"),
+    ):
+        if not _is_covered(table, columns):
+            errors.append(f"Search needs an index on {columns!r}")
+
+    return errors
+
+
+def main() -> int:
+    errors = find_unindexed_paths()
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,120 @@
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    NullPool,
+    Pool,
+)
+
+from config import (
+    DATABASE_POOL_MAX_OVERFLOW,
+    DATABASE_POOL_PRE_PING,
+    DATABASE_POOL_PROFILE,
+    DATABASE_POOL_RECYCLE,
+    DATABASE_POOL_SIZE,
+    DATABASE_POOL_TIMEOUT,
+    POSTGRES_URI,
+)
+from core.infrastructure.services.metrics import db_pool_checkout_seconds
+
+
+POOL_PROFILES = ("serverless", "server")
+
+
+class _CheckoutTimingPool(Pool):
+    """Observe how long getting a connection takes.
+
+    That is the wait for a free connection with a queue pool, and the
+    time to connect without one.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_seconds.observe(time.perf_counter() - started)
+
 
-from config import POSTGRES_URI
+class TimedAsyncAdaptedQueuePool(_CheckoutTimingPool, AsyncAdaptedQueuePool):
+    pass
 
 
-async_engine = create_async_engine(POSTGRES_URI, poolclass=NullPool)
+class TimedNullPool(_CheckoutTimingPool, NullPool):
+    pass
+
+
+@dataclass(frozen=True)
+class PoolStatistics:
+    profile: str
+    pool_class: str
+    size: int | None
+    checked_in: int | None
+    checked_out: int | None
+    overflow: int | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _get_engine_options(profile: str) -> dict[str, Any]:
+    if profile not in POOL_PROFILES:
+        raise ValueError(
+            f"Unknown database pool profile {profile!r}, "
+            f"expected one of {POOL_PROFILES!r}"
+        )
+    if profile == "serverless":
+        return {"poolclass": TimedNullPool}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool,
+        "pool_size": DATABASE_POOL_SIZE,
+        "max_overflow": DATABASE_POOL_MAX_OVERFLOW,
+        "pool_timeout": DATABASE_POOL_TIMEOUT,
+        "pool_recycle": DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": DATABASE_POOL_PRE_PING,
+    }
+
+
+def create_engine(profile: str = DATABASE_POOL_PROFILE) -> AsyncEngine:
+    return create_async_engine(POSTGRES_URI, **_get_engine_options(profile))
+
+
+async_engine = create_engine()
 async_session_maker = async_sessionmaker(
     async_engine, expire_on_commit=False, class_=AsyncSession
 )
 
 
+def get_pool_statistics() -> PoolStatistics:
+    pool = async_engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        return PoolStatistics(
+            profile=DATABASE_POOL_PROFILE,
+            pool_class=type(pool).__name__,
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return PoolStatistics(
+        profile=DATABASE_POOL_PROFILE,
+        pool_class=type(pool).__name__,
+        size=None,
+        checked_in=None,
+        checked_out=None,
+        overflow=None,
+    )
+
+
 class SessionContextManager:
     def __init__(self):
         self.session: AsyncSession
@@ -0,0 +1,98 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.infrastructure.services.metrics import db_query_seconds
+
+
+@dataclass
+class QueryStatistics:
+    count: int = 0
+    seconds: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def get_repeated_statements(self, threshold: int) -> dict[str, int]:
+        """Return the statements executed at least ``threshold`` times.
+
+        The same statement run again and again with different parameters
+        is the usual sign of an N+1 query.
+        """
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= threshold
+        }
+
+
+_query_statistics: ContextVar[QueryStatistics | None] = ContextVar(
+    "query_statistics", default=None
+)
+
+
+def start_query_statistics() -> QueryStatistics:
+    """Count the queries of the current context from now on.
+
+    Tasks and threads started from this context afterwards share the
+    returned statistics.
+    """
+    statistics = QueryStatistics()
+    _query_statistics.set(statistics)
+    return statistics
+
+
+def stop_query_statistics() -> None:
+    _query_statistics.set(None)
+
+
+def get_query_statistics() -> QueryStatistics | None:
+    return _query_statistics.get()
+
+
+def _before_cursor_execute(
+    connection: Connection, cursor: Any, statement: str, *args: Any
+) -> None:
+    connection.info.setdefault("query_started", []).append(
+        time.perf_counter()
+    )
+
+
+def _after_cursor_execute(
+    connection: Connection, cursor: Any, statement: str, *args: Any
+) -> None:
+    seconds = time.perf_counter() - connection.info["query_started"].pop()
+    db_query_seconds.observe(seconds)
+    statistics = _query_statistics.get()
+    if statistics is None:
+        return
+    statistics.count += 1
+    statistics.seconds += seconds
+    statistics.statements[statement] += 1
+
+
+def _handle_error(context: Any) -> None:
+    # A failed statement never reaches after_cursor_execute
+    if context.connection is not None:
+        started = context.connection.info.get("query_started")
+        if started:
+            started.pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record the statements of ``engine`` in the current statistics.
+
+    Their durations are also observed by the query duration metric.
+    """
+    sync_engine = engine.sync_engine
+    if event.contains(
+        sync_engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -0,0 +1,71 @@
+"""Bulk load exchange rates from a local CSV file.
+
+Run with ``python -m core.infrastructure.database.load_exchange_rates
+rates.csv --base EUR`` from ``src``. Every rate loaded into the table must
+be quoted against the same base currency; loading the same file again
+replaces its rates.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from core.application.transaction.exceptions.invalid_exchange_rates import (
+    InvalidExchangeRatesException,
+)
+from core.application.transaction.use_cases.currency.load_exchange_rates import (  # noqa: E501
+    LoadExchangeRatesUseCase,
+)
+from core.domain.transaction.exceptions.currency.not_found import (
+    CurrencyNotFoundException,
+)
+from core.infrastructure.database.core import SessionContextManager
+from core.infrastructure.repositories.currency import CurrencyRepository
+from core.infrastructure.repositories.exchange_rate import (
+    ExchangeRateRepository,
+)
+from core.infrastructure.services.exchange_rate_parser import (
+    CsvExchangeRateParser,
+)
+
+
+async def load(path: str, base: str, delimiter: str) -> int:
+    parser = CsvExchangeRateParser(delimiter=delimiter)
+    with open(path, "rb") as stream:
+        async with SessionContextManager() as session:
+            use_case = LoadExchangeRatesUseCase(
+                ExchangeRateRepository(session), CurrencyRepository(session)
+            )
+            try:
+                result = await use_case.execute(parser.parse(stream), base)
+            except (
+                CurrencyNotFoundException,
+                InvalidExchangeRatesException,
+            ) as e:
+                print(e, file=sys.stderr)
+                return 1
+    print(f"Loaded {result.loaded} rates")
+    if result.unknown_currency_codes:
+        print(
+            "Skipped unknown currencies: "
+            + ", ".join(result.unknown_currency_codes),
+            file=sys.stderr,
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="CSV file of dated rates")
+    parser.add_argument(
+        "--base",
+        default="EUR",
+        help="Currency code the rates are quoted against",
+    )
+    parser.add_argument("--delimiter", default=",")
+    args = parser.parse_args()
+    return asyncio.run(load(args.path, args.base.upper(), args.delimiter))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Transaction indexes.
+
+Revision ID: 3b9f1c2d7a41
+Revises: 97557ab5f703
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9f1c2d7a41"
+down_revision: Union[str, None] = "97557ab5f703"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_user_id_date",
+        "transactions",
+        ["user_id", sa.text("date DESC"), sa.text("transaction_id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transactions_user_id_category_id_date",
+        "transactions",
+        ["user_id", "category_id", "date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transactions_user_id_currency_id_date",
+        "transactions",
+        ["user_id", "currency_id", "date"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transactions_category_id",
+        "transactions",
+        ["category_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transactions_currency_id",
+        "transactions",
+        ["currency_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_currency_id", table_name="transactions")
+    op.drop_index("ix_transactions_category_id", table_name="transactions")
+    op.drop_index(
+        "ix_transactions_user_id_currency_id_date", table_name="transactions"
+    )
+    op.drop_index(
+        "ix_transactions_user_id_category_id_date", table_name="transactions"
+    )
+    op.drop_index("ix_transactions_user_id_date", table_name="transactions")
@@ -0,0 +1,97 @@
+"""Transaction rollups.
+
+Revision ID: 6d2e8a4f1c93
+Revises: 3b9f1c2d7a41
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6d2e8a4f1c93"
+down_revision: Union[str, None] = "3b9f1c2d7a41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transaction_rollups",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "month",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="First day of the month, 00:00 UTC",
+        ),
+        sa.Column("category_id", sa.UUID(), nullable=False),
+        sa.Column("currency_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "total", sa.DECIMAL(precision=18, scale=2), nullable=False
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            ["categories.category_id"],
+            onupdate="CASCADE",
+            ondelete="RESTRICT",
+        ),
+        sa.ForeignKeyConstraint(
+            ["currency_id"],
+            ["currencies.currency_id"],
+            onupdate="CASCADE",
+            ondelete="RESTRICT",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id", "month", "category_id", "currency_id"
+        ),
+    )
+    op.create_index(
+        "ix_transaction_rollups_category_id",
+        "transaction_rollups",
+        ["category_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_transaction_rollups_currency_id",
+        "transaction_rollups",
+        ["currency_id"],
+        unique=False,
+    )
+    # Backfill from the existing transactions
+    op.execute(
+        """
+        INSERT INTO transaction_rollups
+            (user_id, month, category_id, currency_id, total, count,
+             updated_at)
+        SELECT user_id, date_trunc('month', date, 'UTC'), category_id,
+               currency_id, sum(amount), count(*), now()
+        FROM transactions
+        GROUP BY user_id, date_trunc('month', date, 'UTC'), category_id,
+                 currency_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transaction_rollups_currency_id",
+        table_name="transaction_rollups",
+    )
+    op.drop_index(
+        "ix_transaction_rollups_category_id",
+        table_name="transaction_rollups",
+    )
+    op.drop_table("transaction_rollups")
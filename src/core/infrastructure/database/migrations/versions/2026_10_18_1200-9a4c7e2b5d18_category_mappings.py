@@ -0,0 +1,61 @@
+"""Category mappings.
+
+Revision ID: 9a4c7e2b5d18
+Revises: 6d2e8a4f1c93
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4c7e2b5d18"
+down_revision: Union[str, None] = "6d2e8a4f1c93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "category_mappings",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "label",
+            sa.String(length=255),
+            nullable=False,
+            comment="Normalized: single spaces, case folded",
+        ),
+        sa.Column("category_id", sa.UUID(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            ["categories.category_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("user_id", "label"),
+    )
+    op.create_index(
+        "ix_category_mappings_category_id",
+        "category_mappings",
+        ["category_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_category_mappings_category_id",
+        table_name="category_mappings",
+    )
+    op.drop_table("category_mappings")
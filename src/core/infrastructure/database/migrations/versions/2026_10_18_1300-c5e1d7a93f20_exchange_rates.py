@@ -0,0 +1,47 @@
+"""Exchange rates.
+
+Revision ID: c5e1d7a93f20
+Revises: 9a4c7e2b5d18
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e1d7a93f20"
+down_revision: Union[str, None] = "9a4c7e2b5d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "exchange_rates",
+        sa.Column("currency_id", sa.UUID(), nullable=False),
+        sa.Column("valid_from", sa.Date(), nullable=False),
+        sa.Column(
+            "rate",
+            sa.DECIMAL(precision=20, scale=10),
+            nullable=False,
+            comment=(
+                "Units of the currency per unit of the reference currency"
+            ),
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["currency_id"],
+            ["currencies.currency_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("currency_id", "valid_from"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("exchange_rates")
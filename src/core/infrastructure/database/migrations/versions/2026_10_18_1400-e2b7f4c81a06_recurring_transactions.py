@@ -0,0 +1,102 @@
+"""Recurring transactions.
+
+Revision ID: e2b7f4c81a06
+Revises: c5e1d7a93f20
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7f4c81a06"
+down_revision: Union[str, None] = "c5e1d7a93f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "recurring_transactions",
+        sa.Column("recurring_transaction_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("category_id", sa.UUID(), nullable=False),
+        sa.Column("currency_id", sa.UUID(), nullable=False),
+        sa.Column("amount", sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column("description", sa.String(length=255), nullable=True),
+        sa.Column(
+            "rule",
+            sa.String(length=255),
+            nullable=False,
+            comment="iCalendar RRULE",
+        ),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("occurrence_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "next_run_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Date of the next occurrence, NULL once the rule has ended",
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint("amount > 0", name="recurring_amount_positive"),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            ["categories.category_id"],
+            onupdate="CASCADE",
+            ondelete="RESTRICT",
+        ),
+        sa.ForeignKeyConstraint(
+            ["currency_id"],
+            ["currencies.currency_id"],
+            onupdate="CASCADE",
+            ondelete="RESTRICT",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("recurring_transaction_id"),
+    )
+    op.create_index(
+        "ix_recurring_transactions_next_run_at",
+        "recurring_transactions",
+        ["next_run_at"],
+        unique=False,
+        postgresql_where=sa.text("next_run_at IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_recurring_transactions_user_id",
+        "recurring_transactions",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_recurring_transactions_category_id",
+        "recurring_transactions",
+        ["category_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_recurring_transactions_currency_id",
+        "recurring_transactions",
+        ["currency_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    for index in (
+        "ix_recurring_transactions_currency_id",
+        "ix_recurring_transactions_category_id",
+        "ix_recurring_transactions_user_id",
+        "ix_recurring_transactions_next_run_at",
+    ):
+        op.drop_index(index, table_name="recurring_transactions")
+    op.drop_table("recurring_transactions")
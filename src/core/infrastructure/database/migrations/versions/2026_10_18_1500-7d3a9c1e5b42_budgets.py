@@ -0,0 +1,169 @@
+"""Budgets.
+
+Revision ID: 7d3a9c1e5b42
+Revises: e2b7f4c81a06
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3a9c1e5b42"
+down_revision: Union[str, None] = "e2b7f4c81a06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "budgets",
+        sa.Column("budget_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("category_id", sa.UUID(), nullable=True),
+        sa.Column("operation_id", sa.UUID(), nullable=True),
+        sa.Column("currency_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "period",
+            sa.String(length=8),
+            nullable=False,
+            comment="date_trunc unit: week, month or year",
+        ),
+        sa.Column(
+            "amount_limit", sa.DECIMAL(precision=18, scale=2), nullable=False
+        ),
+        sa.Column(
+            "thresholds",
+            postgresql.ARRAY(sa.Integer()),
+            nullable=False,
+            comment="Percents of the limit that raise an alert",
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "(category_id IS NULL) <> (operation_id IS NULL)",
+            name="budget_category_or_operation",
+        ),
+        sa.CheckConstraint(
+            "period IN ('week', 'month', 'year')", name="budget_period_check"
+        ),
+        sa.CheckConstraint("amount_limit > 0", name="budget_limit_positive"),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            ["categories.category_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["currency_id"],
+            ["currencies.currency_id"],
+            onupdate="CASCADE",
+            ondelete="RESTRICT",
+        ),
+        sa.ForeignKeyConstraint(
+            ["operation_id"],
+            ["operations.operation_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("budget_id"),
+    )
+    op.create_index(
+        "ix_budgets_user_id_currency_id",
+        "budgets",
+        ["user_id", "currency_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_budgets_category_id", "budgets", ["category_id"], unique=False
+    )
+    op.create_index(
+        "ix_budgets_operation_id", "budgets", ["operation_id"], unique=False
+    )
+    op.create_index(
+        "ix_budgets_currency_id", "budgets", ["currency_id"], unique=False
+    )
+
+    op.create_table(
+        "budget_spend",
+        sa.Column("budget_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "period_start",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="First instant of the period, UTC",
+        ),
+        sa.Column("spent", sa.DECIMAL(precision=18, scale=2), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["budget_id"],
+            ["budgets.budget_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("budget_id", "period_start"),
+    )
+
+    op.create_table(
+        "budget_alerts",
+        sa.Column(
+            "alert_id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("budget_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "period_start", sa.DateTime(timezone=True), nullable=False
+        ),
+        sa.Column("threshold", sa.Integer(), nullable=False),
+        sa.Column(
+            "spent",
+            sa.DECIMAL(precision=18, scale=2),
+            nullable=False,
+            comment="Spend when the threshold was reached",
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["budget_id"],
+            ["budgets.budget_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("alert_id"),
+        sa.UniqueConstraint("budget_id", "period_start", "threshold"),
+    )
+    op.create_index(
+        "ix_budget_alerts_created_at_undelivered",
+        "budget_alerts",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("delivered_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_budget_alerts_created_at_undelivered", table_name="budget_alerts"
+    )
+    op.drop_table("budget_alerts")
+    op.drop_table("budget_spend")
+    for index in (
+        "ix_budgets_currency_id",
+        "ix_budgets_operation_id",
+        "ix_budgets_category_id",
+        "ix_budgets_user_id_currency_id",
+    ):
+        op.drop_index(index, table_name="budgets")
+    op.drop_table("budgets")
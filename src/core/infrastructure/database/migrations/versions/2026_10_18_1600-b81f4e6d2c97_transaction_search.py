@@ -0,0 +1,63 @@
+"""Transaction description search.
+
+Revision ID: b81f4e6d2c97
+Revises: 7d3a9c1e5b42
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b81f4e6d2c97"
+down_revision: Union[str, None] = "7d3a9c1e5b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gin lets user_id lead the GIN indexes below
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Stored generated column, so adding it rewrites the table once
+    op.add_column(
+        "transactions",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(description, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_transactions_user_id_search_vector",
+        "transactions",
+        ["user_id", "search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_transactions_user_id_description_trgm",
+        "transactions",
+        ["user_id", "description"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_transactions_user_id_description_trgm", table_name="transactions"
+    )
+    op.drop_index(
+        "ix_transactions_user_id_search_vector", table_name="transactions"
+    )
+    op.drop_column("transactions", "search_vector")
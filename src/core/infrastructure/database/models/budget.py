@@ -0,0 +1,140 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    DECIMAL,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from core.domain.transaction.entities.budget import BudgetEntity
+from core.domain.transaction.enums.budget import BudgetPeriod
+from core.domain.transaction.value_objects.money import Money
+from core.infrastructure.database.models.base import Base, updated_at
+from core.infrastructure.database.models.currency import Currency
+
+
+class Budget(Base):
+    __tablename__ = "budgets"
+
+    budget_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "users.user_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    category_id: Mapped[UUID | None] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "categories.category_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=True,
+    )
+    operation_id: Mapped[UUID | None] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "operations.operation_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=True,
+    )
+    currency_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "currencies.currency_id",
+            ondelete="RESTRICT",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    period: Mapped[str] = mapped_column(
+        String(8),
+        nullable=False,
+        comment="date_trunc unit: week, month or year",
+    )
+    amount_limit: Mapped[Decimal] = mapped_column(
+        DECIMAL(precision=18, scale=2),
+        nullable=False,
+    )
+    thresholds: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer),
+        nullable=False,
+        comment="Percents of the limit that raise an alert",
+    )
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    updated_at: Mapped[updated_at]
+
+    currency: Mapped[Currency] = relationship("Currency")
+
+    __table_args__ = (
+        CheckConstraint(
+            "(category_id IS NULL) <> (operation_id IS NULL)",
+            name="budget_category_or_operation",
+        ),
+        CheckConstraint(
+            "period IN ('week', 'month', 'year')", name="budget_period_check"
+        ),
+        CheckConstraint("amount_limit > 0", name="budget_limit_positive"),
+    )
+
+    @staticmethod
+    def from_entity(entity: BudgetEntity) -> "Budget":
+        return Budget(
+            budget_id=entity.budget_id,
+            user_id=entity.user_id,
+            category_id=entity.category_id,
+            operation_id=entity.operation_id,
+            currency_id=entity.limit.currency.currency_id,
+            period=entity.period.value,
+            amount_limit=entity.limit.amount,
+            thresholds=entity.thresholds,
+            created_at=entity.created_at,
+        )
+
+    def to_entity(self) -> BudgetEntity:
+        return BudgetEntity(
+            budget_id=self.budget_id,
+            user_id=self.user_id,
+            category_id=self.category_id,
+            operation_id=self.operation_id,
+            period=BudgetPeriod(self.period),
+            limit=Money(
+                amount=self.amount_limit,
+                currency=self.currency.to_entity(),
+            ),
+            thresholds=list(self.thresholds),
+            created_at=self.created_at,
+        )
+
+
+# Every transaction write looks up the budgets of its user and currency
+Index(
+    "ix_budgets_user_id_currency_id",
+    Budget.user_id,
+    Budget.currency_id,
+)
+Index("ix_budgets_category_id", Budget.category_id)
+Index("ix_budgets_operation_id", Budget.operation_id)
+Index("ix_budgets_currency_id", Budget.currency_id)
@@ -0,0 +1,82 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    DECIMAL,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from core.domain.transaction.entities.budget_alert import BudgetAlertEntity
+from core.infrastructure.database.models.base import Base, created_at
+from core.infrastructure.database.models.budget import Budget
+
+
+class BudgetAlert(Base):
+    """Outbox of budget threshold alerts awaiting delivery."""
+
+    __tablename__ = "budget_alerts"
+
+    alert_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
+    budget_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "budgets.budget_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    period_start: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    threshold: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    spent: Mapped[Decimal] = mapped_column(
+        DECIMAL(precision=18, scale=2),
+        nullable=False,
+        comment="Spend when the threshold was reached",
+    )
+    created_at: Mapped[created_at]
+    delivered_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    budget: Mapped[Budget] = relationship("Budget")
+
+    # A threshold alerts once per period, even if spend dips and recovers
+    __table_args__ = (
+        UniqueConstraint("budget_id", "period_start", "threshold"),
+    )
+
+    def to_entity(self) -> BudgetAlertEntity:
+        return BudgetAlertEntity(
+            alert_id=self.alert_id,
+            budget=self.budget.to_entity(),
+            period_start=self.period_start,
+            threshold=self.threshold,
+            spent=self.spent,
+            created_at=self.created_at,
+        )
+
+
+Index(
+    "ix_budget_alerts_created_at_undelivered",
+    BudgetAlert.created_at,
+    postgresql_where=BudgetAlert.delivered_at.is_(None),
+)
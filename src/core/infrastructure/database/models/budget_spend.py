@@ -0,0 +1,41 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import DECIMAL, DateTime, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.infrastructure.database.models.base import Base, updated_at
+
+
+class BudgetSpend(Base):
+    """Running spend of a budget in one period.
+
+    Kept in step with ``transactions`` by ``TransactionRepository`` in the
+    same database transaction as every write, like the rollups.
+    """
+
+    __tablename__ = "budget_spend"
+
+    budget_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "budgets.budget_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    period_start: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="First instant of the period, UTC",
+    )
+    spent: Mapped[Decimal] = mapped_column(
+        DECIMAL(precision=18, scale=2),
+        nullable=False,
+    )
+    updated_at: Mapped[updated_at]
+
+    __table_args__ = (PrimaryKeyConstraint("budget_id", "period_start"),)
@@ -0,0 +1,56 @@
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index, PrimaryKeyConstraint, String
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.domain.transaction.entities.category_mapping import (
+    CategoryMappingEntity,
+)
+from core.infrastructure.database.models.base import Base, updated_at
+
+
+class CategoryMapping(Base):
+    """Category chosen for a statement label when importing transactions."""
+
+    __tablename__ = "category_mappings"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "users.user_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    label: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Normalized: single spaces, case folded",
+    )
+    category_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "categories.category_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    updated_at: Mapped[updated_at]
+
+    __table_args__ = (PrimaryKeyConstraint("user_id", "label"),)
+
+    def to_entity(self) -> CategoryMappingEntity:
+        return CategoryMappingEntity(
+            user_id=self.user_id,
+            label=self.label,
+            category_id=self.category_id,
+        )
+
+
+Index(
+    "ix_category_mappings_category_id",
+    CategoryMapping.category_id,
+)
@@ -0,0 +1,49 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import DECIMAL, Date, ForeignKey, PrimaryKeyConstraint
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.domain.transaction.entities.exchange_rate import ExchangeRateEntity
+from core.infrastructure.database.models.base import Base, updated_at
+
+
+class ExchangeRate(Base):
+    """Dated rates of currencies against one reference currency.
+
+    The primary key doubles as the index for "rate in effect on a date":
+    the last row of a currency with ``valid_from`` on or before it.
+    """
+
+    __tablename__ = "exchange_rates"
+
+    currency_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "currencies.currency_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    valid_from: Mapped[datetime.date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+    rate: Mapped[Decimal] = mapped_column(
+        DECIMAL(precision=20, scale=10),
+        nullable=False,
+        comment="Units of the currency per unit of the reference currency",
+    )
+    updated_at: Mapped[updated_at]
+
+    __table_args__ = (PrimaryKeyConstraint("currency_id", "valid_from"),)
+
+    def to_entity(self) -> ExchangeRateEntity:
+        return ExchangeRateEntity(
+            currency_id=self.currency_id,
+            valid_from=self.valid_from,
+            rate=self.rate,
+        )
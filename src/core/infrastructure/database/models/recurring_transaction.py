@@ -0,0 +1,159 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    DECIMAL,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from core.domain.transaction.entities.recurring_transaction import (
+    RecurringTransactionEntity,
+)
+from core.domain.transaction.value_objects.money import Money
+from core.domain.transaction.value_objects.recurrence_rule import (
+    RecurrenceRule,
+)
+from core.infrastructure.database.models.base import (
+    Base,
+    created_at,
+    updated_at,
+)
+from core.infrastructure.database.models.category import Category
+from core.infrastructure.database.models.currency import Currency
+
+
+class RecurringTransaction(Base):
+    """Template of a transaction created on a schedule."""
+
+    __tablename__ = "recurring_transactions"
+
+    recurring_transaction_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        primary_key=True,
+        default=uuid4,
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "users.user_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    category_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "categories.category_id",
+            ondelete="RESTRICT",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    currency_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "currencies.currency_id",
+            ondelete="RESTRICT",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    amount: Mapped[Decimal] = mapped_column(
+        DECIMAL(precision=10, scale=2),
+        nullable=False,
+    )
+    description: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    rule: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="iCalendar RRULE",
+    )
+    start_date: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    occurrence_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    next_run_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Date of the next occurrence, NULL once the rule has ended",
+    )
+
+    created_at: Mapped[created_at]
+    updated_at: Mapped[updated_at]
+
+    category: Mapped[Category] = relationship("Category")
+    currency: Mapped[Currency] = relationship("Currency")
+
+    __table_args__ = (
+        CheckConstraint("amount > 0", name="recurring_amount_positive"),
+    )
+
+    @staticmethod
+    def from_entity(
+        entity: RecurringTransactionEntity,
+    ) -> "RecurringTransaction":
+        return RecurringTransaction(
+            recurring_transaction_id=entity.recurring_transaction_id,
+            user_id=entity.user_id,
+            category_id=entity.category.category_id,
+            currency_id=entity.money.currency.currency_id,
+            amount=entity.money.amount,
+            description=entity.description,
+            rule=str(entity.rule),
+            start_date=entity.start_date,
+            occurrence_count=entity.occurrence_count,
+            next_run_at=entity.next_run_at,
+        )
+
+    def to_entity(self) -> RecurringTransactionEntity:
+        return RecurringTransactionEntity(
+            recurring_transaction_id=self.recurring_transaction_id,
+            user_id=self.user_id,
+            category=self.category.to_entity(),
+            money=Money(
+                amount=self.amount,
+                currency=self.currency.to_entity(),
+            ),
+            description=self.description,
+            rule=RecurrenceRule.parse(self.rule),
+            start_date=self.start_date,
+            occurrence_count=self.occurrence_count,
+        )
+
+
+# The scheduler finds due templates through this index alone; ended
+# templates are left out of it
+Index(
+    "ix_recurring_transactions_next_run_at",
+    RecurringTransaction.next_run_at,
+    postgresql_where=RecurringTransaction.next_run_at.is_not(None),
+)
+Index(
+    "ix_recurring_transactions_user_id",
+    RecurringTransaction.user_id,
+)
+Index(
+    "ix_recurring_transactions_category_id",
+    RecurringTransaction.category_id,
+)
+Index(
+    "ix_recurring_transactions_currency_id",
+    RecurringTransaction.currency_id,
+)
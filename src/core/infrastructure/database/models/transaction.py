@@ -2,7 +2,16 @@ import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
 
-from sqlalchemy import DECIMAL, CheckConstraint, DateTime, ForeignKey, String
+from sqlalchemy import (
+    DECIMAL,
+    CheckConstraint,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -60,6 +69,16 @@ class Transaction(Base):
         DateTime(timezone=True),
         nullable=False,
     )
+    # The 'simple' configuration neither stems nor drops stop words, so
+    # descriptions in any language are matched word for word
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', coalesce(description, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     updated_at: Mapped[updated_at]
 
     category: Mapped[Category] = relationship(
@@ -97,3 +116,40 @@ class Transaction(Base):
             description=self.description,
             date=self.date,
         )
+
+
+Index(
+    "ix_transactions_user_id_date",
+    Transaction.user_id,
+    Transaction.date.desc(),
+    Transaction.transaction_id.desc(),
+)
+Index(
+    "ix_transactions_user_id_category_id_date",
+    Transaction.user_id,
+    Transaction.category_id,
+    Transaction.date,
+)
+Index(
+    "ix_transactions_user_id_currency_id_date",
+    Transaction.user_id,
+    Transaction.currency_id,
+    Transaction.date,
+)
+# Search within a user's transactions; the user_id column needs btree_gin
+Index(
+    "ix_transactions_user_id_search_vector",
+    Transaction.user_id,
+    Transaction.search_vector,
+    postgresql_using="gin",
+)
+Index(
+    "ix_transactions_user_id_description_trgm",
+    Transaction.user_id,
+    Transaction.description,
+    postgresql_using="gin",
+    postgresql_ops={"description": "gin_trgm_ops"},
+)
+# Foreign key lookups for RESTRICT checks when a category/currency is deleted
+Index("ix_transactions_category_id", Transaction.category_id)
+Index("ix_transactions_currency_id", Transaction.currency_id)
@@ -0,0 +1,82 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    DECIMAL,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.infrastructure.database.models.base import Base, updated_at
+
+
+class TransactionRollup(Base):
+    """Monthly totals of a user's transactions per category and currency.
+
+    Kept in step with ``transactions`` by ``TransactionRepository`` in the
+    same database transaction as every write.
+    """
+
+    __tablename__ = "transaction_rollups"
+
+    user_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "users.user_id",
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    month: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="First day of the month, 00:00 UTC",
+    )
+    category_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "categories.category_id",
+            ondelete="RESTRICT",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    currency_id: Mapped[UUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey(
+            "currencies.currency_id",
+            ondelete="RESTRICT",
+            onupdate="CASCADE",
+        ),
+        nullable=False,
+    )
+    total: Mapped[Decimal] = mapped_column(
+        DECIMAL(precision=18, scale=2),
+        nullable=False,
+    )
+    count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    updated_at: Mapped[updated_at]
+
+    __table_args__ = (
+        PrimaryKeyConstraint("user_id", "month", "category_id", "currency_id"),
+    )
+
+
+Index(
+    "ix_transaction_rollups_category_id",
+    TransactionRollup.category_id,
+)
+Index(
+    "ix_transaction_rollups_currency_id",
+    TransactionRollup.currency_id,
+)
@@ -0,0 +1,38 @@
+"""Rebuild ``transaction_rollups`` from ``transactions``.
+
+Run with ``python -m core.infrastructure.database.rollups`` from ``src``
+to backfill every user, or pass ``--user-id`` to repair a single user.
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from core.infrastructure.database.core import SessionContextManager
+from core.infrastructure.repositories.transaction_rollup import (
+    TransactionRollupRepository,
+)
+
+
+async def rebuild_rollups(user_id: UUID | None = None) -> None:
+    async with SessionContextManager() as session:
+        await TransactionRollupRepository(session).rebuild(user_id)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Rebuild transaction rollups from transactions."
+    )
+    parser.add_argument(
+        "--user-id",
+        type=UUID,
+        default=None,
+        help="rebuild only this user",
+    )
+    args = parser.parse_args()
+    asyncio.run(rebuild_rollups(args.user_id))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import (
+    Select,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from core.domain.transaction.entities.budget import BudgetEntity
+from core.domain.transaction.exceptions.budget.not_found import (
+    BudgetNotFoundException,
+)
+from core.domain.transaction.repositories.budget import IBudgetRepository
+from core.infrastructure.database.models.budget import Budget
+from core.infrastructure.database.models.budget_spend import BudgetSpend
+from core.infrastructure.database.models.category import Category
+from core.infrastructure.database.models.transaction import Transaction
+from core.infrastructure.repositories.budget_spend import (
+    BudgetSpendRepository,
+)
+from core.infrastructure.repositories.transaction_rollup import utc_date_trunc
+
+
+class BudgetRepository(IBudgetRepository):
+    model = Budget
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def _select(self) -> Select:
+        return select(self.model).options(
+            joinedload(self.model.currency, innerjoin=True)
+        )
+
+    async def save(self, budget: BudgetEntity) -> BudgetEntity:
+        # Transaction writes of the user wait until the starting spend is
+        # committed, and the starting spend sees the writes committed
+        # before it
+        await BudgetSpendRepository(self._session).lock_users({budget.user_id})
+        model_instance = self.model.from_entity(budget)
+        await self._session.execute(
+            insert(self.model).values(
+                budget_id=model_instance.budget_id,
+                user_id=model_instance.user_id,
+                category_id=model_instance.category_id,
+                operation_id=model_instance.operation_id,
+                currency_id=model_instance.currency_id,
+                period=model_instance.period,
+                amount_limit=model_instance.amount_limit,
+                thresholds=model_instance.thresholds,
+                created_at=model_instance.created_at,
+            )
+        )
+
+        # The only SUM over history a budget needs; from here on spend is
+        # kept up to date by the transaction writes. Transactions dated in
+        # later periods start the spend of their own periods
+        period_start = utc_date_trunc(
+            budget.period.value, Transaction.date
+        ).label("period_start")
+        source = (
+            select(
+                literal(budget.budget_id),
+                period_start,
+                func.sum(Transaction.amount),
+            )
+            .where(
+                Transaction.user_id == budget.user_id,
+                Transaction.currency_id == budget.limit.currency.currency_id,
+                Transaction.date >= budget.get_period_start(budget.created_at),
+            )
+            .group_by(period_start)
+        )
+        if budget.category_id is not None:
+            source = source.where(
+                Transaction.category_id == budget.category_id
+            )
+        else:
+            source = source.where(
+                Transaction.category_id.in_(
+                    select(Category.category_id).filter(
+                        Category.operation_id == budget.operation_id
+                    )
+                )
+            )
+        await self._session.execute(
+            insert(BudgetSpend).from_select(
+                ["budget_id", "period_start", "spent"], source
+            )
+        )
+        await self._session.commit()
+        return budget
+
+    async def get_by_id(self, budget_id: UUID) -> BudgetEntity:
+        stmt = self._select().filter_by(budget_id=budget_id)
+        result = await self._session.execute(stmt)
+        model_instance = result.scalars().first()
+        if model_instance is None:
+            raise BudgetNotFoundException(
+                f"Budget with id {str(budget_id)!r} not found"
+            )
+        return model_instance.to_entity()
+
+    async def get_by_user(self, user_id: UUID) -> list[BudgetEntity]:
+        stmt = (
+            self._select()
+            .filter_by(user_id=user_id)
+            .order_by(self.model.created_at, self.model.budget_id)
+        )
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
+    async def delete(self, budget_id: UUID) -> None:
+        stmt = delete(self.model).filter_by(budget_id=budget_id)
+        result = await self._session.execute(stmt)
+        if result.rowcount == 0:
+            raise BudgetNotFoundException(
+                f"Budget with id {str(budget_id)!r} not found"
+            )
+        await self._session.commit()
+
+    async def get_spent(
+        self, periods: list[tuple[UUID, datetime.datetime]]
+    ) -> dict[tuple[UUID, datetime.datetime], Decimal]:
+        if not periods:
+            return {}
+        # Primary key lookups, one per period
+        stmt = select(
+            BudgetSpend.budget_id,
+            BudgetSpend.period_start,
+            BudgetSpend.spent,
+        ).where(
+            tuple_(BudgetSpend.budget_id, BudgetSpend.period_start).in_(
+                periods
+            )
+        )
+        result = await self._session.execute(stmt)
+        return {
+            (budget_id, period_start): spent
+            for budget_id, period_start, spent in result.all()
+        }
@@ -0,0 +1,46 @@
+import datetime
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from core.domain.transaction.entities.budget_alert import BudgetAlertEntity
+from core.domain.transaction.repositories.budget_alert import (
+    IBudgetAlertRepository,
+)
+from core.infrastructure.database.models.budget import Budget
+from core.infrastructure.database.models.budget_alert import BudgetAlert
+
+
+class BudgetAlertRepository(IBudgetAlertRepository):
+    model = BudgetAlert
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def lock_undelivered(self, limit: int) -> list[BudgetAlertEntity]:
+        # Only the alerts are locked, not the rows joined to them
+        stmt = (
+            select(self.model)
+            .options(
+                joinedload(self.model.budget, innerjoin=True).joinedload(
+                    Budget.currency, innerjoin=True
+                )
+            )
+            .where(self.model.delivered_at.is_(None))
+            .order_by(self.model.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=self.model)
+        )
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
+    async def mark_delivered(self, alert_ids: list[UUID]) -> None:
+        if alert_ids:
+            await self._session.execute(
+                update(self.model)
+                .where(self.model.alert_id.in_(alert_ids))
+                .values(delivered_at=datetime.datetime.now(datetime.UTC))
+            )
+        await self._session.commit()
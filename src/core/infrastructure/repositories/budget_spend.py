@@ -0,0 +1,169 @@
+import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.transaction.entities.transaction import TransactionEntity
+
+
+def day_start(date: datetime.datetime) -> datetime.datetime:
+    """Return the first instant of the UTC day containing ``date``."""
+    date = date.astimezone(datetime.UTC)
+    return date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# First key of the advisory locks serializing the spend of one user
+BUDGET_SPEND_LOCK = 0x42756467
+
+
+def get_user_lock_key(user_id: UUID) -> int:
+    """Return the second key of the advisory lock of ``user_id``.
+
+    Collisions only make two users wait for each other.
+    """
+    return int.from_bytes(user_id.bytes[:4], "big", signed=True)
+
+
+# Matches the deltas to the budgets of their user, currency and category
+# or operation, adds them to the spend of the budget periods they fall in
+# and queues an alert for every threshold an increase crosses
+_APPLY_DELTAS = text(
+    """
+WITH deltas AS (
+    SELECT *
+    FROM unnest(
+        CAST(:user_ids AS uuid[]),
+        CAST(:days AS timestamptz[]),
+        CAST(:category_ids AS uuid[]),
+        CAST(:currency_ids AS uuid[]),
+        CAST(:amounts AS numeric[])
+    ) AS d(user_id, day, category_id, currency_id, amount)
+),
+matched AS (
+    SELECT
+        b.budget_id,
+        date_trunc(b.period, d.day, 'UTC') AS period_start,
+        sum(d.amount) AS delta
+    FROM deltas d
+    JOIN categories c ON c.category_id = d.category_id
+    JOIN budgets b
+        ON b.user_id = d.user_id
+        AND b.currency_id = d.currency_id
+        AND (
+            b.category_id = d.category_id
+            OR b.operation_id = c.operation_id
+        )
+    WHERE date_trunc(b.period, d.day, 'UTC')
+        >= date_trunc(b.period, b.created_at, 'UTC')
+    GROUP BY b.budget_id, period_start
+),
+spend AS (
+    INSERT INTO budget_spend (budget_id, period_start, spent, updated_at)
+    SELECT budget_id, period_start, delta, now()
+    FROM matched
+    ON CONFLICT (budget_id, period_start) DO UPDATE
+    SET spent = budget_spend.spent + excluded.spent, updated_at = now()
+    RETURNING budget_id, period_start, spent
+)
+INSERT INTO budget_alerts (
+    budget_id, period_start, threshold, spent, created_at
+)
+SELECT s.budget_id, s.period_start, t.threshold, s.spent, now()
+FROM spend s
+JOIN matched m USING (budget_id, period_start)
+JOIN budgets b ON b.budget_id = s.budget_id
+CROSS JOIN LATERAL unnest(b.thresholds) AS t(threshold)
+WHERE m.delta > 0
+    AND s.spent - m.delta < b.amount_limit * t.threshold / 100
+    AND s.spent >= b.amount_limit * t.threshold / 100
+ON CONFLICT (budget_id, period_start, threshold) DO NOTHING
+"""
+)
+
+
+class BudgetSpendRepository:
+    """Keep ``budget_spend`` in step with transaction writes.
+
+    Never commits, so spend changes and the alerts they raise land in
+    the same database transaction as the write they follow. Each chunk of
+    deltas is a single statement however many budgets it touches.
+    """
+
+    chunk_size = 5000
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(
+        self,
+        user_id: UUID,
+        date: datetime.datetime,
+        category_id: UUID,
+        currency_id: UUID,
+        amount: Decimal,
+    ) -> None:
+        """Add ``amount`` to the budgets ``date``'s transaction counts to.
+
+        A negative amount removes a transaction and raises no alert.
+        """
+        await self._apply(
+            {(user_id, day_start(date), category_id, currency_id): amount}
+        )
+
+    async def add_transactions(
+        self, transactions: list[TransactionEntity]
+    ) -> None:
+        """Add a batch of new transactions to the budgets they count to.
+
+        Amounts are summed per day first, as no period is shorter.
+        """
+        deltas: dict[tuple[Any, ...], Decimal] = {}
+        for transaction in transactions:
+            key = (
+                transaction.user_id,
+                day_start(transaction.date),
+                transaction.category.category_id,
+                transaction.money.currency.currency_id,
+            )
+            deltas[key] = deltas.get(key, Decimal(0)) + (
+                transaction.money.amount
+            )
+        await self._apply(deltas)
+
+    async def lock_users(self, user_ids: set[UUID]) -> None:
+        """Wait for budgets being created for ``user_ids``, and block them.
+
+        Held until the database transaction ends, so a budget's starting
+        spend either includes a concurrent transaction write or is
+        created before that write applies its delta. Keys are taken in
+        order, so two writers never deadlock on them.
+        """
+        for key in sorted(
+            {get_user_lock_key(user_id) for user_id in user_ids}
+        ):
+            await self._session.execute(
+                select(func.pg_advisory_xact_lock(BUDGET_SPEND_LOCK, key))
+            )
+
+    async def _apply(self, deltas: dict[tuple[Any, ...], Decimal]) -> None:
+        if not deltas:
+            return
+        # A separate statement, so the deltas see budgets committed
+        # while waiting for the lock
+        await self.lock_users({key[0] for key in deltas})
+        items = list(deltas.items())
+        size = self.chunk_size
+        for chunk in (items[i:i + size] for i in range(0, len(items), size)):
+            await self._session.execute(
+                _APPLY_DELTAS,
+                {
+                    "user_ids": [key[0] for key, _ in chunk],
+                    "days": [key[1] for key, _ in chunk],
+                    "category_ids": [key[2] for key, _ in chunk],
+                    "currency_ids": [key[3] for key, _ in chunk],
+                    "amounts": [amount for _, amount in chunk],
+                },
+            )
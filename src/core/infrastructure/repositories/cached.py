@@ -0,0 +1,233 @@
+import copy
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.transaction.entities.category import CategoryEntity
+from core.domain.transaction.entities.currency import CurrencyEntity
+from core.domain.transaction.entities.operation import OperationEntity
+from core.domain.transaction.exceptions.category.not_found import (
+    CategoryNotFoundException,
+)
+from core.domain.transaction.exceptions.currency.not_found import (
+    CurrencyNotFoundException,
+)
+from core.domain.transaction.exceptions.operation.not_found import (
+    OperationNotFoundException,
+)
+from core.domain.transaction.repositories.category import ICategoryRepository
+from core.domain.transaction.repositories.currency import ICurrencyRepository
+from core.domain.transaction.repositories.operation import (
+    IOperationRepository,
+)
+from core.infrastructure.repositories.category import CategoryRepository
+from core.infrastructure.repositories.currency import CurrencyRepository
+from core.infrastructure.repositories.operation import OperationRepository
+from core.infrastructure.services.reference_cache import ReferenceDataCache
+
+
+# Reads are served from a full snapshot of the table. An id missing from
+# the snapshot may have been created by another worker, so it is looked up
+# in the database once and the snapshot is dropped if it exists. Id lookups
+# go through an index kept with the snapshot and copy only what they
+# return.
+
+ID_INDEX = "by_id"
+
+
+class CachedOperationRepository(IOperationRepository):
+    kind = "operations"
+
+    def __init__(self, session: AsyncSession, cache: ReferenceDataCache):
+        self._session = session
+        self._cache = cache
+        self._repository = OperationRepository(session)
+
+    async def save(self, operation: OperationEntity) -> OperationEntity:
+        await self._cache.publish(self._session, self.kind)
+        operation = await self._repository.save(operation)
+        self._cache.invalidate(self.kind)
+        return operation
+
+    async def get_by_id(self, operation_id: UUID) -> OperationEntity:
+        operation = (await self._get_index()).get(operation_id)
+        if operation is not None:
+            return copy.deepcopy(operation)
+        operation = await self._repository.get_by_id(operation_id)
+        self._cache.invalidate(self.kind)
+        return operation
+
+    async def get_by_name(self, name: str) -> OperationEntity:
+        for operation in await self.get_all():
+            if operation.operation_name == name:
+                return operation
+        raise OperationNotFoundException(
+            f"Operation with name {name!r} not found"
+        )
+
+    async def get_all(self) -> list[OperationEntity]:
+        return await self._cache.get_or_load(
+            self.kind, self._repository.get_all
+        )
+
+    async def _get_index(self) -> dict[UUID, OperationEntity]:
+        return await self._cache.get_or_build(
+            self.kind,
+            ID_INDEX,
+            self._repository.get_all,
+            lambda operations: {
+                operation.operation_id: operation for operation in operations
+            },
+        )
+
+    async def delete(self, operation_id: UUID) -> None:
+        await self._cache.publish(self._session, self.kind)
+        await self._repository.delete(operation_id)
+        self._cache.invalidate(self.kind)
+
+
+class CachedCategoryRepository(ICategoryRepository):
+    kind = "categories"
+
+    def __init__(self, session: AsyncSession, cache: ReferenceDataCache):
+        self._session = session
+        self._cache = cache
+        self._repository = CategoryRepository(session)
+
+    async def save(self, category: CategoryEntity) -> CategoryEntity:
+        await self._cache.publish(self._session, self.kind)
+        category = await self._repository.save(category)
+        self._cache.invalidate(self.kind)
+        return category
+
+    async def get_by_id(self, category_id: UUID) -> CategoryEntity:
+        category = (await self._get_index()).get(category_id)
+        if category is not None:
+            return copy.deepcopy(category)
+        category = await self._repository.get_by_id(category_id)
+        self._cache.invalidate(self.kind)
+        return category
+
+    async def get_by_ids(
+        self, category_ids: list[UUID]
+    ) -> list[CategoryEntity]:
+        index = await self._get_index()
+        wanted = set(category_ids)
+        categories = [
+            copy.deepcopy(index[category_id])
+            for category_id in dict.fromkeys(category_ids)
+            if category_id in index
+        ]
+        missing = wanted - index.keys()
+        if missing:
+            found = await self._repository.get_by_ids(list(missing))
+            if found:
+                categories.extend(found)
+                self._cache.invalidate(self.kind)
+        return categories
+
+    async def get_by_name(self, name: str) -> CategoryEntity:
+        for category in await self.get_all():
+            if category.category_name == name:
+                return category
+        raise CategoryNotFoundException(
+            f"Category with name {name!r} not found"
+        )
+
+    async def get_all(self) -> list[CategoryEntity]:
+        return await self._cache.get_or_load(
+            self.kind, self._repository.get_all
+        )
+
+    async def _get_index(self) -> dict[UUID, CategoryEntity]:
+        return await self._cache.get_or_build(
+            self.kind,
+            ID_INDEX,
+            self._repository.get_all,
+            lambda categories: {
+                category.category_id: category for category in categories
+            },
+        )
+
+    async def get_by_operation_id(
+        self, operation_id: UUID
+    ) -> list[CategoryEntity]:
+        return [
+            category
+            for category in await self.get_all()
+            if category.operation.operation_id == operation_id
+        ]
+
+    async def delete(self, category_id: UUID) -> None:
+        await self._cache.publish(self._session, self.kind)
+        await self._repository.delete(category_id)
+        self._cache.invalidate(self.kind)
+
+
+class CachedCurrencyRepository(ICurrencyRepository):
+    kind = "currencies"
+
+    def __init__(self, session: AsyncSession, cache: ReferenceDataCache):
+        self._session = session
+        self._cache = cache
+        self._repository = CurrencyRepository(session)
+
+    async def save(self, currency: CurrencyEntity) -> CurrencyEntity:
+        await self._cache.publish(self._session, self.kind)
+        currency = await self._repository.save(currency)
+        self._cache.invalidate(self.kind)
+        return currency
+
+    async def get_by_id(self, currency_id: UUID) -> CurrencyEntity:
+        currency = (await self._get_index()).get(currency_id)
+        if currency is not None:
+            return copy.deepcopy(currency)
+        currency = await self._repository.get_by_id(currency_id)
+        self._cache.invalidate(self.kind)
+        return currency
+
+    async def get_by_ids(
+        self, currency_ids: list[UUID]
+    ) -> list[CurrencyEntity]:
+        index = await self._get_index()
+        wanted = set(currency_ids)
+        currencies = [
+            copy.deepcopy(index[currency_id])
+            for currency_id in dict.fromkeys(currency_ids)
+            if currency_id in index
+        ]
+        missing = wanted - index.keys()
+        if missing:
+            found = await self._repository.get_by_ids(list(missing))
+            if found:
+                currencies.extend(found)
+                self._cache.invalidate(self.kind)
+        return currencies
+
+    async def get_by_name(self, name: str) -> CurrencyEntity:
+        for currency in await self.get_all():
+            if currency.currency_name == name:
+                return currency
+        raise CurrencyNotFoundException(
+            f"Currency with name {name!r} not found"
+        )
+
+    async def get_all(self) -> list[CurrencyEntity]:
+        return await self._cache.get_or_load(
+            self.kind, self._repository.get_all
+        )
+
+    async def _get_index(self) -> dict[UUID, CurrencyEntity]:
+        return await self._cache.get_or_build(
+            self.kind,
+            ID_INDEX,
+            self._repository.get_all,
+            lambda currencies: {
+                currency.currency_id: currency for currency in currencies
+            },
+        )
+
+    async def delete(self, currency_id: UUID) -> None:
+        await self._cache.publish(self._session, self.kind)
+        await self._repository.delete(currency_id)
+        self._cache.invalidate(self.kind)
@@ -56,6 +56,19 @@ class CategoryRepository(ICategoryRepository):
             )
         return model_instance.to_entity()
 
+    async def get_by_ids(
+        self, category_ids: list[UUID]
+    ) -> list[CategoryEntity]:
+        if not category_ids:
+            return []
+        stmt = (
+            select(self.model)
+            .options(selectinload(self.model.operation))
+            .filter(self.model.category_id.in_(category_ids))
+        )
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
     async def get_by_operation_id(
         self, operation_id: UUID
     ) -> list[CategoryEntity]:
@@ -0,0 +1,76 @@
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.transaction.entities.category_mapping import (
+    CategoryMappingEntity,
+)
+from core.domain.transaction.repositories.category_mapping import (
+    ICategoryMappingRepository,
+)
+from core.infrastructure.database.models.category_mapping import (
+    CategoryMapping,
+)
+
+
+class CategoryMappingRepository(ICategoryMappingRepository):
+    model = CategoryMapping
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_by_user(
+        self, user_id: UUID
+    ) -> list[CategoryMappingEntity]:
+        stmt = (
+            select(self.model)
+            .filter_by(user_id=user_id)
+            .order_by(self.model.label)
+        )
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
+    async def save_many(
+        self, mappings: list[CategoryMappingEntity]
+    ) -> list[CategoryMappingEntity]:
+        if not mappings:
+            return []
+        # A row may only be upserted once per statement, the last one wins
+        values = {
+            (mapping.user_id, mapping.label): {
+                "user_id": mapping.user_id,
+                "label": mapping.label,
+                "category_id": mapping.category_id,
+            }
+            for mapping in mappings
+        }
+        stmt = pg_insert(self.model).values(list(values.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "label"],
+            set_={
+                "category_id": stmt.excluded.category_id,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
+        return mappings
+
+    async def delete_by_labels(
+        self, user_id: UUID, labels: list[str]
+    ) -> None:
+        if not labels:
+            return
+        stmt = delete(self.model).where(
+            self.model.user_id == user_id,
+            self.model.label.in_(
+                [
+                    CategoryMappingEntity.normalize_label(label)
+                    for label in labels
+                ]
+            ),
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
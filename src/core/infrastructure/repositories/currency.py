@@ -47,6 +47,17 @@ class CurrencyRepository(ICurrencyRepository):
             )
         return model_instance.to_entity()
 
+    async def get_by_ids(
+        self, currency_ids: list[UUID]
+    ) -> list[CurrencyEntity]:
+        if not currency_ids:
+            return []
+        stmt = select(self.model).filter(
+            self.model.currency_id.in_(currency_ids)
+        )
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
     async def get_all(self) -> list[CurrencyEntity]:
         stmt = select(self.model)
         result = await self._session.execute(stmt)
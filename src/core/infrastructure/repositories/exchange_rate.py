@@ -0,0 +1,100 @@
+import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ScalarSelect, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from core.domain.transaction.entities.exchange_rate import ExchangeRateEntity
+from core.domain.transaction.repositories.exchange_rate import (
+    IExchangeRateRepository,
+)
+from core.domain.transaction.value_objects.exchange_rates import (
+    ExchangeRateTable,
+)
+from core.infrastructure.database.models.exchange_rate import ExchangeRate
+
+
+def select_rate_at(currency_id: Any, date: Any) -> ScalarSelect:
+    """Scalar subquery of the rate of ``currency_id`` in effect on ``date``.
+
+    Both may be columns of the enclosing query, which it correlates to;
+    each evaluation is one backward scan of the primary key. ``NULL``
+    when the currency has no rate on or before ``date``.
+    """
+    return (
+        select(ExchangeRate.rate)
+        .where(
+            ExchangeRate.currency_id == currency_id,
+            ExchangeRate.valid_from <= date,
+        )
+        .order_by(ExchangeRate.valid_from.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
+class ExchangeRateRepository(IExchangeRateRepository):
+    model = ExchangeRate
+
+    # Three parameters per row, well within the 32767 asyncpg allows
+    upsert_chunk_size = 5000
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def save_many(self, rates: list[ExchangeRateEntity]) -> int:
+        # A row may only be upserted once per statement, the last one wins
+        values = list(
+            {
+                (rate.currency_id, rate.valid_from): {
+                    "currency_id": rate.currency_id,
+                    "valid_from": rate.valid_from,
+                    "rate": rate.rate,
+                }
+                for rate in rates
+            }.values()
+        )
+        size = self.upsert_chunk_size
+        for chunk in (
+            values[i:i + size] for i in range(0, len(values), size)
+        ):
+            stmt = pg_insert(self.model).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["currency_id", "valid_from"],
+                set_={"rate": stmt.excluded.rate, "updated_at": func.now()},
+            )
+            await self._session.execute(stmt)
+        await self._session.commit()
+        return len(values)
+
+    async def get_table(
+        self,
+        currency_ids: list[UUID],
+        start_date: datetime.date,
+        end_date: datetime.date,
+    ) -> ExchangeRateTable:
+        if not currency_ids:
+            return ExchangeRateTable([])
+        previous = aliased(ExchangeRate)
+        # The rate in effect on start_date was usually set before it
+        first_valid_from = (
+            select(func.max(previous.valid_from))
+            .where(
+                previous.currency_id == self.model.currency_id,
+                previous.valid_from <= start_date,
+            )
+            .scalar_subquery()
+        )
+        stmt = select(self.model).where(
+            self.model.currency_id.in_(currency_ids),
+            self.model.valid_from <= end_date,
+            self.model.valid_from
+            >= func.coalesce(first_valid_from, start_date),
+        )
+        result = await self._session.execute(stmt)
+        return ExchangeRateTable(
+            model.to_entity() for model in result.scalars()
+        )
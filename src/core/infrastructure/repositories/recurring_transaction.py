@@ -0,0 +1,137 @@
+import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from core.domain.transaction.entities.recurring_transaction import (
+    RecurringTransactionEntity,
+)
+from core.domain.transaction.exceptions.recurring_transaction.not_found import (  # noqa: E501
+    RecurringTransactionNotFoundException,
+)
+from core.domain.transaction.repositories.recurring_transaction import (
+    IRecurringTransactionRepository,
+)
+from core.infrastructure.database.models.category import Category
+from core.infrastructure.database.models.recurring_transaction import (
+    RecurringTransaction,
+)
+
+
+class RecurringTransactionRepository(IRecurringTransactionRepository):
+    model = RecurringTransaction
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def _select(self) -> Select:
+        return (
+            select(self.model)
+            .options(
+                joinedload(self.model.category, innerjoin=True).joinedload(
+                    Category.operation, innerjoin=True
+                )
+            )
+            .options(joinedload(self.model.currency, innerjoin=True))
+        )
+
+    async def save(
+        self, recurring_transaction: RecurringTransactionEntity
+    ) -> RecurringTransactionEntity:
+        model_instance = self.model.from_entity(recurring_transaction)
+        stmt = insert(self.model).values(
+            recurring_transaction_id=model_instance.recurring_transaction_id,
+            user_id=model_instance.user_id,
+            category_id=model_instance.category_id,
+            currency_id=model_instance.currency_id,
+            amount=model_instance.amount,
+            description=model_instance.description,
+            rule=model_instance.rule,
+            start_date=model_instance.start_date,
+            occurrence_count=model_instance.occurrence_count,
+            next_run_at=model_instance.next_run_at,
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
+        return recurring_transaction
+
+    async def get_by_id(
+        self, recurring_transaction_id: UUID
+    ) -> RecurringTransactionEntity:
+        stmt = self._select().filter_by(
+            recurring_transaction_id=recurring_transaction_id
+        )
+        result = await self._session.execute(stmt)
+        model_instance = result.scalars().first()
+        if model_instance is None:
+            raise RecurringTransactionNotFoundException(
+                f"Recurring transaction with id "
+                f"{str(recurring_transaction_id)!r} not found"
+            )
+        return model_instance.to_entity()
+
+    async def get_by_user(
+        self, user_id: UUID
+    ) -> list[RecurringTransactionEntity]:
+        stmt = (
+            self._select()
+            .filter_by(user_id=user_id)
+            .order_by(
+                self.model.created_at, self.model.recurring_transaction_id
+            )
+        )
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
+    async def delete(self, recurring_transaction_id: UUID) -> None:
+        stmt = delete(self.model).filter_by(
+            recurring_transaction_id=recurring_transaction_id
+        )
+        result = await self._session.execute(stmt)
+        if result.rowcount == 0:
+            raise RecurringTransactionNotFoundException(
+                f"Recurring transaction with id "
+                f"{str(recurring_transaction_id)!r} not found"
+            )
+        await self._session.commit()
+
+    async def lock_due(
+        self, now: datetime.datetime, limit: int
+    ) -> list[RecurringTransactionEntity]:
+        # Only the templates are locked, not the rows joined to them
+        stmt = (
+            self._select()
+            .where(
+                self.model.next_run_at.is_not(None),
+                self.model.next_run_at <= now,
+            )
+            .order_by(self.model.next_run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=self.model)
+        )
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
+    async def update_schedules(
+        self, recurring_transactions: list[RecurringTransactionEntity]
+    ) -> None:
+        if not recurring_transactions:
+            return
+        # ORM bulk UPDATE by primary key, one executemany round-trip
+        updated_at = datetime.datetime.now(datetime.UTC)
+        await self._session.execute(
+            update(self.model),
+            [
+                {
+                    "recurring_transaction_id": (
+                        recurring_transaction.recurring_transaction_id
+                    ),
+                    "occurrence_count": recurring_transaction.occurrence_count,
+                    "next_run_at": recurring_transaction.next_run_at,
+                    "updated_at": updated_at,
+                }
+                for recurring_transaction in recurring_transactions
+            ],
+        )
@@ -1,8 +1,17 @@
+import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    Select,
+    delete,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from core.domain.transaction.entities.transaction import TransactionEntity
 from core.domain.transaction.exceptions.transaction.not_found import (
@@ -12,15 +21,108 @@ from core.domain.transaction.filters.transaction import TransactionFilters
 from core.domain.transaction.repositories.transaction import (
     ITransactionRepository,
 )
+from core.domain.transaction.value_objects.transaction_cursor import (
+    TransactionCursor,
+)
 from core.infrastructure.database.models.category import Category
 from core.infrastructure.database.models.transaction import Transaction
+from core.infrastructure.repositories.budget_spend import (
+    BudgetSpendRepository,
+)
+from core.infrastructure.repositories.transaction_rollup import (
+    TransactionRollupRepository,
+)
+
+
+def apply_transaction_filters(
+    stmt: Select, filters: TransactionFilters
+) -> Select:
+    """Narrow a statement selecting from ``transactions`` by ``filters``."""
+    if filters.user_id:
+        stmt = stmt.filter(Transaction.user_id == filters.user_id)
+    if filters.currency_ids:
+        if len(filters.currency_ids) > 1:
+            stmt = stmt.filter(
+                Transaction.currency_id.in_(filters.currency_ids)
+            )
+        else:
+            stmt = stmt.filter(
+                Transaction.currency_id == filters.currency_ids[0]
+            )
+    if filters.operation_ids:
+        stmt = stmt.filter(
+            Transaction.category_id.in_(
+                select(Category.category_id).filter(
+                    Category.operation_id.in_(filters.operation_ids)
+                )
+            )
+        )
+    if filters.category_ids:
+        if len(filters.category_ids) > 1:
+            stmt = stmt.filter(
+                Transaction.category_id.in_(filters.category_ids)
+            )
+        else:
+            stmt = stmt.filter(
+                Transaction.category_id == filters.category_ids[0]
+            )
+    if filters.data_range:
+        if filters.data_range.start_date is not None:
+            stmt = stmt.filter(
+                Transaction.date >= filters.data_range.start_date
+            )
+        if filters.data_range.end_date is not None:
+            stmt = stmt.filter(Transaction.date <= filters.data_range.end_date)
+    if filters.amount_range:
+        if filters.amount_range.min_amount is not None:
+            stmt = stmt.filter(
+                Transaction.amount >= filters.amount_range.min_amount
+            )
+        if filters.amount_range.max_amount is not None:
+            stmt = stmt.filter(
+                Transaction.amount <= filters.amount_range.max_amount
+            )
+    return stmt
+
+
+def apply_transaction_cursor(
+    stmt: Select, after: TransactionCursor | None
+) -> Select:
+    """Keep the rows after ``after`` in (date, id) descending order."""
+    if after is not None:
+        stmt = stmt.filter(
+            tuple_(Transaction.date, Transaction.transaction_id)
+            < tuple_(
+                literal(after.date, Transaction.date.type),
+                literal(after.transaction_id, Transaction.transaction_id.type),
+            )
+        )
+    return stmt.order_by(
+        Transaction.date.desc(), Transaction.transaction_id.desc()
+    )
 
 
 class TransactionRepository(ITransactionRepository):
     model = Transaction
+    # Leading index columns each TransactionFilters field relies on,
+    # verified by core.infrastructure.database.checks
+    filter_access_paths: dict[str, tuple[str, ...]] = {
+        "user_id": ("user_id", "date"),
+        "currency_ids": ("user_id", "currency_id"),
+        "operation_ids": ("user_id", "category_id"),
+        "category_ids": ("user_id", "category_id"),
+        "data_range": ("user_id", "date"),
+        "amount_range": ("user_id", "date"),
+    }
+
+    # Batches of at least this many rows are written with COPY
+    copy_threshold = 1000
+    insert_chunk_size = 1000
 
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._rollups = TransactionRollupRepository(session)
+        self._budget_spend = BudgetSpendRepository(session)
 
     async def save(self, transaction: TransactionEntity) -> TransactionEntity:
         stmt = insert(self.model).values(
@@ -33,11 +135,79 @@ class TransactionRepository(ITransactionRepository):
             description=transaction.description,
         )
         await self._session.execute(stmt)
+        await self._rollups.add(
+            user_id=transaction.user_id,
+            date=transaction.date,
+            category_id=transaction.category.category_id,
+            currency_id=transaction.money.currency.currency_id,
+            amount=transaction.money.amount,
+            count=1,
+        )
+        await self._budget_spend.add(
+            user_id=transaction.user_id,
+            date=transaction.date,
+            category_id=transaction.category.category_id,
+            currency_id=transaction.money.currency.currency_id,
+            amount=transaction.money.amount,
+        )
         await self._session.commit()
         return transaction
 
+    async def save_many(
+        self, transactions: list[TransactionEntity]
+    ) -> list[TransactionEntity]:
+        if not transactions:
+            return []
+        updated_at = datetime.datetime.now(datetime.UTC)
+        rows = [
+            {
+                "transaction_id": transaction.transaction_id,
+                "user_id": transaction.user_id,
+                "category_id": transaction.category.category_id,
+                "currency_id": transaction.money.currency.currency_id,
+                "amount": transaction.money.amount,
+                "date": transaction.date,
+                "description": transaction.description,
+                "updated_at": updated_at,
+            }
+            for transaction in transactions
+        ]
+
+        # Also opens the database transaction, which asyncpg would
+        # otherwise not have started before the COPY below
+        await self._rollups.add_transactions(transactions)
+        await self._budget_spend.add_transactions(transactions)
+
+        connection = await self._session.connection()
+        if (
+            len(rows) >= self.copy_threshold
+            and connection.dialect.driver == "asyncpg"
+        ):
+            columns = list(rows[0])
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            assert driver_connection is not None
+            await driver_connection.copy_records_to_table(
+                self.model.__tablename__,
+                records=[tuple(row.values()) for row in rows],
+                columns=columns,
+            )
+        else:
+            size = self.insert_chunk_size
+            for chunk in (
+                rows[i:i + size] for i in range(0, len(rows), size)
+            ):
+                await self._session.execute(insert(self.model).values(chunk))
+        await self._session.commit()
+        return transactions
+
     async def delete(self, transaction_id: UUID) -> None:
-        stmt = select(self.model).filter_by(transaction_id=transaction_id)
+        # The row is locked so its rollup is subtracted exactly once
+        stmt = (
+            select(self.model)
+            .filter_by(transaction_id=transaction_id)
+            .with_for_update()
+        )
         result = await self._session.execute(stmt)
         model_instance = result.scalars().first()
         if model_instance is None:
@@ -49,17 +219,32 @@ class TransactionRepository(ITransactionRepository):
             self.model.transaction_id == transaction_id
         )
         await self._session.execute(stmt_delete)
+        await self._rollups.add(
+            user_id=model_instance.user_id,
+            date=model_instance.date,
+            category_id=model_instance.category_id,
+            currency_id=model_instance.currency_id,
+            amount=-model_instance.amount,
+            count=-1,
+        )
+        await self._budget_spend.add(
+            user_id=model_instance.user_id,
+            date=model_instance.date,
+            category_id=model_instance.category_id,
+            currency_id=model_instance.currency_id,
+            amount=-model_instance.amount,
+        )
         await self._session.commit()
 
     async def get_by_id(self, transaction_id: UUID) -> TransactionEntity:
         stmt = (
             select(self.model)
             .options(
-                selectinload(self.model.category).options(
-                    selectinload(Category.operation)
+                joinedload(self.model.category, innerjoin=True).joinedload(
+                    Category.operation, innerjoin=True
                 )
             )
-            .options(selectinload(self.model.currency))
+            .options(joinedload(self.model.currency, innerjoin=True))
             .filter_by(transaction_id=transaction_id)
         )
         result = await self._session.execute(stmt)
@@ -76,53 +261,43 @@ class TransactionRepository(ITransactionRepository):
         stmt = (
             select(self.model)
             .options(
-                selectinload(self.model.category).options(
-                    selectinload(Category.operation)
+                joinedload(self.model.category, innerjoin=True).joinedload(
+                    Category.operation, innerjoin=True
                 )
             )
-            .options(selectinload(self.model.currency))
+            .options(joinedload(self.model.currency, innerjoin=True))
         )
-        if filters.user_id:
-            stmt = stmt.filter_by(user_id=filters.user_id)
-        if filters.currency_ids:
-            if len(filters.currency_ids) > 1:
-                stmt = stmt.filter(
-                    self.model.currency_id.in_(filters.currency_ids)
-                )
-            else:
-                stmt = stmt.filter_by(currency_id=filters.currency_ids[0])
-        if filters.currency_ids:
-            if len(filters.currency_ids) > 1:
-                stmt = stmt.filter(
-                    self.model.currency_id.in_(filters.currency_ids)
-                )
-            else:
-                stmt = stmt.filter_by(currency_id=filters.currency_ids[0])
-        if filters.category_ids:
-            if len(filters.category_ids) > 1:
-                stmt = stmt.filter(
-                    self.model.category_id.in_(filters.category_ids)
+        stmt = apply_transaction_filters(stmt, filters)
+        result = await self._session.execute(stmt)
+        return [model.to_entity() for model in result.scalars()]
+
+    async def get_page_by_filters(
+        self,
+        filters: TransactionFilters,
+        limit: int,
+        after: TransactionCursor | None = None,
+    ) -> list[TransactionEntity]:
+        stmt = (
+            select(self.model)
+            .options(
+                joinedload(self.model.category, innerjoin=True).joinedload(
+                    Category.operation, innerjoin=True
                 )
-            else:
-                stmt = stmt.filter_by(category_id=filters.category_ids[0])
-        if filters.data_range:
-            stmt = stmt.filter(
-                self.model.date >= filters.data_range.start_date,
-                self.model.date <= filters.data_range.end_date,
-            )
-        if filters.amount_range:
-            stmt = stmt.filter(
-                self.model.amount >= filters.amount_range.min_amount,
-                self.model.amount <= filters.amount_range.max_amount,
             )
+            .options(joinedload(self.model.currency, innerjoin=True))
+        )
+        stmt = apply_transaction_filters(stmt, filters)
+        stmt = apply_transaction_cursor(stmt, after).limit(limit)
         result = await self._session.execute(stmt)
         return [model.to_entity() for model in result.scalars()]
 
     async def update(
         self, transaction: TransactionEntity
     ) -> TransactionEntity:
-        stmt = select(self.model).filter_by(
-            transaction_id=transaction.transaction_id
+        stmt = (
+            select(self.model)
+            .filter_by(transaction_id=transaction.transaction_id)
+            .with_for_update()
         )
         result = await self._session.execute(stmt)
         model_instance = result.scalars().first()
@@ -131,6 +306,22 @@ class TransactionRepository(ITransactionRepository):
                 f"Transaction with id "
                 f"{str(transaction.transaction_id)!r} not found"
             )
+        # Read before the UPDATE, which synchronizes the loaded instance
+        await self._rollups.add(
+            user_id=model_instance.user_id,
+            date=model_instance.date,
+            category_id=model_instance.category_id,
+            currency_id=model_instance.currency_id,
+            amount=-model_instance.amount,
+            count=-1,
+        )
+        await self._budget_spend.add(
+            user_id=model_instance.user_id,
+            date=model_instance.date,
+            category_id=model_instance.category_id,
+            currency_id=model_instance.currency_id,
+            amount=-model_instance.amount,
+        )
         stmt_update = (
             update(self.model)
             .where(self.model.transaction_id == transaction.transaction_id)
@@ -143,5 +334,20 @@ class TransactionRepository(ITransactionRepository):
             )
         )
         await self._session.execute(stmt_update)
+        await self._rollups.add(
+            user_id=transaction.user_id,
+            date=transaction.date,
+            category_id=transaction.category.category_id,
+            currency_id=transaction.money.currency.currency_id,
+            amount=transaction.money.amount,
+            count=1,
+        )
+        await self._budget_spend.add(
+            user_id=transaction.user_id,
+            date=transaction.date,
+            category_id=transaction.category.category_id,
+            currency_id=transaction.money.currency.currency_id,
+            amount=transaction.money.amount,
+        )
         await self._session.commit()
         return model_instance.to_entity()
@@ -0,0 +1,253 @@
+import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.transaction.entities.transaction import TransactionEntity
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.infrastructure.database.models.category import Category
+from core.infrastructure.database.models.transaction import Transaction
+from core.infrastructure.database.models.transaction_rollup import (
+    TransactionRollup,
+)
+
+
+def month_start(date: datetime.datetime) -> datetime.datetime:
+    """Return the first instant of the UTC month containing ``date``."""
+    # Naive values are read as local time, the same way asyncpg stores them
+    date = date.astimezone(datetime.UTC)
+    return date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def utc_date_trunc(unit: str, column: Any) -> ColumnElement:
+    """``date_trunc`` in UTC with the unit inlined.
+
+    Inlining keeps the SELECT and GROUP BY expressions identical; ``unit``
+    must come from code, never from user input.
+    """
+    return func.date_trunc(
+        literal_column(f"'{unit}'"), column, literal_column("'UTC'")
+    )
+
+
+def apply_rollup_filters(stmt: Select, filters: TransactionFilters) -> Select:
+    """Narrow a statement selecting from ``transaction_rollups``.
+
+    Amount ranges cannot be answered from rollups, and date bounds are
+    compared with month starts, so callers must check
+    ``TransactionRollupRepository.can_answer`` first.
+    """
+    if filters.user_id:
+        stmt = stmt.filter(TransactionRollup.user_id == filters.user_id)
+    if filters.currency_ids:
+        stmt = stmt.filter(
+            TransactionRollup.currency_id.in_(filters.currency_ids)
+        )
+    if filters.operation_ids:
+        stmt = stmt.filter(
+            TransactionRollup.category_id.in_(
+                select(Category.category_id).filter(
+                    Category.operation_id.in_(filters.operation_ids)
+                )
+            )
+        )
+    if filters.category_ids:
+        stmt = stmt.filter(
+            TransactionRollup.category_id.in_(filters.category_ids)
+        )
+    if filters.data_range:
+        if filters.data_range.start_date is not None:
+            stmt = stmt.filter(
+                TransactionRollup.month >= filters.data_range.start_date
+            )
+        if filters.data_range.end_date is not None:
+            stmt = stmt.filter(
+                TransactionRollup.month <= filters.data_range.end_date
+            )
+    return stmt
+
+
+class TransactionRollupRepository:
+    """Maintain ``transaction_rollups`` alongside transaction writes.
+
+    Methods other than ``rebuild`` never commit, so the rollup changes
+    land in the same database transaction as the write they follow.
+    """
+
+    model = TransactionRollup
+    upsert_chunk_size = 1000
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @staticmethod
+    def can_answer(filters: TransactionFilters) -> bool:
+        """Whether ``filters`` select whole months of transactions."""
+        if filters.amount_range is not None and (
+            filters.amount_range.min_amount is not None
+            or filters.amount_range.max_amount is not None
+        ):
+            return False
+        if filters.data_range is None:
+            return True
+        start_date = filters.data_range.start_date
+        end_date = filters.data_range.end_date
+        # Plain dates are left to the transactions table
+        if start_date is not None:
+            if not isinstance(start_date, datetime.datetime):
+                return False
+            if start_date != month_start(start_date):
+                return False
+        if end_date is not None:
+            if not isinstance(end_date, datetime.datetime):
+                return False
+            # Inclusive end bounds have to be the last instant of a month
+            next_instant = end_date + datetime.timedelta(microseconds=1)
+            if next_instant != month_start(next_instant):
+                return False
+        return True
+
+    async def add(
+        self,
+        user_id: UUID,
+        date: datetime.datetime,
+        category_id: UUID,
+        currency_id: UUID,
+        amount: Decimal,
+        count: int,
+    ) -> None:
+        """Add ``amount`` and ``count`` to the rollup of ``date``'s month.
+
+        Negative values remove a transaction; rollups left empty are
+        deleted.
+        """
+        month = month_start(date)
+        await self._upsert(
+            [
+                {
+                    "user_id": user_id,
+                    "month": month,
+                    "category_id": category_id,
+                    "currency_id": currency_id,
+                    "total": amount,
+                    "count": count,
+                }
+            ]
+        )
+
+        if count < 0:
+            await self._session.execute(
+                delete(self.model).where(
+                    self.model.user_id == user_id,
+                    self.model.month == month,
+                    self.model.category_id == category_id,
+                    self.model.currency_id == currency_id,
+                    self.model.count <= 0,
+                )
+            )
+
+    async def add_transactions(
+        self, transactions: list[TransactionEntity]
+    ) -> None:
+        """Add a batch of new transactions to their rollups.
+
+        Deltas are summed per rollup first, so each rollup is written
+        once however many of the transactions fall into it.
+        """
+        rollups: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for transaction in transactions:
+            month = month_start(transaction.date)
+            category_id = transaction.category.category_id
+            currency_id = transaction.money.currency.currency_id
+            rollup = rollups.setdefault(
+                (transaction.user_id, month, category_id, currency_id),
+                {
+                    "user_id": transaction.user_id,
+                    "month": month,
+                    "category_id": category_id,
+                    "currency_id": currency_id,
+                    "total": Decimal(0),
+                    "count": 0,
+                },
+            )
+            rollup["total"] += transaction.money.amount
+            rollup["count"] += 1
+
+        values = list(rollups.values())
+        size = self.upsert_chunk_size
+        for chunk in (
+            values[i:i + size] for i in range(0, len(values), size)
+        ):
+            await self._upsert(chunk)
+
+    async def _upsert(self, values: list[dict[str, Any]]) -> None:
+        stmt = pg_insert(self.model).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "month", "category_id", "currency_id"],
+            set_={
+                "total": self.model.total + stmt.excluded.total,
+                "count": self.model.count + stmt.excluded.count,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def rebuild(self, user_id: UUID | None = None) -> None:
+        """Recompute rollups from ``transactions`` and commit.
+
+        :arg user_id: Rebuild only this user, or everyone when ``None``.
+        """
+        # Blocks concurrent writers (not readers) until the commit, so no
+        # delta can be lost between the delete and the insert
+        await self._session.execute(
+            text("LOCK TABLE transaction_rollups IN EXCLUSIVE MODE")
+        )
+
+        stmt_delete = delete(self.model)
+        if user_id is not None:
+            stmt_delete = stmt_delete.where(self.model.user_id == user_id)
+        await self._session.execute(stmt_delete)
+
+        month = utc_date_trunc("month", Transaction.date)
+        source = select(
+            Transaction.user_id,
+            month,
+            Transaction.category_id,
+            Transaction.currency_id,
+            func.sum(Transaction.amount),
+            func.count(),
+        ).group_by(
+            Transaction.user_id,
+            month,
+            Transaction.category_id,
+            Transaction.currency_id,
+        )
+        if user_id is not None:
+            source = source.where(Transaction.user_id == user_id)
+        await self._session.execute(
+            insert(self.model).from_select(
+                [
+                    "user_id",
+                    "month",
+                    "category_id",
+                    "currency_id",
+                    "total",
+                    "count",
+                ],
+                source,
+            )
+        )
+        await self._session.commit()
@@ -0,0 +1,21 @@
+from loguru import logger
+
+from core.application.transaction.dto.budget import BudgetAlertDTO
+from core.application.transaction.ports.services.budget_alert_notifier import (  # noqa: E501
+    IBudgetAlertNotifier,
+)
+
+
+class LoggingBudgetAlertNotifier(IBudgetAlertNotifier):
+    """Write budget alerts to the log.
+
+    Stands in until users have a delivery channel such as e-mail.
+    """
+
+    async def notify(self, alerts: list[BudgetAlertDTO]) -> None:
+        for alert in alerts:
+            logger.info(
+                f"Budget {alert.budget_id} of user {alert.user_id} reached "
+                f"{alert.threshold}% of {alert.limit} "
+                f"{alert.currency_code}: {alert.spent} spent"
+            )
@@ -0,0 +1,80 @@
+"""Deliver queued budget alerts.
+
+Started in every ASGI worker on lifespan startup when
+``BUDGET_ALERTS_ENABLED`` is set; run
+``python -m core.infrastructure.services.budget_alerts`` from ``src`` to
+do a single pass instead, e.g. from cron.
+"""
+
+import asyncio
+import sys
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from config import BUDGET_ALERTS_BATCH_SIZE, BUDGET_ALERTS_INTERVAL
+from core.application.transaction.ports.services.budget_alert_notifier import (  # noqa: E501
+    IBudgetAlertNotifier,
+)
+from core.application.transaction.use_cases.budget.deliver_alerts import (
+    DeliverBudgetAlertsUseCase,
+)
+from core.infrastructure.repositories.budget_alert import (
+    BudgetAlertRepository,
+)
+from core.infrastructure.services.budget_alert_notifier import (
+    LoggingBudgetAlertNotifier,
+)
+from core.infrastructure.services.periodic import PeriodicWorker
+
+
+class BudgetAlertDispatcher(PeriodicWorker):
+    """Deliver the alerts queued by transaction writes.
+
+    Each tick drains the queue batch by batch, so a burst of alerts
+    costs the write path nothing beyond the inserts that queued them.
+    """
+
+    name = "budget-alert-dispatcher"
+
+    def __init__(
+        self,
+        interval: float = BUDGET_ALERTS_INTERVAL,
+        batch_size: int = BUDGET_ALERTS_BATCH_SIZE,
+        notifier: IBudgetAlertNotifier | None = None,
+    ):
+        super().__init__(interval)
+        self._batch_size = batch_size
+        self._notifier = notifier or LoggingBudgetAlertNotifier()
+
+    async def run_once(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> int:
+        """Deliver everything queued now.
+
+        :return: The number of alerts delivered.
+        """
+        delivered = 0
+        while True:
+            async with session_maker() as session:
+                use_case = DeliverBudgetAlertsUseCase(
+                    BudgetAlertRepository(session), self._notifier
+                )
+                result = await use_case.execute(self._batch_size)
+            delivered += result.delivered
+            # Also stops when other workers hold the remaining alerts
+            if result.delivered < self._batch_size:
+                break
+        if delivered:
+            logger.info(f"Delivered {delivered} budget alerts")
+        return delivered
+
+
+def main() -> int:
+    delivered = asyncio.run(BudgetAlertDispatcher().run_standalone())
+    print(f"Delivered {delivered} budget alerts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,27 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, TypeVar
+
 import bcrypt
 
+from core.application.user.exceptions.cryptography_busy import (
+    CryptographyServiceBusyException,
+)
 from core.application.user.ports.services.cryptography import (
+    IAsyncCryptographyService,
     ICryptographyService,
 )
+from core.infrastructure.services.metrics import cryptography_seconds
+
+
+T = TypeVar("T")
 
 
 class CryptographyService(ICryptographyService):
@@ -18,3 +37,123 @@ class CryptographyService(ICryptographyService):
         return bcrypt.checkpw(
             password.encode("utf-8"), hashed_password.encode("utf-8")
         )
+
+
+@dataclass(frozen=True)
+class CryptographyStatistics:
+    executor: str
+    max_workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    total_seconds: float
+    max_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ExecutorCryptographyService(IAsyncCryptographyService):
+    """Run bcrypt on a bounded executor instead of the event loop.
+
+    At most ``max_pending`` calls may be running or queued at once; further
+    calls fail fast with ``CryptographyServiceBusyException``.
+    """
+
+    def __init__(
+        self,
+        cryptography_service: ICryptographyService,
+        executor_kind: str = "thread",
+        max_workers: int = 4,
+        max_pending: int = 32,
+    ):
+        self._cryptography_service = cryptography_service
+        self._executor_kind = executor_kind
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self._executor_kind == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self._max_workers
+                    )
+                elif self._executor_kind == "thread":
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix="cryptography",
+                    )
+                else:
+                    raise ValueError(
+                        f"Unknown executor kind {self._executor_kind!r}"
+                    )
+            return self._executor
+
+    async def _run(
+        self, operation: str, func: Callable[..., T], *args: Any
+    ) -> T:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                raise CryptographyServiceBusyException(
+                    "Too many password operations in progress"
+                )
+            self._pending += 1
+
+        started_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), func, *args
+            )
+        finally:
+            elapsed = time.perf_counter() - started_at
+            cryptography_seconds.observe(elapsed, operation=operation)
+            with self._lock:
+                self._pending -= 1
+                self._completed += 1
+                self._total_seconds += elapsed
+                self._max_seconds = max(self._max_seconds, elapsed)
+
+    def generate_salt(self) -> str:
+        return self._cryptography_service.generate_salt()
+
+    async def hash_password(self, password: str, salt: str) -> str:
+        return await self._run(
+            "hash_password",
+            self._cryptography_service.hash_password,
+            password,
+            salt,
+        )
+
+    async def verify_password(
+        self, password: str, hashed_password: str
+    ) -> bool:
+        return await self._run(
+            "verify_password",
+            self._cryptography_service.verify_password,
+            password,
+            hashed_password,
+        )
+
+    def get_statistics(self) -> CryptographyStatistics:
+        with self._lock:
+            return CryptographyStatistics(
+                executor=self._executor_kind,
+                max_workers=self._max_workers,
+                max_pending=self._max_pending,
+                pending=self._pending,
+                completed=self._completed,
+                rejected=self._rejected,
+                total_seconds=self._total_seconds,
+                max_seconds=self._max_seconds,
+            )
@@ -0,0 +1,101 @@
+import csv
+import datetime
+import io
+from decimal import Decimal, InvalidOperation
+from typing import IO, Iterator
+
+from core.application.transaction.dto.exchange_rate import (
+    ExchangeRateRowDTO,
+)
+from core.application.transaction.exceptions.invalid_exchange_rates import (
+    InvalidExchangeRatesException,
+)
+from core.application.transaction.ports.services.exchange_rate_parser import (
+    IExchangeRateParser,
+)
+
+
+# Cells some publishers use for days without a rate
+MISSING_RATES = frozenset(("", "N/A", "-"))
+
+
+class CsvExchangeRateParser(IExchangeRateParser):
+    """Read rates from CSV, one rate per row or one currency per column.
+
+    Files with ``date``, ``currency`` and ``rate`` columns hold one rate
+    per row. Otherwise the first column is the date and every other
+    column is named by a currency code, as in the ECB reference rates
+    history (``eurofxref-hist.csv``). Dates are ISO 8601.
+    """
+
+    def __init__(self, delimiter: str = ",", encoding: str = "utf-8-sig"):
+        self._delimiter = delimiter
+        self._encoding = encoding
+
+    @staticmethod
+    def _parse_row(
+        line: int, date: str, currency_code: str, rate: str
+    ) -> ExchangeRateRowDTO:
+        try:
+            parsed_date = datetime.date.fromisoformat(date.strip())
+        except ValueError as e:
+            raise InvalidExchangeRatesException(
+                f"Invalid rate on line {line}: {e}"
+            ) from e
+        try:
+            value = Decimal(rate.strip())
+        except InvalidOperation:
+            value = Decimal("NaN")
+        # Checked before anything is loaded, as a rate entity would raise
+        if not value.is_finite() or value <= 0:
+            raise InvalidExchangeRatesException(
+                f"Invalid rate on line {line}: {rate.strip()!r} is not a "
+                "positive number"
+            )
+        return ExchangeRateRowDTO(
+            date=parsed_date,
+            currency_code=currency_code.strip().upper(),
+            rate=value,
+        )
+
+    def parse(self, stream: IO[bytes]) -> Iterator[ExchangeRateRowDTO]:
+        text = io.TextIOWrapper(stream, encoding=self._encoding, newline="")
+        reader = csv.reader(text, delimiter=self._delimiter)
+        header = [column.strip() for column in next(reader, [])]
+        columns = [column.lower() for column in header]
+        if len(header) < 2:
+            raise InvalidExchangeRatesException(
+                "Expected a date column and at least one rate column"
+            )
+
+        if {"date", "currency", "rate"} <= set(columns):
+            date_index = columns.index("date")
+            currency_index = columns.index("currency")
+            rate_index = columns.index("rate")
+            for record in reader:
+                if not any(record):
+                    continue
+                if record[rate_index].strip() in MISSING_RATES:
+                    continue
+                yield self._parse_row(
+                    reader.line_num,
+                    record[date_index],
+                    record[currency_index],
+                    record[rate_index],
+                )
+            return
+
+        # ECB files end every line with a delimiter, giving a nameless column
+        currency_columns = [
+            (index, code)
+            for index, code in enumerate(header)
+            if index and code
+        ]
+        for record in reader:
+            if not any(record):
+                continue
+            for index, code in currency_columns:
+                rate = record[index] if index < len(record) else ""
+                if rate.strip() in MISSING_RATES:
+                    continue
+                yield self._parse_row(reader.line_num, record[0], code, rate)
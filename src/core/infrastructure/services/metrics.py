@@ -0,0 +1,218 @@
+"""Prometheus metrics kept in process memory.
+
+Each worker process has its own registry, so with several workers every
+scrape sees the worker that served it; run Prometheus against each worker
+or keep one worker per instance.
+"""
+
+import math
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator
+
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self._lock = threading.Lock()
+
+    def _get_key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if labels.keys() != set(self.labels):
+            raise ValueError(
+                f"Metric {self.name!r} expects labels {self.labels!r}, "
+                f"got {tuple(labels)!r}"
+            )
+        return tuple(str(labels[name]) for name in self.labels)
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]: ...
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ):
+        super().__init__(name, description, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._get_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield (
+                f"{self.name}{_format_labels(self.labels, key)} "
+                f"{_format_value(value)}"
+            )
+
+
+@dataclass
+class _HistogramValue:
+    bucket_counts: list[int]
+    total: float = 0.0
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: dict[tuple[str, ...], _HistogramValue] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._get_key(labels)
+        with self._lock:
+            histogram_value = self._values.get(key)
+            if histogram_value is None:
+                histogram_value = self._values[key] = _HistogramValue(
+                    [0] * len(self.buckets)
+                )
+            # Buckets are stored uncumulated and summed up when rendered
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram_value.bucket_counts[position] += 1
+                    break
+            histogram_value.total += value
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            values = {
+                key: _HistogramValue(
+                    list(histogram_value.bucket_counts), histogram_value.total
+                )
+                for key, histogram_value in self._values.items()
+            }
+        for key, histogram_value in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(
+                self.buckets, histogram_value.bucket_counts
+            ):
+                cumulative += count
+                labels = _format_labels(
+                    self.labels + ("le",), key + (_format_value(bound),)
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labels, key)
+            yield (
+                f"{self.name}_sum{labels} "
+                f"{_format_value(histogram_value.total)}"
+            )
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(
+                    f"Metric {metric.name!r} is already registered"
+                )
+            self._metrics[metric.name] = metric
+
+    def counter(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ) -> Counter:
+        counter = Counter(name, description, labels)
+        self.register(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name, description, labels, buckets)
+        self.register(histogram)
+        return histogram
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() + "\n" for metric in metrics)
+
+
+registry = MetricsRegistry()
+
+db_query_seconds = registry.histogram(
+    "db_query_duration_seconds", "Time spent executing SQL statements."
+)
+db_pool_checkout_seconds = registry.histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time spent getting a database connection from the pool.",
+)
+cryptography_seconds = registry.histogram(
+    "cryptography_duration_seconds",
+    "Time spent hashing and verifying passwords, including queueing.",
+    labels=("operation",),
+)
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.infrastructure.database.core import create_engine
+
+
+class PeriodicWorker(ABC):
+    """Call ``run_once`` every ``interval`` seconds in a daemon thread.
+
+    The thread runs its own event loop and engine, since connections of
+    the web engine belong to other event loops. Failures are logged and
+    retried on the next tick.
+    """
+
+    name = "periodic-worker"
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._run(),),
+            name=self.name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    @abstractmethod
+    async def run_once(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> int:
+        """Do one pass and return the number of items handled."""
+
+    async def run_standalone(self) -> int:
+        """Do one pass with an engine of its own, e.g. from a script."""
+        engine = create_engine("serverless")
+        try:
+            return await self.run_once(
+                async_sessionmaker(
+                    engine, expire_on_commit=False, class_=AsyncSession
+                )
+            )
+        finally:
+            await engine.dispose()
+
+    async def _run(self) -> None:
+        engine = create_engine("serverless")
+        session_maker = async_sessionmaker(
+            engine, expire_on_commit=False, class_=AsyncSession
+        )
+        try:
+            while True:
+                try:
+                    await self.run_once(session_maker)
+                except Exception as e:
+                    logger.error(f"{self.name} failed: {e}")
+                await asyncio.sleep(self._interval)
+        finally:
+            await engine.dispose()
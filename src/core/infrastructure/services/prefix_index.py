@@ -0,0 +1,80 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Callable, Generic, TypeVar
+
+
+T = TypeVar("T")
+
+_WORD = re.compile(r"\w+")
+# Ukrainian text uses all of these for the apostrophe, as in «м'ясо»
+_APOSTROPHES = str.maketrans("", "", "'`‘’ʼ")
+
+
+def fold_case(text: str) -> str:
+    """Lowercase ``text`` for caseless matching, with spaces collapsed."""
+    return " ".join(text.casefold().split())
+
+
+def fold_accents(text: str) -> str:
+    """Fold case, drop diacritics and apostrophes.
+
+    Stress marks and letters such as «ї» and «й» fold to their base
+    letter, so queries typed with or without them match either way.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return fold_case(stripped.translate(_APOSTROPHES))
+
+
+class PrefixIndex(Generic[T]):
+    """Find items by the prefix of any word of their labels.
+
+    Every suffix of a normalized label that starts a word is kept in one
+    sorted list, so a lookup is a binary search followed by a scan of the
+    matches only, however many items there are.
+    """
+
+    def __init__(
+        self,
+        items: list[T],
+        get_labels: Callable[[T], list[str]],
+        normalize: Callable[[str], str],
+    ):
+        self._items = items
+        self._normalize = normalize
+        entries = []
+        for position, item in enumerate(items):
+            for label in get_labels(item):
+                key = normalize(label)
+                for word in _WORD.finditer(key):
+                    entries.append((key[word.start():], position))
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def search(self, query: str, limit: int) -> list[T]:
+        """Return up to ``limit`` items matching ``query``.
+
+        Items are in the order of the words they matched by; an empty
+        query returns the first items.
+        """
+        prefix = self._normalize(query)
+        if not prefix:
+            return self._items[:limit]
+        found: list[T] = []
+        seen: set[int] = set()
+        for index in range(
+            bisect_left(self._keys, prefix), len(self._keys)
+        ):
+            if not self._keys[index].startswith(prefix):
+                break
+            position = self._positions[index]
+            if position not in seen:
+                seen.add(position)
+                found.append(self._items[position])
+                if len(found) == limit:
+                    break
+        return found
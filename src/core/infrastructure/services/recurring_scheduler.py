@@ -0,0 +1,84 @@
+"""Create the transactions of due recurring transactions.
+
+Started in every ASGI worker on lifespan startup when
+``RECURRING_SCHEDULER_ENABLED`` is set; run
+``python -m core.infrastructure.services.recurring_scheduler`` from ``src``
+to do a single pass instead, e.g. from cron.
+"""
+
+import asyncio
+import datetime
+import sys
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from config import (
+    RECURRING_SCHEDULER_BATCH_SIZE,
+    RECURRING_SCHEDULER_INTERVAL,
+    RECURRING_SCHEDULER_MAX_OCCURRENCES,
+)
+from core.application.transaction.use_cases.recurring_transaction.materialize_due import (  # noqa: E501
+    MaterializeRecurringTransactionsUseCase,
+)
+from core.infrastructure.repositories.recurring_transaction import (
+    RecurringTransactionRepository,
+)
+from core.infrastructure.repositories.transaction import TransactionRepository
+from core.infrastructure.services.periodic import PeriodicWorker
+
+
+class RecurringTransactionScheduler(PeriodicWorker):
+    """Materialize due recurring transactions every ``interval`` seconds.
+
+    Each tick drains the due templates batch by batch, one query per
+    batch to claim them.
+    """
+
+    name = "recurring-transaction-scheduler"
+
+    def __init__(
+        self,
+        interval: float = RECURRING_SCHEDULER_INTERVAL,
+        batch_size: int = RECURRING_SCHEDULER_BATCH_SIZE,
+        max_occurrences: int = RECURRING_SCHEDULER_MAX_OCCURRENCES,
+    ):
+        super().__init__(interval)
+        self._batch_size = batch_size
+        self._max_occurrences = max_occurrences
+
+    async def run_once(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> int:
+        """Materialize everything due now.
+
+        :return: The number of transactions created.
+        """
+        now = datetime.datetime.now(datetime.UTC)
+        created = 0
+        while True:
+            async with session_maker() as session:
+                use_case = MaterializeRecurringTransactionsUseCase(
+                    RecurringTransactionRepository(session),
+                    TransactionRepository(session),
+                )
+                result = await use_case.execute(
+                    now, self._batch_size, self._max_occurrences
+                )
+            created += result.created
+            # Also stops when other workers hold the remaining templates
+            if result.templates < self._batch_size:
+                break
+        if created:
+            logger.info(f"Created {created} recurring transactions")
+        return created
+
+
+def main() -> int:
+    created = asyncio.run(RecurringTransactionScheduler().run_standalone())
+    print(f"Created {created} recurring transactions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.application.transaction.dto.autocomplete import (
+    AutocompleteItemDTO,
+    AutocompleteRequestDTO,
+)
+from core.application.transaction.ports.services.reference_autocomplete import (  # noqa: E501
+    IReferenceAutocompleteService,
+)
+from core.domain.transaction.entities.category import CategoryEntity
+from core.domain.transaction.entities.currency import CurrencyEntity
+from core.domain.transaction.entities.operation import OperationEntity
+from core.domain.transaction.enums.autocomplete import AutocompleteMatch
+from core.infrastructure.repositories.cached import (
+    CachedCategoryRepository,
+    CachedCurrencyRepository,
+    CachedOperationRepository,
+)
+from core.infrastructure.repositories.category import CategoryRepository
+from core.infrastructure.repositories.currency import CurrencyRepository
+from core.infrastructure.repositories.operation import OperationRepository
+from core.infrastructure.services.prefix_index import (
+    PrefixIndex,
+    fold_accents,
+    fold_case,
+)
+from core.infrastructure.services.reference_cache import ReferenceDataCache
+
+
+NORMALIZERS: dict[AutocompleteMatch, Callable[[str], str]] = {
+    AutocompleteMatch.PREFIX: fold_case,
+    AutocompleteMatch.FOLDED: fold_accents,
+}
+
+
+@dataclass(frozen=True)
+class _Entry:
+    label: str
+    value: UUID
+    # Extra text the entry is found by but not shown with
+    aliases: tuple[str, ...] = ()
+
+
+class _Indexes:
+    """Prefix indexes of one snapshot, one per matching mode."""
+
+    def __init__(self, entries: list[_Entry]):
+        entries = sorted(
+            entries, key=lambda entry: (fold_accents(entry.label), entry.label)
+        )
+        self._indexes = {
+            match: PrefixIndex(
+                entries,
+                lambda entry: [entry.label, *entry.aliases],
+                normalize,
+            )
+            for match, normalize in NORMALIZERS.items()
+        }
+
+    def search(self, request: AutocompleteRequestDTO) -> list[_Entry]:
+        return self._indexes[request.match].search(request.q, request.limit)
+
+
+def _to_dtos(entries: list[_Entry]) -> list[AutocompleteItemDTO]:
+    return [
+        AutocompleteItemDTO.model_construct(
+            label=entry.label, value=entry.value
+        )
+        for entry in entries
+    ]
+
+
+def _build_operations(operations: list[OperationEntity]) -> _Indexes:
+    return _Indexes(
+        [
+            _Entry(operation.operation_name, operation.operation_id)
+            for operation in operations
+        ]
+    )
+
+
+def _build_categories(
+    categories: list[CategoryEntity],
+) -> dict[UUID | None, _Indexes]:
+    by_operation: dict[UUID | None, list[_Entry]] = {None: []}
+    for category in categories:
+        entry = _Entry(category.category_name, category.category_id)
+        by_operation[None].append(entry)
+        by_operation.setdefault(
+            category.operation.operation_id, []
+        ).append(entry)
+    return {
+        operation_id: _Indexes(entries)
+        for operation_id, entries in by_operation.items()
+    }
+
+
+def _build_currencies(currencies: list[CurrencyEntity]) -> _Indexes:
+    return _Indexes(
+        [
+            _Entry(
+                f"{currency.currency_code} {currency.currency_symbol}",
+                currency.currency_id,
+                (currency.currency_name,),
+            )
+            for currency in currencies
+        ]
+    )
+
+
+class CachedReferenceAutocompleteService(IReferenceAutocompleteService):
+    """Answer autocomplete queries from the reference data cache.
+
+    The indexes are built once per cached snapshot and shared by all
+    requests, so a query costs a binary search and never reaches the
+    database while the snapshot is fresh.
+    """
+
+    index_name = "autocomplete"
+
+    def __init__(self, session: AsyncSession, cache: ReferenceDataCache):
+        self._session = session
+        self._cache = cache
+
+    async def get_operations(
+        self, request: AutocompleteRequestDTO
+    ) -> list[AutocompleteItemDTO]:
+        indexes = await self._cache.get_or_build(
+            CachedOperationRepository.kind,
+            self.index_name,
+            OperationRepository(self._session).get_all,
+            _build_operations,
+        )
+        return _to_dtos(indexes.search(request))
+
+    async def get_categories(
+        self, request: AutocompleteRequestDTO, operation_id: UUID | None
+    ) -> list[AutocompleteItemDTO]:
+        indexes = await self._cache.get_or_build(
+            CachedCategoryRepository.kind,
+            self.index_name,
+            CategoryRepository(self._session).get_all,
+            _build_categories,
+        )
+        operation_indexes = indexes.get(operation_id)
+        if operation_indexes is None:
+            return []
+        return _to_dtos(operation_indexes.search(request))
+
+    async def get_currencies(
+        self, request: AutocompleteRequestDTO
+    ) -> list[AutocompleteItemDTO]:
+        indexes = await self._cache.get_or_build(
+            CachedCurrencyRepository.kind,
+            self.index_name,
+            CurrencyRepository(self._session).get_all,
+            _build_currencies,
+        )
+        return _to_dtos(indexes.search(request))
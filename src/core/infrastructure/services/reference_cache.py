@@ -0,0 +1,213 @@
+import asyncio
+import copy
+import hashlib
+import threading
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+import asyncpg  # type: ignore[import-untyped]
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+T = TypeVar("T")
+D = TypeVar("D")
+
+REFERENCE_DATA_CHANNEL = "reference_data_changed"
+
+
+def _get_content_tag(items: list[Any]) -> str:
+    # Entities are dataclasses of plain values with deterministic reprs
+    return hashlib.sha256(repr(items).encode()).hexdigest()[:16]
+
+
+class ReferenceDataCache:
+    """Per-process read-through cache of small reference tables.
+
+    Each kind (``operations``, ``categories``, ``currencies``) is kept as
+    a full snapshot tagged with a version. Invalidating a kind bumps its
+    version, so a load that raced with a write is never stored.
+
+    Every stored snapshot also gets a tag hashed from its contents, usable
+    as an HTTP entity tag: equal contents get equal tags in every process.
+    """
+
+    # Categories embed their operation, so they go stale with it
+    dependents: dict[str, tuple[str, ...]] = {
+        "operations": ("categories",),
+    }
+
+    def __init__(self, ttl: float, notify: bool = False):
+        self._ttl = ttl
+        self._notify = notify
+        self._versions: dict[str, int] = {}
+        self._snapshots: dict[str, tuple[int, float, list[Any], str]] = {}
+        self._derived: dict[tuple[str, str], tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def version(self, kind: str) -> int:
+        with self._lock:
+            return self._versions.get(kind, 0)
+
+    def etag(self, *kinds: str) -> str | None:
+        """Return the tag of the current snapshots of ``kinds``.
+
+        ``None`` when any of them is not loaded or has expired.
+        """
+        now = time.monotonic()
+        tags = []
+        with self._lock:
+            for kind in kinds:
+                snapshot = self._snapshots.get(kind)
+                if snapshot is None or snapshot[1] <= now:
+                    return None
+                tags.append(snapshot[3])
+        return "-".join(tags)
+
+    async def get_or_load(
+        self, kind: str, loader: Callable[[], Awaitable[list[T]]]
+    ) -> list[T]:
+        """Return a copy of the snapshot of ``kind``, loading it on a miss."""
+        with self._lock:
+            version = self._versions.get(kind, 0)
+            snapshot = self._snapshots.get(kind)
+        if (
+            snapshot is not None
+            and snapshot[0] == version
+            and snapshot[1] > time.monotonic()
+        ):
+            return copy.deepcopy(snapshot[2])
+
+        items = await loader()
+        if self._ttl > 0:
+            tag = _get_content_tag(items)
+            with self._lock:
+                if self._versions.get(kind, 0) == version:
+                    self._snapshots[kind] = (
+                        version,
+                        time.monotonic() + self._ttl,
+                        items,
+                        tag,
+                    )
+        return copy.deepcopy(items)
+
+    async def get_or_build(
+        self,
+        kind: str,
+        name: str,
+        loader: Callable[[], Awaitable[list[T]]],
+        build: Callable[[list[T]], D],
+    ) -> D:
+        """Return ``build`` applied to the snapshot of ``kind``.
+
+        The result is kept until the snapshot changes, so it is shared
+        between callers and must not be modified. ``build`` must not
+        modify the items either.
+        """
+        for _ in range(2):
+            now = time.monotonic()
+            with self._lock:
+                version = self._versions.get(kind, 0)
+                snapshot = self._snapshots.get(kind)
+                derived = self._derived.get((kind, name))
+            if (
+                snapshot is not None
+                and snapshot[0] == version
+                and snapshot[1] > now
+            ):
+                if derived is not None and derived[0] == snapshot[3]:
+                    return derived[1]
+                value = build(snapshot[2])
+                with self._lock:
+                    self._derived[(kind, name)] = (snapshot[3], value)
+                return value
+            items = await self.get_or_load(kind, loader)
+        # Nothing is stored when caching is disabled
+        return build(items)
+
+    def invalidate(self, kind: str) -> None:
+        with self._lock:
+            for name in (kind, *self.dependents.get(kind, ())):
+                self._versions[name] = self._versions.get(name, 0) + 1
+                self._snapshots.pop(name, None)
+                for key in [key for key in self._derived if key[0] == name]:
+                    del self._derived[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in list(self._snapshots):
+                self._versions[name] = self._versions.get(name, 0) + 1
+            self._snapshots.clear()
+            self._derived.clear()
+
+    async def publish(self, session: AsyncSession, kind: str) -> None:
+        """Queue a cross-worker invalidation of ``kind``.
+
+        ``NOTIFY`` is transactional, so listeners only hear about the
+        change once the session commits.
+        """
+        if self._notify:
+            await session.execute(
+                select(func.pg_notify(REFERENCE_DATA_CHANNEL, kind))
+            )
+
+
+class ReferenceDataListener:
+    """Invalidate a ``ReferenceDataCache`` on Postgres notifications.
+
+    Runs its own event loop and connection in a daemon thread, since the
+    request event loops do not outlive a request.
+    """
+
+    def __init__(
+        self,
+        cache: ReferenceDataCache,
+        database_uri: str,
+        reconnect_delay: float = 5.0,
+    ):
+        self._cache = cache
+        # asyncpg does not understand the SQLAlchemy driver suffix
+        self._dsn = (
+            make_url(database_uri)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._reconnect_delay = reconnect_delay
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._listen(),),
+            name="reference-data-listener",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        self._cache.invalidate(payload)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                try:
+                    await connection.add_listener(
+                        REFERENCE_DATA_CHANNEL, self._on_notification
+                    )
+                    # Changes missed while disconnected are unknown
+                    self._cache.clear()
+                    while not connection.is_closed():
+                        await asyncio.sleep(self._reconnect_delay)
+                finally:
+                    await connection.close()
+            except Exception as e:
+                logger.error(f"Reference data listener failed: {e}")
+            self._cache.clear()
+            await asyncio.sleep(self._reconnect_delay)
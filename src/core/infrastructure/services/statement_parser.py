@@ -0,0 +1,319 @@
+import csv
+import datetime
+import io
+import re
+from decimal import Decimal, InvalidOperation
+from typing import IO, Iterator
+
+from core.application.transaction.dto.statement_import import (
+    StatementImportRequestDTO,
+    StatementRowDTO,
+)
+from core.application.transaction.exceptions.invalid_statement import (
+    InvalidStatementException,
+)
+from core.application.transaction.ports.services.statement_parser import (
+    IStatementParser,
+)
+from core.domain.transaction.enums.statement import StatementFormat
+
+
+# Statements are decoded and tokenized in chunks of this many characters
+READ_CHUNK_SIZE = 64 * 1024
+
+OFX_TAG = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+OFX_DATE = re.compile(
+    r"^(\d{4})(\d{2})(\d{2})"
+    r"(?:(\d{2})(\d{2})(\d{2})?(?:\.\d+)?)?"
+    r"(?:\[([+-]?\d+(?:\.\d+)?)(?::[^\]]*)?\])?$"
+)
+QIF_DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%d.%m.%Y", "%Y-%m-%d")
+
+
+def parse_amount(value: str, decimal_separator: str = ".") -> Decimal:
+    """Parse an amount written with optional thousands separators."""
+    value = "".join(value.split())
+    thousands_separator = "," if decimal_separator == "." else "."
+    value = value.replace(thousands_separator, "")
+    try:
+        return Decimal(value.replace(decimal_separator, "."))
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid amount {value!r}") from e
+
+
+def parse_date(
+    value: str, formats: tuple[str, ...] | None = None
+) -> datetime.datetime:
+    """Parse a date, as ISO 8601 unless ``formats`` are given.
+
+    Dates without a time zone are taken to be in UTC.
+    """
+    value = value.strip()
+    date = None
+    if formats is None:
+        try:
+            date = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    else:
+        for date_format in formats:
+            try:
+                date = datetime.datetime.strptime(value, date_format)
+                break
+            except ValueError:
+                continue
+    if date is None:
+        raise ValueError(f"Invalid date {value!r}")
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.UTC)
+    return date
+
+
+def parse_ofx_date(value: str) -> datetime.datetime:
+    """Parse an OFX date such as ``20240105120000.000[-5:EST]``."""
+    match = OFX_DATE.match(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid date {value!r}")
+    year, month, day, hour, minute, second, offset = match.groups()
+    # OFX dates without an offset are in GMT
+    timezone = datetime.UTC
+    if offset is not None:
+        timezone = datetime.timezone(
+            datetime.timedelta(hours=float(offset))
+        )
+    return datetime.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        tzinfo=timezone,
+    )
+
+
+def _join(*values: str | None) -> str | None:
+    return " ".join(value for value in values if value) or None
+
+
+class CsvStatementParser(IStatementParser):
+    def __init__(
+        self,
+        delimiter: str = ",",
+        date_column: str = "date",
+        amount_column: str = "amount",
+        description_column: str = "description",
+        category_column: str = "category",
+        currency_column: str = "currency",
+        date_format: str | None = None,
+        decimal_separator: str = ".",
+        encoding: str = "utf-8-sig",
+    ):
+        self._delimiter = delimiter
+        self._date_column = date_column
+        self._amount_column = amount_column
+        self._description_column = description_column
+        self._category_column = category_column
+        self._currency_column = currency_column
+        self._date_formats = (date_format,) if date_format else None
+        self._decimal_separator = decimal_separator
+        self._encoding = encoding
+
+    def parse(self, stream: IO[bytes]) -> Iterator[StatementRowDTO]:
+        text = io.TextIOWrapper(
+            stream, encoding=self._encoding, errors="replace", newline=""
+        )
+        reader = csv.DictReader(text, delimiter=self._delimiter)
+        columns = set(reader.fieldnames or ())
+        missing = [
+            column
+            for column in (self._date_column, self._amount_column)
+            if column not in columns
+        ]
+        if missing:
+            raise InvalidStatementException(
+                f"Missing CSV columns: {', '.join(missing)}"
+            )
+
+        for record in reader:
+            row = StatementRowDTO.model_construct(
+                row=reader.line_num,
+                date=None,
+                amount=None,
+                description=record.get(self._description_column) or None,
+                label=record.get(self._category_column) or None,
+                currency_code=record.get(self._currency_column) or None,
+                error=None,
+            )
+            try:
+                row.date = parse_date(
+                    record[self._date_column] or "", self._date_formats
+                )
+                row.amount = parse_amount(
+                    record[self._amount_column] or "",
+                    self._decimal_separator,
+                )
+            except ValueError as e:
+                row.error = str(e)
+            yield row
+
+
+class OfxStatementParser(IStatementParser):
+    """Read ``STMTTRN`` records from OFX 1 (SGML) and OFX 2 (XML) files.
+
+    The payee is used as the label to map to a category.
+    """
+
+    def __init__(self, encoding: str = "utf-8-sig"):
+        self._encoding = encoding
+
+    def _iter_tags(self, stream: IO[bytes]) -> Iterator[tuple[bool, str, str]]:
+        text = io.TextIOWrapper(
+            stream, encoding=self._encoding, errors="replace"
+        )
+        buffer = ""
+        while True:
+            chunk = text.read(READ_CHUNK_SIZE)
+            buffer += chunk
+            # The last tag may continue in the next chunk
+            end = max(buffer.rfind("<"), 0) if chunk else len(buffer)
+            for match in OFX_TAG.finditer(buffer, 0, end):
+                closing, tag, value = match.groups()
+                yield bool(closing), tag.upper(), value.strip()
+            buffer = buffer[end:]
+            if not chunk:
+                return
+
+    def parse(self, stream: IO[bytes]) -> Iterator[StatementRowDTO]:
+        currency_code = None
+        record: dict[str, str] | None = None
+        position = 0
+        for closing, tag, value in self._iter_tags(stream):
+            if tag == "CURDEF":
+                currency_code = value or None
+            elif tag == "STMTTRN" and not closing:
+                record = {}
+            elif tag == "STMTTRN" and record is not None:
+                position += 1
+                yield self._to_row(position, record, currency_code)
+                record = None
+            elif record is not None and not closing:
+                record[tag] = value
+        if position == 0 and currency_code is None:
+            raise InvalidStatementException("Not an OFX statement")
+
+    @staticmethod
+    def _to_row(
+        position: int, record: dict[str, str], currency_code: str | None
+    ) -> StatementRowDTO:
+        payee = record.get("NAME") or record.get("PAYEE") or None
+        row = StatementRowDTO.model_construct(
+            row=position,
+            date=None,
+            amount=None,
+            description=_join(payee, record.get("MEMO")),
+            label=payee,
+            currency_code=currency_code,
+            error=None,
+        )
+        try:
+            row.date = parse_ofx_date(record.get("DTPOSTED", ""))
+            row.amount = parse_amount(
+                record.get("TRNAMT", ""),
+                "," if "," in record.get("TRNAMT", "") else ".",
+            )
+        except ValueError as e:
+            row.error = str(e)
+        return row
+
+
+class QifStatementParser(IStatementParser):
+    """Read bank and card records from QIF files.
+
+    The QIF category (``L``) is used as the label, or the payee when a
+    record has none. Split lines are ignored.
+    """
+
+    def __init__(
+        self,
+        date_format: str | None = None,
+        decimal_separator: str = ".",
+        encoding: str = "utf-8-sig",
+    ):
+        self._date_formats = (
+            (date_format,) if date_format else QIF_DATE_FORMATS
+        )
+        self._decimal_separator = decimal_separator
+        self._encoding = encoding
+
+    def parse(self, stream: IO[bytes]) -> Iterator[StatementRowDTO]:
+        text = io.TextIOWrapper(
+            stream, encoding=self._encoding, errors="replace"
+        )
+        record: dict[str, str] = {}
+        position = 0
+        for line in text:
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("!"):
+                continue
+            code, value = line[0], line[1:].strip()
+            if code == "^":
+                if record:
+                    position += 1
+                    yield self._to_row(position, record)
+                record = {}
+            # The first value wins, so split lines do not override it
+            elif code in "DTUPML":
+                record.setdefault(code, value)
+        if record:
+            position += 1
+            yield self._to_row(position, record)
+
+    def _to_row(
+        self, position: int, record: dict[str, str]
+    ) -> StatementRowDTO:
+        payee = record.get("P") or None
+        row = StatementRowDTO.model_construct(
+            row=position,
+            date=None,
+            amount=None,
+            description=_join(payee, record.get("M")),
+            label=record.get("L") or payee,
+            currency_code=None,
+            error=None,
+        )
+        try:
+            # Quicken writes dates such as " 1/ 5'24"
+            date = "".join(record.get("D", "").split()).replace("'", "/")
+            row.date = parse_date(date, self._date_formats)
+            row.amount = parse_amount(
+                record.get("T") or record.get("U") or "",
+                self._decimal_separator,
+            )
+        except ValueError as e:
+            row.error = str(e)
+        return row
+
+
+def get_statement_parser(
+    request: StatementImportRequestDTO,
+) -> IStatementParser:
+    if request.format == StatementFormat.OFX:
+        return OfxStatementParser(encoding=request.encoding)
+    if request.format == StatementFormat.QIF:
+        return QifStatementParser(
+            date_format=request.date_format,
+            decimal_separator=request.decimal_separator,
+            encoding=request.encoding,
+        )
+    return CsvStatementParser(
+        delimiter=request.delimiter,
+        date_column=request.date_column,
+        amount_column=request.amount_column,
+        description_column=request.description_column,
+        category_column=request.category_column,
+        currency_column=request.currency_column,
+        date_format=request.date_format,
+        decimal_separator=request.decimal_separator,
+        encoding=request.encoding,
+    )
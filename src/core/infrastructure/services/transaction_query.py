@@ -0,0 +1,351 @@
+from typing import Any, AsyncGenerator
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Row,
+    Select,
+    Subquery,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.application.transaction.dto.search import (
+    TransactionSearchResultDTO,
+    get_search_words,
+)
+from core.application.transaction.dto.statistics import (
+    TransactionStatisticsRowDTO,
+)
+from core.application.transaction.dto.transaction import TransactionDTO
+from core.application.transaction.ports.services.transaction_query import (
+    ITransactionQueryService,
+)
+from core.domain.transaction.enums.statistics import (
+    StatisticsGroup,
+    StatisticsPeriod,
+)
+from core.domain.transaction.exceptions.exchange_rate.not_found import (
+    ExchangeRateNotFoundException,
+)
+from core.domain.transaction.filters.transaction import TransactionFilters
+from core.domain.transaction.value_objects.transaction_cursor import (
+    TransactionCursor,
+    TransactionSearchCursor,
+)
+from core.infrastructure.database.models.category import Category
+from core.infrastructure.database.models.currency import Currency
+from core.infrastructure.database.models.operation import Operation
+from core.infrastructure.database.models.transaction import Transaction
+from core.infrastructure.database.models.transaction_rollup import (
+    TransactionRollup,
+)
+from core.infrastructure.repositories.exchange_rate import select_rate_at
+from core.infrastructure.repositories.transaction import (
+    apply_transaction_cursor,
+    apply_transaction_filters,
+)
+from core.infrastructure.repositories.transaction_rollup import (
+    TransactionRollupRepository,
+    apply_rollup_filters,
+    utc_date_trunc,
+)
+
+
+# Must match the configuration of the transactions.search_vector column
+SEARCH_CONFIG: ColumnElement = literal_column("'simple'::regconfig")
+
+
+def to_prefix_tsquery(query: str) -> str:
+    """Build a ``to_tsquery`` expression matching each word as a prefix.
+
+    Words only hold word characters, so they need no quoting.
+    """
+    return " & ".join(f"{word}:*" for word in get_search_words(query))
+
+
+class TransactionQueryService(ITransactionQueryService):
+    """Load transaction DTOs with a single joined SELECT.
+
+    Only the columns of ``TransactionDTO`` are fetched and no ORM objects
+    or entities are built, so a listing costs one round-trip regardless
+    of how many categories, operations and currencies it touches.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @staticmethod
+    def _select() -> Select:
+        return (
+            select(
+                Transaction.transaction_id,
+                Transaction.user_id,
+                Transaction.category_id,
+                Category.category_name,
+                Category.operation_id,
+                Operation.operation_name,
+                Operation.operation_type,
+                Transaction.currency_id,
+                Currency.currency_name,
+                Currency.currency_code,
+                Currency.currency_symbol,
+                Transaction.amount,
+                Transaction.description,
+                Transaction.date,
+            )
+            .join(Category, Transaction.category_id == Category.category_id)
+            .join(Operation, Category.operation_id == Operation.operation_id)
+            .join(Currency, Transaction.currency_id == Currency.currency_id)
+        )
+
+    @staticmethod
+    def _to_dto(row: Row[Any]) -> TransactionDTO:
+        values = row._asdict()
+        values["operation_type"] = Operation._get_operation_type(
+            values["operation_type"]
+        )
+        # Rows come straight from constrained columns, skip re-validation
+        return TransactionDTO.model_construct(**values)
+
+    @staticmethod
+    def _to_search_dto(row: Row[Any]) -> TransactionSearchResultDTO:
+        values = row._asdict()
+        values["operation_type"] = Operation._get_operation_type(
+            values["operation_type"]
+        )
+        return TransactionSearchResultDTO.model_construct(**values)
+
+    @staticmethod
+    def _to_statistics_dto(row: Row[Any]) -> TransactionStatisticsRowDTO:
+        values = row._asdict()
+        values.pop("unconverted", None)
+        if "operation_type" in values:
+            values["operation_type"] = Operation._get_operation_type(
+                values["operation_type"]
+            )
+        return TransactionStatisticsRowDTO.model_construct(**values)
+
+    async def get_by_filters(
+        self, filters: TransactionFilters
+    ) -> list[TransactionDTO]:
+        stmt = apply_transaction_filters(self._select(), filters)
+        result = await self._session.execute(stmt)
+        return [self._to_dto(row) for row in result]
+
+    async def get_page_by_filters(
+        self,
+        filters: TransactionFilters,
+        limit: int,
+        after: TransactionCursor | None = None,
+    ) -> list[TransactionDTO]:
+        stmt = apply_transaction_filters(self._select(), filters)
+        stmt = apply_transaction_cursor(stmt, after).limit(limit)
+        result = await self._session.execute(stmt)
+        return [self._to_dto(row) for row in result]
+
+    async def search(
+        self,
+        filters: TransactionFilters,
+        query: str,
+        limit: int,
+        after: TransactionSearchCursor | None = None,
+    ) -> list[TransactionSearchResultDTO]:
+        ts_query = func.to_tsquery(SEARCH_CONFIG, to_prefix_tsquery(query))
+        # Either condition can use its GIN index, combined in a BitmapOr
+        matches_words = Transaction.search_vector.op("@@")(ts_query)
+        matches_trigrams = literal(query).op("<%")(Transaction.description)
+        rank = (
+            func.ts_rank_cd(Transaction.search_vector, ts_query)
+            + func.word_similarity(query, Transaction.description)
+        ).label("rank")
+
+        stmt = self._select().add_columns(rank)
+        stmt = apply_transaction_filters(stmt, filters)
+        stmt = stmt.filter(or_(matches_words, matches_trigrams))
+        if after is not None:
+            stmt = stmt.filter(
+                tuple_(rank, Transaction.date, Transaction.transaction_id)
+                < tuple_(
+                    literal(after.rank),
+                    literal(after.date, Transaction.date.type),
+                    literal(
+                        after.transaction_id, Transaction.transaction_id.type
+                    ),
+                )
+            )
+        stmt = stmt.order_by(
+            rank.desc(),
+            Transaction.date.desc(),
+            Transaction.transaction_id.desc(),
+        ).limit(limit)
+        result = await self._session.execute(stmt)
+        return [self._to_search_dto(row) for row in result]
+
+    async def stream_by_filters(
+        self, filters: TransactionFilters, chunk_size: int
+    ) -> AsyncGenerator[list[TransactionDTO], None]:
+        stmt = apply_transaction_filters(self._select(), filters)
+        stmt = apply_transaction_cursor(stmt, None)
+        result = await self._session.stream(
+            stmt.execution_options(yield_per=chunk_size)
+        )
+        try:
+            async for rows in result.partitions():
+                yield [self._to_dto(row) for row in rows]
+        finally:
+            await result.close()
+
+    @staticmethod
+    def _select_statistics(
+        source: type[Transaction] | type[TransactionRollup] | Subquery,
+        date: Any,
+        total: Any,
+        count: Any,
+        period: StatisticsPeriod,
+        group_by: list[StatisticsGroup],
+    ) -> Select:
+        groups = set(group_by)
+        columns = source.c if isinstance(source, Subquery) else source
+        keys: list[Any] = [
+            utc_date_trunc(period.value, date).label("period_start"),
+            columns.currency_id,
+            Currency.currency_code,
+            Currency.currency_symbol,
+        ]
+        if StatisticsGroup.OPERATION_TYPE in groups:
+            keys.append(Operation.operation_type)
+        if StatisticsGroup.OPERATION in groups:
+            keys.extend([Category.operation_id, Operation.operation_name])
+        if StatisticsGroup.CATEGORY in groups:
+            keys.extend([columns.category_id, Category.category_name])
+
+        stmt = (
+            select(*keys, total.label("total"), count.label("count"))
+            .select_from(source)
+            .join(Currency, columns.currency_id == Currency.currency_id)
+        )
+        # Categories and operations are joined only when grouped by
+        if groups & {
+            StatisticsGroup.OPERATION_TYPE,
+            StatisticsGroup.OPERATION,
+            StatisticsGroup.CATEGORY,
+        }:
+            stmt = stmt.join(
+                Category, columns.category_id == Category.category_id
+            )
+        if groups & {
+            StatisticsGroup.OPERATION_TYPE,
+            StatisticsGroup.OPERATION,
+        }:
+            stmt = stmt.join(
+                Operation, Category.operation_id == Operation.operation_id
+            )
+        return stmt.group_by(*keys).order_by(*keys)
+
+    @staticmethod
+    def _select_converted(
+        filters: TransactionFilters, currency_id: UUID
+    ) -> Subquery:
+        """Select the filtered transactions with amounts in ``currency_id``.
+
+        Amounts are converted at the rates in effect on the UTC day of the
+        transaction, looked up per row; the amount is ``NULL`` when either
+        currency has no rate yet.
+        """
+        day = cast(func.timezone("UTC", Transaction.date), Date)
+        amount = case(
+            (Transaction.currency_id == currency_id, Transaction.amount),
+            else_=Transaction.amount
+            * select_rate_at(currency_id, day)
+            / select_rate_at(Transaction.currency_id, day),
+        )
+        stmt = select(
+            Transaction.date,
+            Transaction.category_id,
+            literal(currency_id).label("currency_id"),
+            amount.label("amount"),
+        )
+        return apply_transaction_filters(stmt, filters).subquery()
+
+    async def get_statistics(
+        self,
+        filters: TransactionFilters,
+        period: StatisticsPeriod,
+        group_by: list[StatisticsGroup],
+        convert_to: UUID | None = None,
+    ) -> list[TransactionStatisticsRowDTO]:
+        if convert_to is not None:
+            return await self._get_converted_statistics(
+                filters, period, group_by, convert_to
+            )
+        # Monthly and yearly totals over whole months come from the
+        # rollups, which hold one row per month, category and currency
+        if period in (
+            StatisticsPeriod.MONTH,
+            StatisticsPeriod.YEAR,
+        ) and TransactionRollupRepository.can_answer(filters):
+            stmt = self._select_statistics(
+                TransactionRollup,
+                TransactionRollup.month,
+                func.sum(TransactionRollup.total),
+                func.sum(TransactionRollup.count),
+                period,
+                group_by,
+            )
+            stmt = apply_rollup_filters(stmt, filters)
+        else:
+            stmt = self._select_statistics(
+                Transaction,
+                Transaction.date,
+                func.sum(Transaction.amount),
+                func.count(),
+                period,
+                group_by,
+            )
+            stmt = apply_transaction_filters(stmt, filters)
+
+        result = await self._session.execute(stmt)
+        return [self._to_statistics_dto(row) for row in result]
+
+    async def _get_converted_statistics(
+        self,
+        filters: TransactionFilters,
+        period: StatisticsPeriod,
+        group_by: list[StatisticsGroup],
+        convert_to: UUID,
+    ) -> list[TransactionStatisticsRowDTO]:
+        # Rates change daily, so converted totals always come from the
+        # transactions rather than from the monthly rollups
+        converted = self._select_converted(filters, convert_to)
+        stmt = self._select_statistics(
+            converted,
+            converted.c.date,
+            func.round(func.sum(converted.c.amount), 2),
+            func.count(),
+            period,
+            group_by,
+        ).add_columns(
+            func.count()
+            .filter(converted.c.amount.is_(None))
+            .label("unconverted")
+        )
+
+        result = await self._session.execute(stmt)
+        rows = []
+        for row in result:
+            if row.unconverted:
+                raise ExchangeRateNotFoundException(
+                    f"No exchange rate for {row.unconverted} transactions "
+                    f"of the period starting {row.period_start.date()}"
+                )
+            rows.append(self._to_statistics_dto(row))
+        return rows
@@ -0,0 +1,48 @@
+import threading
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from core.application.user.dto.user import UserDTO
+from core.application.user.ports.services.user_cache import IUserCacheService
+
+
+class InMemoryUserCacheService(IUserCacheService):
+    """Per-process TTL cache of authenticated users with LRU eviction."""
+
+    def __init__(self, ttl: float, max_size: int):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[UUID, tuple[float, UserDTO]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID) -> UserDTO | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return user
+
+    def set(self, user: UserDTO) -> None:
+        if self._max_size <= 0 or self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[user.user_id] = (time.monotonic() + self._ttl, user)
+            self._entries.move_to_end(user.user_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
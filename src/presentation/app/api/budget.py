@@ -0,0 +1,959 @@
+from uuid import UUID
+
+from flask import Blueprint, jsonify, request, session
+from loguru import logger
+from pydantic import ValidationError
+
+from core.application.transaction.dto.budget import CreateBudgetDTO
+from core.application.transaction.use_cases.budget.create import (
+    CreateBudgetUseCase,
+)
+from core.application.transaction.use_cases.budget.delete import (
+    DeleteBudgetUseCase,
+)
+from core.application.transaction.use_cases.budget.get_all_by_user import (
+    GetAllBudgetsByUserUseCase,
+)
+from core.application.transaction.use_cases.budget.get_status import (
+    GetBudgetStatusUseCase,
+)
+from core.domain.transaction.exceptions.budget.not_found import (
+    BudgetNotFoundException,
+)
+from core.domain.transaction.exceptions.category.not_found import (
+    CategoryNotFoundException,
+)
+from core.domain.transaction.exceptions.currency.not_found import (
+    CurrencyNotFoundException,
+)
+from core.domain.transaction.exceptions.operation.not_found import (
+    OperationNotFoundException,
+)
+from core.infrastructure.repositories.budget import BudgetRepository
+from core.infrastructure.repositories.cached import (
+    CachedCategoryRepository,
+    CachedCurrencyRepository,
+    CachedOperationRepository,
+)
+from core.shared.exceptions import ForbiddenException
+from presentation.app.utils.database import RequestSessionContextManager
+from presentation.app.utils.permissions import has_permissions
+from presentation.app.utils.serialization import model_json_response
+from presentation.app.utils.tools import (
+    get_current_user,
+    get_parsed_errors,
+    reference_cache,
+)
+
+
+budget_api_bp = Blueprint("budget_api", __name__)
+
+
+@budget_api_bp.route("", methods=["POST"])
+async def create_budget():
+    """
+    Create a budget
+    Limits the spend of a category or of a whole operation per week,
+    month or year, in one currency. Spend counts from the current period;
+    an alert is queued the first time each threshold is reached.
+    ---
+    tags:
+      - Budgets
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          properties:
+            category_id:
+              type: string
+              format: uuid
+              description: Required unless operation_id is given
+              example: "123e4567-e39b-12d3-a456-426614174000"
+            operation_id:
+              type: string
+              format: uuid
+              description: Required unless category_id is given
+              example: null
+            currency_id:
+              type: string
+              format: uuid
+              example: "123e4567-e39b-12d3-a456-426614174000"
+            period:
+              type: string
+              enum: [week, month, year]
+              example: "month"
+            limit:
+              type: string
+              example: "500.00"
+            thresholds:
+              type: array
+              description: Percents of the limit that raise an alert
+              items:
+                type: integer
+              example: [80, 100]
+    responses:
+      201:
+        description: Budget created
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            budget:
+              type: object
+              properties:
+                budget_id:
+                  type: string
+                  format: uuid
+                  example: "123e4567-e39b-12d3-a456-426614174000"
+                category_id:
+                  type: string | null
+                  format: uuid
+                  example: "123e4567-e39b-12d3-a456-426614174000"
+                operation_id:
+                  type: string | null
+                  format: uuid
+                  example: null
+                currency_id:
+                  type: string
+                  format: uuid
+                  example: "123e4567-e39b-12d3-a456-426614174000"
+                currency_code:
+                  type: string
+                  example: "USD"
+                currency_symbol:
+                  type: string
+                  example: "$"
+                period:
+                  type: string
+                  example: "month"
+                limit:
+                  type: string
+                  example: "500.00"
+                thresholds:
+                  type: array
+                  items:
+                    type: integer
+                  example: [80, 100]
+                created_at:
+                  type: string
+                  format: date-time
+                  example: "2024-11-05T10:00:00+00:00"
+      422:
+        description: Unprocessable Entity (Invalid body)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_BODY"
+                message:
+                  type: string
+                  example: "The request body is invalid"
+                errors:
+                  type: object
+                  example:
+                    period: "Input should be 'week', 'month' or 'year'"
+      404:
+        description: Category not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CATEGORY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Category not found"
+      404.1:
+        description: Operation not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "OPERATION_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Operation not found"
+      404.2:
+        description: Currency not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CURRENCY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Currency not found"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        body = request.get_json()
+
+        try:
+            create_dto = CreateBudgetDTO(user_id=user.user_id, **body)
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": "The request body is invalid",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = CreateBudgetUseCase(
+                BudgetRepository(db_session),
+                CachedCategoryRepository(db_session, reference_cache),
+                CachedOperationRepository(db_session, reference_cache),
+                CachedCurrencyRepository(db_session, reference_cache),
+            )
+            try:
+                budget = await use_case.execute(create_dto)
+            except CategoryNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "CATEGORY_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+            except OperationNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "OPERATION_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+            except CurrencyNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "CURRENCY_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response({"ok": True, "budget": budget}, 201)
+
+
+@budget_api_bp.route("/me", methods=["GET"])
+async def get_user_budgets():
+    """
+    Get the budgets of the current user
+    ---
+    tags:
+      - Budgets
+    responses:
+      200:
+        description: Budgets, oldest first
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            budgets:
+              type: array
+              items:
+                type: object
+                properties:
+                  budget_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  category_id:
+                    type: string | null
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  operation_id:
+                    type: string | null
+                    format: uuid
+                    example: null
+                  currency_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  currency_code:
+                    type: string
+                    example: "USD"
+                  currency_symbol:
+                    type: string
+                    example: "$"
+                  period:
+                    type: string
+                    example: "month"
+                  limit:
+                    type: string
+                    example: "500.00"
+                  thresholds:
+                    type: array
+                    items:
+                      type: integer
+                    example: [80, 100]
+                  created_at:
+                    type: string
+                    format: date-time
+                    example: "2024-11-05T10:00:00+00:00"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = GetAllBudgetsByUserUseCase(BudgetRepository(db_session))
+            budgets = await use_case.execute(user.user_id)
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response({"ok": True, "budgets": budgets})
+
+
+@budget_api_bp.route("/<uuid:budget_id>", methods=["GET"])
+async def get_budget_status(budget_id: UUID):
+    """
+    Get the status of a budget
+    Spend of the current period, read from a running total kept up to
+    date by every transaction write.
+    ---
+    tags:
+      - Budgets
+    parameters:
+      - in: path
+        name: budget_id
+        required: true
+        schema:
+          type: string
+          format: uuid
+          example: "123e4567-e39b-12d3-a456-426614174000"
+    responses:
+      200:
+        description: Budget status
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            status:
+              type: object
+              properties:
+                budget:
+                  type: object
+                  properties:
+                    budget_id:
+                      type: string
+                      format: uuid
+                      example: "123e4567-e39b-12d3-a456-426614174000"
+                    category_id:
+                      type: string | null
+                      format: uuid
+                      example: "123e4567-e39b-12d3-a456-426614174000"
+                    operation_id:
+                      type: string | null
+                      format: uuid
+                      example: null
+                    currency_id:
+                      type: string
+                      format: uuid
+                      example: "123e4567-e39b-12d3-a456-426614174000"
+                    currency_code:
+                      type: string
+                      example: "USD"
+                    currency_symbol:
+                      type: string
+                      example: "$"
+                    period:
+                      type: string
+                      example: "month"
+                    limit:
+                      type: string
+                      example: "500.00"
+                    thresholds:
+                      type: array
+                      items:
+                        type: integer
+                      example: [80, 100]
+                    created_at:
+                      type: string
+                      format: date-time
+                      example: "2024-11-05T10:00:00+00:00"
+                period_start:
+                  type: string
+                  format: date-time
+                  example: "2024-11-01T00:00:00+00:00"
+                spent:
+                  type: string
+                  example: "420.00"
+                remaining:
+                  type: string
+                  example: "80.00"
+                percent_used:
+                  type: string
+                  example: "84.00"
+                thresholds_reached:
+                  type: array
+                  items:
+                    type: integer
+                  example: [80]
+      404:
+        description: Budget not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "BUDGET_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Budget not found"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = GetBudgetStatusUseCase(BudgetRepository(db_session))
+            try:
+                status = await use_case.execute(
+                    user_id=user.user_id, budget_id=budget_id
+                )
+            except ForbiddenException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "FORBIDDEN",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    403,
+                )
+            except BudgetNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "BUDGET_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response({"ok": True, "status": status})
+
+
+@budget_api_bp.route("/<uuid:budget_id>", methods=["DELETE"])
+async def delete_budget(budget_id: UUID):
+    """
+    Delete a budget
+    Its spend and undelivered alerts are deleted with it.
+    ---
+    tags:
+      - Budgets
+    parameters:
+      - in: path
+        name: budget_id
+        required: true
+        schema:
+          type: string
+          format: uuid
+          example: "123e4567-e39b-12d3-a456-426614174000"
+    responses:
+      200:
+        description: Budget deleted
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+      404:
+        description: Budget not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "BUDGET_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Budget not found"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = DeleteBudgetUseCase(BudgetRepository(db_session))
+            try:
+                await use_case.execute(
+                    user_id=user.user_id, budget_id=budget_id
+                )
+            except ForbiddenException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "FORBIDDEN",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    403,
+                )
+            except BudgetNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "BUDGET_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return jsonify({"ok": True}), 200
@@ -4,7 +4,14 @@ from flask import Blueprint, jsonify, request, session
 from loguru import logger
 from pydantic import ValidationError
 
+from core.application.transaction.dto.autocomplete import (
+    AutocompleteItemDTO,
+    AutocompleteRequestDTO,
+)
 from core.application.transaction.dto.category import CreateCategoryDTO
+from core.application.transaction.use_cases.category.autocomplete import (  # noqa: E501
+    AutocompleteCategoriesUseCase,
+)
 from core.application.transaction.use_cases.category.create import (
     CreateCategoryUseCase,
 )
@@ -29,11 +36,24 @@ from core.domain.transaction.exceptions.category.not_found import (
 from core.domain.transaction.exceptions.operation.not_found import (
     OperationNotFoundException,
 )
-from core.infrastructure.database.core import SessionContextManager
-from core.infrastructure.repositories.category import CategoryRepository
-from core.infrastructure.repositories.operation import OperationRepository
+from core.infrastructure.repositories.cached import (
+    CachedCategoryRepository,
+    CachedOperationRepository,
+)
+from core.infrastructure.services.reference_autocomplete import (
+    CachedReferenceAutocompleteService,
+)
+from presentation.app.utils.caching import (
+    get_not_modified_response,
+    set_reference_cache_headers,
+)
+from presentation.app.utils.database import RequestSessionContextManager
 from presentation.app.utils.permissions import has_permissions
-from presentation.app.utils.tools import get_current_user, get_parsed_errors
+from presentation.app.utils.tools import (
+    get_current_user,
+    get_parsed_errors,
+    reference_cache,
+)
 
 
 category_api_bp = Blueprint("category_api", __name__)
@@ -241,9 +261,13 @@ async def create_category():
                 422,
             )
 
-        async with SessionContextManager() as db_session:
-            category_repository = CategoryRepository(db_session)
-            operation_repository = OperationRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            category_repository = CachedCategoryRepository(
+                db_session, reference_cache
+            )
+            operation_repository = CachedOperationRepository(
+                db_session, reference_cache
+            )
             use_case = CreateCategoryUseCase(
                 category_repository, operation_repository
             )
@@ -341,9 +365,16 @@ async def get_all_categories():
                   type: string
                   example: "Something went wrong"
     """
+    etag = reference_cache.etag(CachedCategoryRepository.kind)
+    not_modified_response = get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
+
     try:
-        async with SessionContextManager() as db_session:
-            category_repository = CategoryRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            category_repository = CachedCategoryRepository(
+                db_session, reference_cache
+            )
             use_case = GetAllCategoriesUseCase(category_repository)
             categories = await use_case.execute()
     except Exception as e:
@@ -361,14 +392,17 @@ async def get_all_categories():
             500,
         )
 
+    response = jsonify(
+        {
+            "ok": True,
+            "categories": [
+                category.model_dump() for category in categories
+            ],
+        }
+    )
     return (
-        jsonify(
-            {
-                "ok": True,
-                "categories": [
-                    category.model_dump() for category in categories
-                ],
-            }
+        set_reference_cache_headers(
+            response, etag, CachedCategoryRepository.kind
         ),
         200,
     )
@@ -390,6 +424,33 @@ async def autocomplete_category():
           type: string
           format: uuid
           example: "00000000-0000-0000-0000-000000000000"
+      - in: query
+        name: q
+        required: false
+        description: >
+          Prefix of the label or of one of its words; with `q`, `limit`
+          or `match` at most `limit` suggestions are returned
+        schema:
+          type: string
+          example: "прод"
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+          minimum: 1
+          maximum: 100
+          default: 20
+      - in: query
+        name: match
+        required: false
+        description: >
+          prefix ignores case; folded also ignores accents, stress marks
+          and apostrophes
+        schema:
+          type: string
+          enum: [prefix, folded]
+          default: folded
     responses:
       200:
         description: Categories list
@@ -402,6 +463,27 @@ async def autocomplete_category():
             value:
               type: string
               example: "00000000-0000-0000-0000-000000000000"
+      422:
+        description: Unprocessable Entity (Invalid query)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_QUERY"
+                message:
+                  type: string
+                  example: "The query parameters are invalid"
+                errors:
+                  type: object
+                  example:
+                    limit: "Input should be less than or equal to 100"
       500:
         description: Internal Server Error
         schema:
@@ -420,6 +502,11 @@ async def autocomplete_category():
                   type: string
                   example: "Something went wrong"
     """
+    etag = reference_cache.etag(CachedCategoryRepository.kind)
+    not_modified_response = get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
+
     try:
         query = request.args.to_dict()
         try:
@@ -431,16 +518,60 @@ async def autocomplete_category():
         except ValueError:
             operation_id = None
 
-        async with SessionContextManager() as db_session:
-            category_repository = CategoryRepository(db_session)
-            if operation_id is None:
-                use_case = GetAllCategoriesUseCase(category_repository)
-                categories = await use_case.execute()
-            else:
-                use_case_by_operation = GetAllCategoriesByOperationUseCase(
-                    category_repository
+        autocomplete_request = None
+        if {"q", "limit", "match"} & query.keys():
+            try:
+                autocomplete_request = AutocompleteRequestDTO.model_validate(
+                    query
+                )
+            except ValidationError as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "INVALID_QUERY",
+                                "message": "The query parameters are invalid",
+                                "errors": get_parsed_errors(e),
+                            },
+                        }
+                    ),
+                    422,
                 )
-                categories = await use_case_by_operation.execute(operation_id)
+
+        async with RequestSessionContextManager() as db_session:
+            category_repository = CachedCategoryRepository(
+                db_session, reference_cache
+            )
+            if autocomplete_request is not None:
+                autocomplete_use_case = AutocompleteCategoriesUseCase(
+                    CachedReferenceAutocompleteService(
+                        db_session, reference_cache
+                    )
+                )
+                suggestions = await autocomplete_use_case.execute(
+                    autocomplete_request, operation_id
+                )
+            else:
+                if operation_id is None:
+                    use_case = GetAllCategoriesUseCase(category_repository)
+                    categories = await use_case.execute()
+                else:
+                    use_case_by_operation = (
+                        GetAllCategoriesByOperationUseCase(
+                            category_repository
+                        )
+                    )
+                    categories = await use_case_by_operation.execute(
+                        operation_id
+                    )
+                suggestions = [
+                    AutocompleteItemDTO(
+                        label=category.category_name,
+                        value=category.category_id,
+                    )
+                    for category in categories
+                ]
 
     except Exception as e:
         logger.error(e)
@@ -457,15 +588,15 @@ async def autocomplete_category():
             500,
         )
 
+    response = jsonify(
+        [
+            {"label": item.label, "value": str(item.value)}
+            for item in suggestions
+        ]
+    )
     return (
-        jsonify(
-            [
-                {
-                    "label": category.category_name,
-                    "value": str(category.category_id),
-                }
-                for category in categories
-            ]
+        set_reference_cache_headers(
+            response, etag, CachedCategoryRepository.kind
         ),
         200,
     )
@@ -613,8 +744,10 @@ async def delete_category(operation_id: UUID):
                 403,
             )
 
-        async with SessionContextManager() as db_session:
-            category_repository = CategoryRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            category_repository = CachedCategoryRepository(
+                db_session, reference_cache
+            )
             use_case = DeleteCategoryUseCase(category_repository)
             try:
                 await use_case.execute(operation_id)
@@ -4,7 +4,20 @@ from flask import Blueprint, jsonify, request, session
 from loguru import logger
 from pydantic import ValidationError
 
+from core.application.transaction.dto.autocomplete import (
+    AutocompleteItemDTO,
+    AutocompleteRequestDTO,
+)
 from core.application.transaction.dto.currency import CreateCurrencyDTO
+from core.application.transaction.dto.exchange_rate import (
+    ConvertMoneyRequestDTO,
+)
+from core.application.transaction.use_cases.currency.autocomplete import (  # noqa: E501
+    AutocompleteCurrenciesUseCase,
+)
+from core.application.transaction.use_cases.currency.convert import (
+    ConvertMoneyUseCase,
+)
 from core.application.transaction.use_cases.currency.create import (
     CreateCurrencyUseCase,
 )
@@ -23,10 +36,28 @@ from core.domain.transaction.exceptions.currency.delete import (
 from core.domain.transaction.exceptions.currency.not_found import (
     CurrencyNotFoundException,
 )
-from core.infrastructure.database.core import SessionContextManager
-from core.infrastructure.repositories.currency import CurrencyRepository
+from core.domain.transaction.exceptions.exchange_rate.not_found import (
+    ExchangeRateNotFoundException,
+)
+from core.infrastructure.repositories.cached import CachedCurrencyRepository
+from core.infrastructure.repositories.exchange_rate import (
+    ExchangeRateRepository,
+)
+from core.infrastructure.services.reference_autocomplete import (
+    CachedReferenceAutocompleteService,
+)
+from presentation.app.utils.caching import (
+    get_not_modified_response,
+    set_reference_cache_headers,
+)
+from presentation.app.utils.database import RequestSessionContextManager
 from presentation.app.utils.permissions import has_permissions
-from presentation.app.utils.tools import get_current_user, get_parsed_errors
+from presentation.app.utils.serialization import model_json_response
+from presentation.app.utils.tools import (
+    get_current_user,
+    get_parsed_errors,
+    reference_cache,
+)
 
 
 currency_api_bp = Blueprint("currency_api", __name__)
@@ -224,8 +255,10 @@ async def create_currency():
                 422,
             )
 
-        async with SessionContextManager() as db_session:
-            category_repository = CurrencyRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            category_repository = CachedCurrencyRepository(
+                db_session, reference_cache
+            )
             use_case = CreateCurrencyUseCase(category_repository)
             try:
                 currency = await use_case.execute(create_currency_dto)
@@ -311,9 +344,16 @@ async def get_currency():
                   type: string
                   example: "Something went wrong"
     """
+    etag = reference_cache.etag(CachedCurrencyRepository.kind)
+    not_modified_response = get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
+
     try:
-        async with SessionContextManager() as db_session:
-            category_repository = CurrencyRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            category_repository = CachedCurrencyRepository(
+                db_session, reference_cache
+            )
             use_case = GetAllCurrencyUseCase(category_repository)
             currencies = await use_case.execute()
     except Exception as e:
@@ -331,14 +371,17 @@ async def get_currency():
             500,
         )
 
+    response = jsonify(
+        {
+            "ok": True,
+            "currencies": [
+                currency.model_dump() for currency in currencies
+            ],
+        }
+    )
     return (
-        jsonify(
-            {
-                "ok": True,
-                "currencies": [
-                    currency.model_dump() for currency in currencies
-                ],
-            }
+        set_reference_cache_headers(
+            response, etag, CachedCurrencyRepository.kind
         ),
         200,
     )
@@ -352,6 +395,34 @@ async def autocomplete_currency():
     tags:
       - Currencies
       - Autocomplete
+    parameters:
+      - in: query
+        name: q
+        required: false
+        description: >
+          Prefix of the label or of one of its words; with `q`, `limit`
+          or `match` at most `limit` suggestions are returned
+        schema:
+          type: string
+          example: "usd"
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+          minimum: 1
+          maximum: 100
+          default: 20
+      - in: query
+        name: match
+        required: false
+        description: >
+          prefix ignores case; folded also ignores accents, stress marks
+          and apostrophes
+        schema:
+          type: string
+          enum: [prefix, folded]
+          default: folded
     responses:
       200:
         description: Categories list
@@ -364,6 +435,27 @@ async def autocomplete_currency():
             value:
               type: string
               example: "00000000-0000-0000-0000-000000000000"
+      422:
+        description: Unprocessable Entity (Invalid query)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_QUERY"
+                message:
+                  type: string
+                  example: "The query parameters are invalid"
+                errors:
+                  type: object
+                  example:
+                    limit: "Input should be less than or equal to 100"
       500:
         description: Internal Server Error
         schema:
@@ -382,11 +474,60 @@ async def autocomplete_currency():
                   type: string
                   example: "Something went wrong"
     """
+    etag = reference_cache.etag(CachedCurrencyRepository.kind)
+    not_modified_response = get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
+
     try:
-        async with SessionContextManager() as db_session:
-            category_repository = CurrencyRepository(db_session)
-            use_case = GetAllCurrencyUseCase(category_repository)
-            currencies = await use_case.execute()
+        query = request.args.to_dict()
+        autocomplete_request = None
+        if {"q", "limit", "match"} & query.keys():
+            try:
+                autocomplete_request = AutocompleteRequestDTO.model_validate(
+                    query
+                )
+            except ValidationError as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "INVALID_QUERY",
+                                "message": "The query parameters are invalid",
+                                "errors": get_parsed_errors(e),
+                            },
+                        }
+                    ),
+                    422,
+                )
+
+        async with RequestSessionContextManager() as db_session:
+            if autocomplete_request is not None:
+                autocomplete_use_case = AutocompleteCurrenciesUseCase(
+                    CachedReferenceAutocompleteService(
+                        db_session, reference_cache
+                    )
+                )
+                suggestions = await autocomplete_use_case.execute(
+                    autocomplete_request
+                )
+            else:
+                category_repository = CachedCurrencyRepository(
+                    db_session, reference_cache
+                )
+                use_case = GetAllCurrencyUseCase(category_repository)
+                currencies = await use_case.execute()
+                suggestions = [
+                    AutocompleteItemDTO(
+                        label=(
+                            f"{currency.currency_code} "
+                            f"{currency.currency_symbol}"
+                        ),
+                        value=currency.currency_id,
+                    )
+                    for currency in currencies
+                ]
     except Exception as e:
         logger.error(e)
         return (
@@ -402,23 +543,310 @@ async def autocomplete_currency():
             500,
         )
 
+    response = jsonify(
+        [
+            {"label": item.label, "value": str(item.value)}
+            for item in suggestions
+        ]
+    )
     return (
-        jsonify(
-            [
-                {
-                    "label": (
-                        f"{currency.currency_code} "
-                        f"{currency.currency_symbol}"
-                    ),
-                    "value": str(currency.currency_id),
-                }
-                for currency in currencies
-            ]
+        set_reference_cache_headers(
+            response, etag, CachedCurrencyRepository.kind
         ),
         200,
     )
 
 
+@currency_api_bp.route("/convert", methods=["POST"])
+async def convert_currency():
+    """
+    Convert amounts to one currency
+    Each amount is converted at the exchange rates in effect on its date;
+    the rates of all currencies involved are loaded in one query.
+    ---
+    tags:
+      - Currencies
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          properties:
+            currency_id:
+              type: string
+              format: uuid
+              example: "00000000-0000-0000-0000-000000000000"
+            amounts:
+              type: array
+              maxItems: 1000
+              items:
+                type: object
+                properties:
+                  currency_id:
+                    type: string
+                    format: uuid
+                    example: "00000000-0000-0000-0000-000000000001"
+                  amount:
+                    type: string
+                    example: "100.00"
+                  date:
+                    type: string
+                    format: date
+                    example: "2024-11-01"
+    responses:
+      200:
+        description: Converted amounts
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            conversion:
+              type: object
+              properties:
+                currency_id:
+                  type: string
+                  format: uuid
+                  example: "00000000-0000-0000-0000-000000000000"
+                currency_code:
+                  type: string
+                  example: "EUR"
+                currency_symbol:
+                  type: string
+                  example: "€"
+                amounts:
+                  type: array
+                  items:
+                    type: object
+                    properties:
+                      currency_id:
+                        type: string
+                        format: uuid
+                        example: "00000000-0000-0000-0000-000000000001"
+                      amount:
+                        type: string
+                        example: "100.00"
+                      date:
+                        type: string
+                        format: date
+                        example: "2024-11-01"
+                      converted_amount:
+                        type: string
+                        example: "92.31"
+                total:
+                  type: string
+                  example: "92.31"
+      422:
+        description: Unprocessable Entity (Invalid body)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_BODY"
+                message:
+                  type: string
+                  example: "The request body is invalid"
+                errors:
+                  type: object
+                  example:
+                    currency_id:
+                      - "Field required"
+      404:
+        description: Currency not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CURRENCY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Currency with id {currency_id} not found"
+      404.1:
+        description: Exchange rate not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "EXCHANGE_RATE_NOT_FOUND"
+                message:
+                  type: string
+                  example: "No exchange rate for 'USD' on 2024-11-01"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        try:
+            convert_money_dto = ConvertMoneyRequestDTO.model_validate(
+                request.get_json()
+            )
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": "The request body is invalid",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = ConvertMoneyUseCase(
+                ExchangeRateRepository(db_session),
+                CachedCurrencyRepository(db_session, reference_cache),
+            )
+            try:
+                conversion = await use_case.execute(convert_money_dto)
+            except CurrencyNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "CURRENCY_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+            except ExchangeRateNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "EXCHANGE_RATE_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response({"ok": True, "conversion": conversion})
+
+
 @currency_api_bp.route("/<uuid:currency_id>", methods=["DELETE"])
 async def delete_currency(currency_id: UUID):
     """
@@ -561,8 +989,10 @@ async def delete_currency(currency_id: UUID):
                 403,
             )
 
-        async with SessionContextManager() as db_session:
-            category_repository = CurrencyRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            category_repository = CachedCurrencyRepository(
+                db_session, reference_cache
+            )
             use_case = DeleteCurrencyUseCase(category_repository)
             try:
                 await use_case.execute(currency_id)
@@ -4,7 +4,14 @@ from flask import Blueprint, jsonify, request, session
 from loguru import logger
 from pydantic import ValidationError
 
+from core.application.transaction.dto.autocomplete import (
+    AutocompleteItemDTO,
+    AutocompleteRequestDTO,
+)
 from core.application.transaction.dto.operation import CreateOperationDTO
+from core.application.transaction.use_cases.operation.autocomplete import (  # noqa: E501
+    AutocompleteOperationsUseCase,
+)
 from core.application.transaction.use_cases.operation.create import (
     CreateOperationUseCase,
 )
@@ -23,10 +30,21 @@ from core.domain.transaction.exceptions.operation.delete import (
 from core.domain.transaction.exceptions.operation.not_found import (
     OperationNotFoundException,
 )
-from core.infrastructure.database.core import SessionContextManager
-from core.infrastructure.repositories.operation import OperationRepository
+from core.infrastructure.repositories.cached import CachedOperationRepository
+from core.infrastructure.services.reference_autocomplete import (
+    CachedReferenceAutocompleteService,
+)
+from presentation.app.utils.caching import (
+    get_not_modified_response,
+    set_reference_cache_headers,
+)
+from presentation.app.utils.database import RequestSessionContextManager
 from presentation.app.utils.permissions import has_permissions
-from presentation.app.utils.tools import get_current_user, get_parsed_errors
+from presentation.app.utils.tools import (
+    get_current_user,
+    get_parsed_errors,
+    reference_cache,
+)
 
 
 operation_api_bp = Blueprint("operation_api", __name__)
@@ -189,8 +207,10 @@ async def create_operation():
                 400,
             )
 
-        async with SessionContextManager() as db_session:
-            operation_repository = OperationRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            operation_repository = CachedOperationRepository(
+                db_session, reference_cache
+            )
             use_case = CreateOperationUseCase(operation_repository)
             try:
                 operation = await use_case.execute(operation)
@@ -351,8 +371,10 @@ async def delete_operation(operation_id: UUID):
                 403,
             )
 
-        async with SessionContextManager() as db_session:
-            operation_repository = OperationRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            operation_repository = CachedOperationRepository(
+                db_session, reference_cache
+            )
             use_case = DeleteOperationUseCase(operation_repository)
             try:
                 await use_case.execute(operation_id)
@@ -448,9 +470,16 @@ async def get_all_operations():
                   type: string
                   example: "Something went wrong"
     """
+    etag = reference_cache.etag(CachedOperationRepository.kind)
+    not_modified_response = get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
+
     try:
-        async with SessionContextManager() as db_session:
-            operation_repository = OperationRepository(db_session)
+        async with RequestSessionContextManager() as db_session:
+            operation_repository = CachedOperationRepository(
+                db_session, reference_cache
+            )
             use_case = GetAllOperationUseCase(operation_repository)
             operations = await use_case.execute()
     except Exception as e:
@@ -468,15 +497,18 @@ async def get_all_operations():
             500,
         )
 
+    response = jsonify(
+        {
+            "ok": True,
+            "operations": [
+                operation.model_dump(mode="json")
+                for operation in operations
+            ],
+        }
+    )
     return (
-        jsonify(
-            {
-                "ok": True,
-                "operations": [
-                    operation.model_dump(mode="json")
-                    for operation in operations
-                ],
-            }
+        set_reference_cache_headers(
+            response, etag, CachedOperationRepository.kind
         ),
         200,
     )
@@ -490,6 +522,34 @@ async def autocomplete_operation():
     tags:
       - Operations
       - Autocomplete
+    parameters:
+      - in: query
+        name: q
+        required: false
+        description: >
+          Prefix of the label or of one of its words; with `q`, `limit`
+          or `match` at most `limit` suggestions are returned
+        schema:
+          type: string
+          example: "inc"
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+          minimum: 1
+          maximum: 100
+          default: 20
+      - in: query
+        name: match
+        required: false
+        description: >
+          prefix ignores case; folded also ignores accents, stress marks
+          and apostrophes
+        schema:
+          type: string
+          enum: [prefix, folded]
+          default: folded
     responses:
       200:
         description: Operations list
@@ -504,6 +564,27 @@ async def autocomplete_operation():
               value:
                 type: string
                 example: "00000000-0000-0000-0000-000000000000"
+      422:
+        description: Unprocessable Entity (Invalid query)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_QUERY"
+                message:
+                  type: string
+                  example: "The query parameters are invalid"
+                errors:
+                  type: object
+                  example:
+                    limit: "Input should be less than or equal to 100"
       500:
         description: Internal Server Error
         schema:
@@ -522,11 +603,57 @@ async def autocomplete_operation():
                   type: string
                   example: "Something went wrong"
     """
+    etag = reference_cache.etag(CachedOperationRepository.kind)
+    not_modified_response = get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
+
     try:
-        async with SessionContextManager() as db_session:
-            operation_repository = OperationRepository(db_session)
-            use_case = GetAllOperationUseCase(operation_repository)
-            operations = await use_case.execute()
+        query = request.args.to_dict()
+        autocomplete_request = None
+        if {"q", "limit", "match"} & query.keys():
+            try:
+                autocomplete_request = AutocompleteRequestDTO.model_validate(
+                    query
+                )
+            except ValidationError as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "INVALID_QUERY",
+                                "message": "The query parameters are invalid",
+                                "errors": get_parsed_errors(e),
+                            },
+                        }
+                    ),
+                    422,
+                )
+
+        async with RequestSessionContextManager() as db_session:
+            if autocomplete_request is not None:
+                autocomplete_use_case = AutocompleteOperationsUseCase(
+                    CachedReferenceAutocompleteService(
+                        db_session, reference_cache
+                    )
+                )
+                suggestions = await autocomplete_use_case.execute(
+                    autocomplete_request
+                )
+            else:
+                operation_repository = CachedOperationRepository(
+                    db_session, reference_cache
+                )
+                use_case = GetAllOperationUseCase(operation_repository)
+                operations = await use_case.execute()
+                suggestions = [
+                    AutocompleteItemDTO(
+                        label=operation.operation_name,
+                        value=operation.operation_id,
+                    )
+                    for operation in operations
+                ]
     except Exception as e:
         logger.error(e)
         return (
@@ -542,15 +669,15 @@ async def autocomplete_operation():
             500,
         )
 
+    response = jsonify(
+        [
+            {"label": item.label, "value": str(item.value)}
+            for item in suggestions
+        ]
+    )
     return (
-        jsonify(
-            [
-                {
-                    "label": operation.operation_name,
-                    "value": str(operation.operation_id),
-                }
-                for operation in operations
-            ]
+        set_reference_cache_headers(
+            response, etag, CachedOperationRepository.kind
         ),
         200,
     )
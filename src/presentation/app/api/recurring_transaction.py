@@ -0,0 +1,710 @@
+from uuid import UUID
+
+from flask import Blueprint, jsonify, request, session
+from loguru import logger
+from pydantic import ValidationError
+
+from core.application.transaction.dto.recurring_transaction import (
+    CreateRecurringTransactionDTO,
+)
+from core.application.transaction.use_cases.recurring_transaction.create import (  # noqa: E501
+    CreateRecurringTransactionUseCase,
+)
+from core.application.transaction.use_cases.recurring_transaction.delete import (  # noqa: E501
+    DeleteRecurringTransactionUseCase,
+)
+from core.application.transaction.use_cases.recurring_transaction.get_all_by_user import (  # noqa: E501
+    GetRecurringTransactionsByUserUseCase,
+)
+from core.domain.transaction.exceptions.category.not_found import (
+    CategoryNotFoundException,
+)
+from core.domain.transaction.exceptions.currency.not_found import (
+    CurrencyNotFoundException,
+)
+from core.domain.transaction.exceptions.recurring_transaction.not_found import (  # noqa: E501
+    RecurringTransactionNotFoundException,
+)
+from core.infrastructure.repositories.cached import (
+    CachedCategoryRepository,
+    CachedCurrencyRepository,
+)
+from core.infrastructure.repositories.recurring_transaction import (
+    RecurringTransactionRepository,
+)
+from core.shared.exceptions import ForbiddenException
+from presentation.app.utils.database import RequestSessionContextManager
+from presentation.app.utils.permissions import has_permissions
+from presentation.app.utils.serialization import model_json_response
+from presentation.app.utils.tools import (
+    get_current_user,
+    get_parsed_errors,
+    reference_cache,
+)
+
+
+recurring_transaction_api_bp = Blueprint("recurring_transaction_api", __name__)
+
+
+@recurring_transaction_api_bp.route("", methods=["POST"])
+async def create_recurring_transaction():
+    """
+    Create a recurring transaction
+    Its transactions are created by the scheduler as they fall due,
+    starting with those already due.
+    ---
+    tags:
+      - Recurring transactions
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          properties:
+            category_id:
+              type: string
+              format: uuid
+              example: "123e4567-e39b-12d3-a456-426614174000"
+            currency_id:
+              type: string
+              format: uuid
+              example: "123e4567-e39b-12d3-a456-426614174000"
+            amount:
+              type: string
+              example: "1200.00"
+            description:
+              type: string
+              example: "Monthly apartment rent"
+            rule:
+              type: string
+              description: >
+                iCalendar RRULE with FREQ, INTERVAL, BYMONTHDAY (monthly
+                rules only), COUNT and UNTIL
+              example: "FREQ=MONTHLY;BYMONTHDAY=1"
+            start_date:
+              type: string
+              format: date-time
+              example: "2024-11-01T00:00:00+00:00"
+    responses:
+      201:
+        description: Recurring transaction created
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            recurring_transaction:
+              type: object
+              properties:
+                recurring_transaction_id:
+                  type: string
+                  format: uuid
+                  example: "123e4567-e39b-12d3-a456-426614174000"
+                category_id:
+                  type: string
+                  format: uuid
+                  example: "123e4567-e39b-12d3-a456-426614174000"
+                category_name:
+                  type: string
+                  example: "Rent"
+                operation_type:
+                  type: string
+                  example: "expense"
+                currency_id:
+                  type: string
+                  format: uuid
+                  example: "123e4567-e39b-12d3-a456-426614174000"
+                currency_code:
+                  type: string
+                  example: "USD"
+                currency_symbol:
+                  type: string
+                  example: "$"
+                amount:
+                  type: string
+                  example: "1200.00"
+                description:
+                  type: string | null
+                  example: "Monthly apartment rent"
+                rule:
+                  type: string
+                  example: "FREQ=MONTHLY;BYMONTHDAY=1"
+                start_date:
+                  type: string
+                  format: date-time
+                  example: "2024-11-01T00:00:00+00:00"
+                occurrence_count:
+                  type: integer
+                  example: 0
+                next_run_at:
+                  type: string | null
+                  format: date-time
+                  example: "2024-11-01T00:00:00+00:00"
+      422:
+        description: Unprocessable Entity (Invalid body)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_BODY"
+                message:
+                  type: string
+                  example: "The request body is invalid"
+                errors:
+                  type: object
+                  example:
+                    rule: "Value error, Unsupported rule parts: BYDAY"
+      404:
+        description: Category not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CATEGORY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Category not found"
+      404.1:
+        description: Currency not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CURRENCY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Currency not found"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        body = request.get_json()
+
+        try:
+            create_dto = CreateRecurringTransactionDTO(
+                user_id=user.user_id, **body
+            )
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": "The request body is invalid",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = CreateRecurringTransactionUseCase(
+                RecurringTransactionRepository(db_session),
+                CachedCategoryRepository(db_session, reference_cache),
+                CachedCurrencyRepository(db_session, reference_cache),
+            )
+            try:
+                recurring_transaction = await use_case.execute(create_dto)
+            except CategoryNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "CATEGORY_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+            except CurrencyNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "CURRENCY_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response(
+        {"ok": True, "recurring_transaction": recurring_transaction}, 201
+    )
+
+
+@recurring_transaction_api_bp.route("/me", methods=["GET"])
+async def get_user_recurring_transactions():
+    """
+    Get the recurring transactions of the current user
+    ---
+    tags:
+      - Recurring transactions
+    responses:
+      200:
+        description: Recurring transactions, oldest first
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            recurring_transactions:
+              type: array
+              items:
+                type: object
+                properties:
+                  recurring_transaction_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  category_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  category_name:
+                    type: string
+                    example: "Rent"
+                  operation_type:
+                    type: string
+                    example: "expense"
+                  currency_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  currency_code:
+                    type: string
+                    example: "USD"
+                  currency_symbol:
+                    type: string
+                    example: "$"
+                  amount:
+                    type: string
+                    example: "1200.00"
+                  description:
+                    type: string | null
+                    example: "Monthly apartment rent"
+                  rule:
+                    type: string
+                    example: "FREQ=MONTHLY;BYMONTHDAY=1"
+                  start_date:
+                    type: string
+                    format: date-time
+                    example: "2024-11-01T00:00:00+00:00"
+                  occurrence_count:
+                    type: integer
+                    example: 0
+                  next_run_at:
+                    type: string | null
+                    format: date-time
+                    example: "2024-11-01T00:00:00+00:00"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = GetRecurringTransactionsByUserUseCase(
+                RecurringTransactionRepository(db_session)
+            )
+            recurring_transactions = await use_case.execute(user.user_id)
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response(
+        {"ok": True, "recurring_transactions": recurring_transactions}
+    )
+
+
+@recurring_transaction_api_bp.route(
+    "/<uuid:recurring_transaction_id>", methods=["DELETE"]
+)
+async def delete_recurring_transaction(recurring_transaction_id: UUID):
+    """
+    Delete a recurring transaction
+    Transactions it already created are kept.
+    ---
+    tags:
+      - Recurring transactions
+    parameters:
+      - in: path
+        name: recurring_transaction_id
+        required: true
+        schema:
+          type: string
+          format: uuid
+          example: "123e4567-e39b-12d3-a456-426614174000"
+    responses:
+      200:
+        description: Recurring transaction deleted
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+      404:
+        description: Recurring transaction not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "RECURRING_TRANSACTION_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Recurring transaction not found"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = DeleteRecurringTransactionUseCase(
+                RecurringTransactionRepository(db_session)
+            )
+            try:
+                await use_case.execute(
+                    user_id=user.user_id,
+                    recurring_transaction_id=recurring_transaction_id,
+                )
+            except ForbiddenException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "FORBIDDEN",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    403,
+                )
+            except RecurringTransactionNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "RECURRING_TRANSACTION_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return jsonify({"ok": True}), 200
@@ -0,0 +1,298 @@
+from flask import Blueprint, jsonify, session
+from loguru import logger
+
+from core.infrastructure.database.core import get_pool_statistics
+from presentation.app.utils.permissions import has_permissions
+from presentation.app.utils.tools import (
+    cryptography_service,
+    get_current_user,
+)
+
+
+system_api_bp = Blueprint("system_api", __name__)
+
+
+@system_api_bp.route("/database/pool", methods=["GET"])
+async def get_database_pool():
+    """
+    Get database connection pool statistics
+    ---
+    tags:
+      - System
+    responses:
+      200:
+        description: Pool statistics of the current worker
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            pool:
+              type: object
+              properties:
+                profile:
+                  type: string
+                  example: "server"
+                pool_class:
+                  type: string
+                  example: "TimedAsyncAdaptedQueuePool"
+                size:
+                  type: integer | null
+                  example: 5
+                checked_in:
+                  type: integer | null
+                  example: 4
+                checked_out:
+                  type: integer | null
+                  example: 1
+                overflow:
+                  type: integer | null
+                  example: -4
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["admin"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        statistics = get_pool_statistics()
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return jsonify({"ok": True, "pool": statistics.to_dict()}), 200
+
+
+@system_api_bp.route("/cryptography", methods=["GET"])
+async def get_cryptography():
+    """
+    Get password hashing executor statistics
+    ---
+    tags:
+      - System
+    responses:
+      200:
+        description: Executor statistics of the current worker
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            cryptography:
+              type: object
+              properties:
+                executor:
+                  type: string
+                  example: "thread"
+                max_workers:
+                  type: integer
+                  example: 4
+                max_pending:
+                  type: integer
+                  example: 32
+                pending:
+                  type: integer
+                  example: 0
+                completed:
+                  type: integer
+                  example: 120
+                rejected:
+                  type: integer
+                  example: 0
+                total_seconds:
+                  type: number
+                  example: 31.4
+                max_seconds:
+                  type: number
+                  example: 0.41
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["admin"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        statistics = cryptography_service.get_statistics()
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return jsonify({"ok": True, "cryptography": statistics.to_dict()}), 200
@@ -1,35 +1,118 @@
 from uuid import UUID
 
-from flask import Blueprint, jsonify, request, session
+from flask import (
+    Blueprint,
+    Response,
+    jsonify,
+    request,
+    session,
+    stream_with_context,
+)
 from loguru import logger
 from pydantic import ValidationError
 
-from core.application.transaction.dto.transaction import CreateTransactionDTO
+from core.application.transaction.dto.filters import TransactionFiltersDTO
+from core.application.transaction.dto.pagination import (
+    TransactionPageRequestDTO,
+)
+from core.application.transaction.dto.search import (
+    TransactionSearchRequestDTO,
+)
+from core.application.transaction.dto.statement_import import (
+    SaveCategoryMappingsDTO,
+    StatementImportRequestDTO,
+)
+from core.application.transaction.dto.statistics import (
+    TransactionStatisticsRequestDTO,
+)
+from core.application.transaction.dto.transaction import (
+    MAX_TRANSACTION_BATCH_SIZE,
+    CreateTransactionDTO,
+)
+from core.application.transaction.exceptions.invalid_batch import (
+    InvalidTransactionBatchException,
+)
+from core.application.transaction.exceptions.invalid_cursor import (
+    InvalidCursorException,
+)
+from core.application.transaction.exceptions.invalid_statement import (
+    InvalidStatementException,
+)
+from core.application.transaction.use_cases.category.get_mappings import (
+    GetCategoryMappingsUseCase,
+)
+from core.application.transaction.use_cases.category.save_mappings import (
+    SaveCategoryMappingsUseCase,
+)
 from core.application.transaction.use_cases.transaction.create import (
     CreateTransactionUseCase,
 )
+from core.application.transaction.use_cases.transaction.create_many import (  # noqa: E501
+    CreateTransactionsBatchUseCase,
+)
 from core.application.transaction.use_cases.transaction.delete import (
     DeleteTransactionUseCase,
 )
+from core.application.transaction.use_cases.transaction.export_by_user import (  # noqa: E501
+    ExportTransactionsByUserUseCase,
+)
 from core.application.transaction.use_cases.transaction.get_all_by_user import (  # noqa: E501
     GetAllTransactionsByUserUseCase,
 )
+from core.application.transaction.use_cases.transaction.get_page_by_user import (  # noqa: E501
+    GetTransactionsPageByUserUseCase,
+)
+from core.application.transaction.use_cases.transaction.get_statistics_by_user import (  # noqa: E501
+    GetTransactionStatisticsByUserUseCase,
+)
+from core.application.transaction.use_cases.transaction.import_statement import (  # noqa: E501
+    ImportStatementUseCase,
+)
+from core.application.transaction.use_cases.transaction.search_by_user import (  # noqa: E501
+    SearchTransactionsByUserUseCase,
+)
 from core.domain.transaction.exceptions.category.not_found import (
     CategoryNotFoundException,
 )
 from core.domain.transaction.exceptions.currency.not_found import (
     CurrencyNotFoundException,
 )
+from core.domain.transaction.exceptions.exchange_rate.not_found import (
+    ExchangeRateNotFoundException,
+)
 from core.domain.transaction.exceptions.transaction.not_found import (
     TransactionNotFoundException,
 )
-from core.infrastructure.database.core import SessionContextManager
-from core.infrastructure.repositories.category import CategoryRepository
-from core.infrastructure.repositories.currency import CurrencyRepository
+from core.infrastructure.repositories.cached import (
+    CachedCategoryRepository,
+    CachedCurrencyRepository,
+)
+from core.infrastructure.repositories.category_mapping import (
+    CategoryMappingRepository,
+)
 from core.infrastructure.repositories.transaction import TransactionRepository
+from core.infrastructure.services.statement_parser import (
+    get_statement_parser,
+)
+from core.infrastructure.services.transaction_query import (
+    TransactionQueryService,
+)
 from core.shared.exceptions import ForbiddenException
+from presentation.app.utils.database import (
+    RequestSessionContextManager,
+    get_request_session,
+)
+from presentation.app.utils.export import EXPORT_FORMATS
 from presentation.app.utils.permissions import has_permissions
-from presentation.app.utils.tools import get_current_user, get_parsed_errors
+from presentation.app.utils.query_statistics import query_budget
+from presentation.app.utils.serialization import model_json_response
+from presentation.app.utils.streaming import EventLoopStream
+from presentation.app.utils.tools import (
+    get_current_user,
+    get_parsed_errors,
+    get_query_dict,
+    reference_cache,
+)
 
 
 transaction_api_bp = Blueprint("transaction_api", __name__)
@@ -286,10 +369,14 @@ async def create_transaction():
                 422,
             )
 
-        async with SessionContextManager() as db_session:
+        async with RequestSessionContextManager() as db_session:
             transaction_repository = TransactionRepository(db_session)
-            category_repository = CategoryRepository(db_session)
-            currency_repository = CurrencyRepository(db_session)
+            category_repository = CachedCategoryRepository(
+                db_session, reference_cache
+            )
+            currency_repository = CachedCurrencyRepository(
+                db_session, reference_cache
+            )
             use_case = CreateTransactionUseCase(
                 transaction_repository,
                 category_repository,
@@ -338,80 +425,67 @@ async def create_transaction():
             500,
         )
 
-    return (
-        jsonify(
-            {"ok": True, "transaction": transaction.model_dump(mode="json")}
-        ),
-        201,
-    )
+    return model_json_response({"ok": True, "transaction": transaction}, 201)
 
 
-@transaction_api_bp.route("/me", methods=["GET"])
-async def get_user_transactions():
+@transaction_api_bp.route("/batch", methods=["POST"])
+# Rollups and rows are written in chunks, so large batches run more queries
+@query_budget(25)
+async def create_transactions_batch():
     """
-    Get user transactions.
+    Create many transactions at once.
+    Either every transaction is created or none is. Up to 10000
+    transactions are accepted per request.
     ---
     tags:
         - Transactions
-    responses:
-      200:
-        description: Transaction created
+    parameters:
+      - in: body
+        name: body
         schema:
           type: object
           properties:
-            ok:
-              type: boolean
-              example: true
             transactions:
               type: array
               items:
                 type: object
                 properties:
-                  transaction_id:
-                    type: string
-                    format: uuid
-                    example: "123e4567-e89b-12d3-a456-426614174000"
-                  user_id:
+                  category_id:
                     type: string
                     format: uuid
                     example: "123e4567-e89b-12d3-a456-426614174000"
-                    category_id: UUID
-                  category_name:
-                    type: string
-                    example: "Category name"
-                  operation_id:
-                    type: string
-                    format: uuid
-                    example: "123e4567-ed9b-12d3-a456-426614174000"
-                  operation_name:
-                    type: string
-                    example: "Operation name"
-                  operation_is_income:
-                    type: boolean
-                    example: true
                   currency_id:
                     type: string
                     format: uuid
-                    example: "123e4567-e39b-12d3-a456-426614174000"
-                  currency_name:
-                    type: string
-                    example: "Currency name"
-                  currency_code:
-                    type: string
-                    example: "USD"
-                  currency_symbol:
-                    type: string
-                    example: "$"
+                    example: "123e4567-e89b-12d3-a456-426614174000"
                   amount:
-                    type: string
-                    example: "10.0"
-                  description:
-                    type: string | null
-                    example: "This is a description"
+                    type: number
+                    example: 10.0
                   date:
                     type: string
                     format: date-time
                     example: "2021-10-10T10:00:00+00:00"
+                  description:
+                    type: string
+                    example: "This is a description"
+    responses:
+      201:
+        description: Transactions created
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            created:
+              type: integer
+              example: 2
+            transaction_ids:
+              type: array
+              items:
+                type: string
+                format: uuid
+                example: "123e4567-e89b-12d3-a456-426614174000"
       401:
         description: Unauthorized
         schema:
@@ -446,6 +520,33 @@ async def get_user_transactions():
                 message:
                   type: string
                   example: "You don't have permission to access this resource"
+      422:
+        description: Invalid body
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_BODY"
+                message:
+                  type: string
+                  example: "Invalid body"
+                errors:
+                  type: array
+                  example: [
+                              {
+                                "index": 0,
+                                "errors": {
+                                  "category_id": "Category not found"
+                                }
+                              }
+                            ]
       500:
         description: Internal Server Error
         schema:
@@ -496,10 +597,94 @@ async def get_user_transactions():
                 403,
             )
 
-        async with SessionContextManager() as db_session:
+        body = request.get_json(silent=True)
+        rows = body.get("transactions") if isinstance(body, dict) else None
+        if (
+            not isinstance(rows, list)
+            or not rows
+            or len(rows) > MAX_TRANSACTION_BATCH_SIZE
+        ):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": (
+                                "Expected a list of 1 to "
+                                f"{MAX_TRANSACTION_BATCH_SIZE} transactions"
+                            ),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        create_transaction_dtos = []
+        errors = []
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                errors.append(
+                    {"index": index, "errors": {"unknown": "Invalid object"}}
+                )
+                continue
+            try:
+                create_transaction_dtos.append(
+                    CreateTransactionDTO(**{**row, "user_id": user.user_id})
+                )
+            except ValidationError as e:
+                errors.append(
+                    {"index": index, "errors": get_parsed_errors(e)}
+                )
+        if errors:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": "Invalid body",
+                            "errors": errors,
+                        },
+                    }
+                ),
+                422,
+            )
+
+        async with RequestSessionContextManager() as db_session:
             transaction_repository = TransactionRepository(db_session)
-            use_case = GetAllTransactionsByUserUseCase(transaction_repository)
-            transactions = await use_case.execute(user.user_id)
+            category_repository = CachedCategoryRepository(
+                db_session, reference_cache
+            )
+            currency_repository = CachedCurrencyRepository(
+                db_session, reference_cache
+            )
+            use_case = CreateTransactionsBatchUseCase(
+                transaction_repository,
+                category_repository,
+                currency_repository,
+            )
+            try:
+                result = await use_case.execute(create_transaction_dtos)
+            except InvalidTransactionBatchException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "INVALID_BODY",
+                                "message": str(e),
+                                "errors": [
+                                    {"index": index, "errors": row_errors}
+                                    for index, row_errors in sorted(
+                                        e.errors.items()
+                                    )
+                                ],
+                            },
+                        }
+                    ),
+                    422,
+                )
     except Exception as e:
         logger.error(e)
         return (
@@ -516,19 +701,2072 @@ async def get_user_transactions():
         )
 
     return (
-        jsonify(
-            {
-                "ok": True,
-                "transactions": [
-                    transaction.model_dump(mode="json")
-                    for transaction in transactions
-                ],
-            }
-        ),
-        200,
+        jsonify({"ok": True, **result.model_dump(mode="json")}),
+        201,
     )
 
 
+@transaction_api_bp.route("/import", methods=["POST"])
+def import_transactions():
+    """
+    Import transactions from a bank statement.
+    The statement is read and written in chunks, and progress is streamed
+    as one JSON object per line: a first line once the file has been
+    checked, one after every chunk, and a last one with "done" set.
+    Chunks already written stay written if a later one fails.
+    ---
+    tags:
+        - Transactions
+    consumes:
+      - multipart/form-data
+    produces:
+      - application/x-ndjson
+    parameters:
+      - in: formData
+        name: file
+        type: file
+        required: true
+      - in: formData
+        name: format
+        type: string
+        enum: ["csv", "ofx", "qif"]
+        required: true
+      - in: formData
+        name: currency_id
+        type: string
+        format: uuid
+        required: true
+        description: Currency of rows that do not name one
+      - in: formData
+        name: income_category_id
+        type: string
+        format: uuid
+        description: Category of positive rows without a mapped label
+      - in: formData
+        name: expense_category_id
+        type: string
+        format: uuid
+        description: Category of negative rows without a mapped label
+      - in: formData
+        name: chunk_size
+        type: integer
+        example: 1000
+      - in: formData
+        name: encoding
+        type: string
+        example: "utf-8-sig"
+      - in: formData
+        name: delimiter
+        type: string
+        example: ","
+      - in: formData
+        name: date_column
+        type: string
+        example: "date"
+      - in: formData
+        name: amount_column
+        type: string
+        example: "amount"
+      - in: formData
+        name: description_column
+        type: string
+        example: "description"
+      - in: formData
+        name: category_column
+        type: string
+        example: "category"
+      - in: formData
+        name: currency_column
+        type: string
+        example: "currency"
+      - in: formData
+        name: date_format
+        type: string
+        example: "%d.%m.%Y"
+      - in: formData
+        name: decimal_separator
+        type: string
+        example: "."
+    responses:
+      200:
+        description: Import progress, one object per line
+        schema:
+          type: object
+          properties:
+            processed:
+              type: integer
+              example: 1000
+            created:
+              type: integer
+              example: 998
+            failed:
+              type: integer
+              example: 2
+            errors:
+              type: array
+              example: [
+                          {
+                            "row": 15,
+                            "errors": {
+                              "category_id": "No category for label 'Fuel'"
+                            }
+                          }
+                        ]
+            done:
+              type: boolean
+              example: false
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      404:
+        description: Default category or currency not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CURRENCY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Currency not found"
+      422:
+        description: Invalid body or unreadable statement
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_STATEMENT"
+                message:
+                  type: string
+                  example: "Missing CSV columns: date"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    # A plain view, so that the import and the streamed progress share
+    # one event loop and one database session
+    stream = EventLoopStream(get_request_session())
+    response = None
+    try:
+        user = stream.run(get_current_user(session))
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        file = request.files.get("file")
+        try:
+            import_request = StatementImportRequestDTO.model_validate(
+                {**request.form.to_dict(), "user_id": user.user_id}
+            )
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": "Invalid body",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+        if file is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": "Invalid body",
+                            "errors": {"file": "Field required"},
+                        },
+                    }
+                ),
+                422,
+            )
+
+        db_session = get_request_session()
+        use_case = ImportStatementUseCase(
+            TransactionRepository(db_session),
+            CachedCategoryRepository(db_session, reference_cache),
+            CachedCurrencyRepository(db_session, reference_cache),
+            CategoryMappingRepository(db_session),
+        )
+        parser = get_statement_parser(import_request)
+        progress = use_case.execute(parser.parse(file.stream), import_request)
+        try:
+            reports = stream.iterate(progress)
+        except CategoryNotFoundException as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "CATEGORY_NOT_FOUND",
+                            "message": str(e),
+                        },
+                    }
+                ),
+                404,
+            )
+        except CurrencyNotFoundException as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "CURRENCY_NOT_FOUND",
+                            "message": str(e),
+                        },
+                    }
+                ),
+                404,
+            )
+        except InvalidStatementException as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_STATEMENT",
+                            "message": str(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        lines = (report.model_dump_json() + "\n" for report in reports)
+        response = Response(
+            stream_with_context(lines), mimetype="application/x-ndjson"
+        )
+        response.call_on_close(stream.close)
+        return response
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+    finally:
+        if response is None:
+            stream.close()
+
+
+@transaction_api_bp.route("/import/mappings", methods=["GET"])
+async def get_category_mappings():
+    """
+    Get the category mappings used by statement imports.
+    ---
+    tags:
+        - Transactions
+    responses:
+      200:
+        description: Mappings of statement labels to categories
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            mappings:
+              type: array
+              items:
+                type: object
+                properties:
+                  label:
+                    type: string
+                    example: "groceries"
+                  category_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e89b-12d3-a456-426614174000"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = GetCategoryMappingsUseCase(
+                CategoryMappingRepository(db_session)
+            )
+            mappings = await use_case.execute(user.user_id)
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return (
+        jsonify(
+            {
+                "ok": True,
+                "mappings": [
+                    mapping.model_dump(mode="json") for mapping in mappings
+                ],
+            }
+        ),
+        200,
+    )
+
+
+@transaction_api_bp.route("/import/mappings", methods=["PUT"])
+async def save_category_mappings():
+    """
+    Add, change or remove category mappings used by statement imports.
+    Labels are matched ignoring case and repeated spaces. Labels not in
+    the body are left as they are; a null category removes a label.
+    ---
+    tags:
+        - Transactions
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          properties:
+            mappings:
+              type: object
+              example: {
+                          "Groceries": "123e4567-e89b-12d3-a456-426614174000",
+                          "ATM": null
+                        }
+    responses:
+      200:
+        description: All mappings of the user
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            mappings:
+              type: array
+              items:
+                type: object
+                properties:
+                  label:
+                    type: string
+                    example: "groceries"
+                  category_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e89b-12d3-a456-426614174000"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      404:
+        description: Category not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CATEGORY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Category not found"
+      422:
+        description: Invalid body
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_BODY"
+                message:
+                  type: string
+                  example: "Invalid body"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        body = request.get_json(silent=True)
+        try:
+            save_mappings_dto = SaveCategoryMappingsDTO.model_validate(
+                {
+                    "user_id": user.user_id,
+                    "mappings": (
+                        body.get("mappings")
+                        if isinstance(body, dict)
+                        else None
+                    ),
+                }
+            )
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_BODY",
+                            "message": "Invalid body",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = SaveCategoryMappingsUseCase(
+                CategoryMappingRepository(db_session),
+                CachedCategoryRepository(db_session, reference_cache),
+            )
+            try:
+                mappings = await use_case.execute(save_mappings_dto)
+            except CategoryNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "CATEGORY_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return (
+        jsonify(
+            {
+                "ok": True,
+                "mappings": [
+                    mapping.model_dump(mode="json") for mapping in mappings
+                ],
+            }
+        ),
+        200,
+    )
+
+
+@transaction_api_bp.route("/me", methods=["GET"])
+async def get_user_transactions():
+    """
+    Get user transactions.
+    Without `limit` and `cursor` every matching transaction is returned. With
+    either of them a single page is returned, newest first, together with
+    the cursor of the next page. Id filters accept repeated or
+    comma-separated values.
+    ---
+    tags:
+        - Transactions
+    parameters:
+      - in: query
+        name: currency_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: operation_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: category_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: date_from
+        required: false
+        description: A plain date selects from the start of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-11-01T00:00:00+00:00"
+      - in: query
+        name: date_to
+        required: false
+        description: A plain date selects through the end of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-11-30T23:59:59+00:00"
+      - in: query
+        name: amount_min
+        required: false
+        schema:
+          type: number
+          example: 10.0
+      - in: query
+        name: amount_max
+        required: false
+        schema:
+          type: number
+          example: 500.0
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+          minimum: 1
+          maximum: 200
+          default: 50
+      - in: query
+        name: cursor
+        required: false
+        schema:
+          type: string
+          example: "MjAyNC0xMS0xNlQxMDowMDowMCswMDowMHwxMjNlNDU2Nw=="
+    responses:
+      200:
+        description: Transactions list
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            transactions:
+              type: array
+              items:
+                type: object
+                properties:
+                  transaction_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e89b-12d3-a456-426614174000"
+                  user_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e89b-12d3-a456-426614174000"
+                    category_id: UUID
+                  category_name:
+                    type: string
+                    example: "Category name"
+                  operation_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-ed9b-12d3-a456-426614174000"
+                  operation_name:
+                    type: string
+                    example: "Operation name"
+                  operation_is_income:
+                    type: boolean
+                    example: true
+                  currency_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  currency_name:
+                    type: string
+                    example: "Currency name"
+                  currency_code:
+                    type: string
+                    example: "USD"
+                  currency_symbol:
+                    type: string
+                    example: "$"
+                  amount:
+                    type: string
+                    example: "10.0"
+                  description:
+                    type: string | null
+                    example: "This is a description"
+                  date:
+                    type: string
+                    format: date-time
+                    example: "2021-10-10T10:00:00+00:00"
+            next_cursor:
+              type: string | null
+              example: null
+      400:
+        description: Bad Request (Invalid cursor)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_CURSOR"
+                message:
+                  type: string
+                  example: "Invalid cursor"
+      422:
+        description: Unprocessable Entity (Invalid query)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_QUERY"
+                message:
+                  type: string
+                  example: "The query parameters are invalid"
+                errors:
+                  type: object
+                  example:
+                    limit: "Input should be less than or equal to 200"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        query = get_query_dict(
+            request.args,
+            list_fields=("currency_ids", "operation_ids", "category_ids"),
+        )
+        try:
+            filters_dto = TransactionFiltersDTO.model_validate(query)
+            page_request = (
+                TransactionPageRequestDTO.model_validate(query)
+                if "limit" in query or "cursor" in query
+                else None
+            )
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_QUERY",
+                            "message": "The query parameters are invalid",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        if page_request is None:
+            async with RequestSessionContextManager() as db_session:
+                transaction_query_service = TransactionQueryService(db_session)
+                use_case = GetAllTransactionsByUserUseCase(
+                    transaction_query_service
+                )
+                transactions = await use_case.execute(
+                    user.user_id, filters_dto
+                )
+            return model_json_response(
+                {"ok": True, "transactions": transactions}
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            transaction_query_service = TransactionQueryService(db_session)
+            page_use_case = GetTransactionsPageByUserUseCase(
+                transaction_query_service
+            )
+            try:
+                page = await page_use_case.execute(
+                    user.user_id, page_request, filters_dto
+                )
+            except InvalidCursorException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "INVALID_CURSOR",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    400,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response(
+        {
+            "ok": True,
+            "transactions": page.transactions,
+            "next_cursor": page.next_cursor,
+        }
+    )
+
+
+@transaction_api_bp.route("/me/search", methods=["GET"])
+async def search_user_transactions():
+    """
+    Search user transactions by description.
+    Every word of `q` matches the start of a word in the description, or
+    the description is close to `q` despite typos. Results are ranked best
+    match first, then newest first, a page at a time; they accept the
+    filters of `/me`.
+    ---
+    tags:
+        - Transactions
+    parameters:
+      - in: query
+        name: q
+        required: true
+        schema:
+          type: string
+          example: "coffee"
+      - in: query
+        name: currency_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: operation_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: category_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: date_from
+        required: false
+        description: A plain date selects from the start of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-11-01T00:00:00+00:00"
+      - in: query
+        name: date_to
+        required: false
+        description: A plain date selects through the end of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-11-30T23:59:59+00:00"
+      - in: query
+        name: amount_min
+        required: false
+        schema:
+          type: number
+          example: 10.0
+      - in: query
+        name: amount_max
+        required: false
+        schema:
+          type: number
+          example: 500.0
+      - in: query
+        name: limit
+        required: false
+        schema:
+          type: integer
+          minimum: 1
+          maximum: 200
+          default: 50
+      - in: query
+        name: cursor
+        required: false
+        schema:
+          type: string
+          example: "MC44NXwyMDI0LTExLTE2VDEwOjAwOjAwKzAwOjAwfDEyM2U0NTY3"
+    responses:
+      200:
+        description: Matching transactions
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            transactions:
+              type: array
+              items:
+                type: object
+                properties:
+                  transaction_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e89b-12d3-a456-426614174000"
+                  user_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e89b-12d3-a456-426614174000"
+                    category_id: UUID
+                  category_name:
+                    type: string
+                    example: "Category name"
+                  operation_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-ed9b-12d3-a456-426614174000"
+                  operation_name:
+                    type: string
+                    example: "Operation name"
+                  operation_is_income:
+                    type: boolean
+                    example: true
+                  currency_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  currency_name:
+                    type: string
+                    example: "Currency name"
+                  currency_code:
+                    type: string
+                    example: "USD"
+                  currency_symbol:
+                    type: string
+                    example: "$"
+                  amount:
+                    type: string
+                    example: "10.0"
+                  description:
+                    type: string | null
+                    example: "Coffee at the station"
+                  date:
+                    type: string
+                    format: date-time
+                    example: "2021-10-10T10:00:00+00:00"
+                  rank:
+                    type: number
+                    example: 0.85
+            next_cursor:
+              type: string | null
+              example: null
+      400:
+        description: Bad Request (Invalid cursor)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_CURSOR"
+                message:
+                  type: string
+                  example: "Invalid cursor"
+      422:
+        description: Unprocessable Entity (Invalid query)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_QUERY"
+                message:
+                  type: string
+                  example: "The query parameters are invalid"
+                errors:
+                  type: object
+                  example:
+                    q: "Value error, Query must contain at least one word"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        query = get_query_dict(
+            request.args,
+            list_fields=("currency_ids", "operation_ids", "category_ids"),
+        )
+        try:
+            filters_dto = TransactionFiltersDTO.model_validate(query)
+            search_request = TransactionSearchRequestDTO.model_validate(query)
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_QUERY",
+                            "message": "The query parameters are invalid",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            use_case = SearchTransactionsByUserUseCase(
+                TransactionQueryService(db_session)
+            )
+            try:
+                page = await use_case.execute(
+                    user.user_id, search_request, filters_dto
+                )
+            except InvalidCursorException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "INVALID_CURSOR",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    400,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return model_json_response(
+        {
+            "ok": True,
+            "transactions": page.transactions,
+            "next_cursor": page.next_cursor,
+        }
+    )
+
+
+@transaction_api_bp.route("/me/export", methods=["GET"])
+def export_user_transactions():
+    """
+    Export user transactions as a file.
+    Transactions are read with a server-side cursor and the file is
+    streamed as it is written, newest transactions first. Accepts the
+    same filters as `/me`.
+    ---
+    tags:
+        - Transactions
+    produces:
+      - text/csv
+      - application/x-ndjson
+      - application/vnd.apache.parquet
+    parameters:
+      - in: query
+        name: format
+        required: false
+        schema:
+          type: string
+          enum: ["csv", "ndjson", "parquet"]
+          default: "csv"
+      - in: query
+        name: currency_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: operation_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: category_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: date_from
+        required: false
+        description: A plain date selects from the start of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-11-01T00:00:00+00:00"
+      - in: query
+        name: date_to
+        required: false
+        description: A plain date selects through the end of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-11-30T23:59:59+00:00"
+      - in: query
+        name: amount_min
+        required: false
+        schema:
+          type: number
+          example: 10.0
+      - in: query
+        name: amount_max
+        required: false
+        schema:
+          type: number
+          example: 500.0
+    responses:
+      200:
+        description: The exported transactions, one row per transaction
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      422:
+        description: Invalid query parameters
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_QUERY"
+                message:
+                  type: string
+                  example: "The query parameters are invalid"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+      501:
+        description: Format not available on this server
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORMAT_NOT_AVAILABLE"
+                message:
+                  type: string
+                  example: "Export as 'parquet' requires 'pyarrow'"
+    """
+    # A plain view, so that the query and the streamed file share one
+    # event loop and one database session
+    stream = EventLoopStream(get_request_session())
+    response = None
+    try:
+        user = stream.run(get_current_user(session))
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        export_format = EXPORT_FORMATS.get(request.args.get("format", "csv"))
+        if export_format is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_QUERY",
+                            "message": "The query parameters are invalid",
+                            "errors": {
+                                "format": (
+                                    "Input should be "
+                                    + ", ".join(map(repr, EXPORT_FORMATS))
+                                )
+                            },
+                        },
+                    }
+                ),
+                422,
+            )
+        if not export_format.available:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORMAT_NOT_AVAILABLE",
+                            "message": (
+                                f"Export as {request.args['format']!r} "
+                                f"requires {export_format.requires!r}"
+                            ),
+                        },
+                    }
+                ),
+                501,
+            )
+
+        query = get_query_dict(
+            request.args,
+            list_fields=("currency_ids", "operation_ids", "category_ids"),
+        )
+        query.pop("format", None)
+        try:
+            filters_dto = TransactionFiltersDTO.model_validate(query)
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_QUERY",
+                            "message": "The query parameters are invalid",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        use_case = ExportTransactionsByUserUseCase(
+            TransactionQueryService(get_request_session())
+        )
+        chunks = stream.iterate(use_case.execute(user.user_id, filters_dto))
+        response = Response(
+            stream_with_context(export_format.write(chunks)),
+            mimetype=export_format.mimetype,
+            headers={
+                "Content-Disposition": (
+                    "attachment; "
+                    f"filename=transactions.{export_format.extension}"
+                )
+            },
+        )
+        response.call_on_close(stream.close)
+        return response
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+    finally:
+        if response is None:
+            stream.close()
+
+
+@transaction_api_bp.route("/me/statistics", methods=["GET"])
+async def get_user_transaction_statistics():
+    """
+    Get user transaction totals per period.
+    Totals are computed in the database, grouped by the start of each
+    period, the currency and the requested dimensions. Accepts the same
+    filters as `/me`. With `convert_to`, every transaction is converted
+    to that currency at the exchange rates of its day and the totals are
+    no longer split by currency.
+    ---
+    tags:
+        - Transactions
+    parameters:
+      - in: query
+        name: period
+        required: false
+        schema:
+          type: string
+          enum: ["day", "week", "month", "year"]
+          default: "month"
+      - in: query
+        name: group_by
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            enum: ["operation_type", "operation", "category", "currency"]
+          default: ["operation_type"]
+      - in: query
+        name: convert_to
+        required: false
+        schema:
+          type: string
+          format: uuid
+      - in: query
+        name: currency_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: operation_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: category_ids
+        required: false
+        schema:
+          type: array
+          items:
+            type: string
+            format: uuid
+      - in: query
+        name: date_from
+        required: false
+        description: A plain date selects from the start of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-01-01T00:00:00+00:00"
+      - in: query
+        name: date_to
+        required: false
+        description: A plain date selects through the end of that day (UTC)
+        schema:
+          type: string
+          format: date-time
+          example: "2024-12-31T23:59:59+00:00"
+    responses:
+      200:
+        description: Transaction totals
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: true
+            period:
+              type: string
+              example: "month"
+            group_by:
+              type: array
+              items:
+                type: string
+              example: ["operation_type"]
+            convert_to:
+              type: string | null
+              format: uuid
+              example: null
+            rows:
+              type: array
+              items:
+                type: object
+                properties:
+                  period_start:
+                    type: string
+                    format: date-time
+                    example: "2024-11-01T00:00:00+00:00"
+                  currency_id:
+                    type: string
+                    format: uuid
+                    example: "123e4567-e39b-12d3-a456-426614174000"
+                  currency_code:
+                    type: string
+                    example: "USD"
+                  currency_symbol:
+                    type: string
+                    example: "$"
+                  operation_type:
+                    type: string | null
+                    example: "expense"
+                  operation_id:
+                    type: string | null
+                    format: uuid
+                    example: null
+                  operation_name:
+                    type: string | null
+                    example: null
+                  category_id:
+                    type: string | null
+                    format: uuid
+                    example: null
+                  category_name:
+                    type: string | null
+                    example: null
+                  total:
+                    type: string
+                    example: "1520.50"
+                  count:
+                    type: integer
+                    example: 12
+      422:
+        description: Unprocessable Entity (Invalid query)
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INVALID_QUERY"
+                message:
+                  type: string
+                  example: "The query parameters are invalid"
+                errors:
+                  type: object
+                  example:
+                    period: "Input should be 'day', 'week', 'month' or 'year'"
+      404:
+        description: Currency to convert to not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "CURRENCY_NOT_FOUND"
+                message:
+                  type: string
+                  example: "Currency not found"
+      404.1:
+        description: Exchange rate not found
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "EXCHANGE_RATE_NOT_FOUND"
+                message:
+                  type: string
+                  example: "No exchange rate for 3 transactions"
+      401:
+        description: Unauthorized
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "UNAUTHORIZED"
+                message:
+                  type: string
+                  example: "Missing authentication token"
+      403:
+        description: Forbidden
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "FORBIDDEN"
+                message:
+                  type: string
+                  example: "You don't have permission to access this resource"
+      500:
+        description: Internal Server Error
+        schema:
+          type: object
+          properties:
+            ok:
+              type: boolean
+              example: false
+            error:
+              type: object
+              properties:
+                type:
+                  type: string
+                  example: "INTERNAL_ERROR"
+                message:
+                  type: string
+                  example: "Something went wrong"
+    """
+    try:
+        user = await get_current_user(session)
+        if user is None:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "UNAUTHORIZED",
+                            "message": "Missing authentication token",
+                        },
+                    }
+                ),
+                401,
+            )
+        if not has_permissions(user, ["member"]):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "FORBIDDEN",
+                            "message": (
+                                "You don't have permission "
+                                "to access this resource"
+                            ),
+                        },
+                    }
+                ),
+                403,
+            )
+
+        query = get_query_dict(
+            request.args,
+            list_fields=(
+                "currency_ids",
+                "operation_ids",
+                "category_ids",
+                "group_by",
+            ),
+        )
+        try:
+            filters_dto = TransactionFiltersDTO.model_validate(query)
+            statistics_request = (
+                TransactionStatisticsRequestDTO.model_validate(query)
+            )
+        except ValidationError as e:
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "INVALID_QUERY",
+                            "message": "The query parameters are invalid",
+                            "errors": get_parsed_errors(e),
+                        },
+                    }
+                ),
+                422,
+            )
+
+        async with RequestSessionContextManager() as db_session:
+            transaction_query_service = TransactionQueryService(db_session)
+            currency_repository = CachedCurrencyRepository(
+                db_session, reference_cache
+            )
+            use_case = GetTransactionStatisticsByUserUseCase(
+                transaction_query_service, currency_repository
+            )
+            try:
+                statistics = await use_case.execute(
+                    user.user_id, statistics_request, filters_dto
+                )
+            except CurrencyNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "CURRENCY_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+            except ExchangeRateNotFoundException as e:
+                return (
+                    jsonify(
+                        {
+                            "ok": False,
+                            "error": {
+                                "type": "EXCHANGE_RATE_NOT_FOUND",
+                                "message": str(e),
+                            },
+                        }
+                    ),
+                    404,
+                )
+    except Exception as e:
+        logger.error(e)
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": {
+                        "type": "INTERNAL_ERROR",
+                        "message": "Something went wrong",
+                    },
+                }
+            ),
+            500,
+        )
+
+    return jsonify({"ok": True, **statistics.model_dump(mode="json")}), 200
+
+
 @transaction_api_bp.route("/<uuid:transaction_id>", methods=["DELETE"])
 async def delete_transaction(transaction_id: UUID):
     """
@@ -669,7 +2907,7 @@ async def delete_transaction(transaction_id: UUID):
                 403,
             )
 
-        async with SessionContextManager() as db_session:
+        async with RequestSessionContextManager() as db_session:
             transaction_repository = TransactionRepository(db_session)
             use_case = DeleteTransactionUseCase(transaction_repository)
             try:
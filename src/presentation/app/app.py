@@ -1,22 +1,63 @@
-from asgiref.wsgi import WsgiToAsgi
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Any, Callable
+
 from flasgger import Swagger  # type: ignore[import-untyped]
 from flask import Flask, redirect, render_template, session, url_for
 
-from config import SESSION_SECRET_KEY
+from config import ASGI_MAX_THREADS, JSON_PROVIDER, SESSION_SECRET_KEY
+from presentation.app.api.budget import budget_api_bp
 from presentation.app.api.category import category_api_bp
 from presentation.app.api.currency import currency_api_bp
 from presentation.app.api.operation import operation_api_bp
+from presentation.app.api.recurring_transaction import (
+    recurring_transaction_api_bp,
+)
+from presentation.app.api.system import system_api_bp
 from presentation.app.api.transaction import transaction_api_bp
 from presentation.app.blueprints.admin.routes import admin_bp
 from presentation.app.blueprints.auth.routes import auth_bp
+from presentation.app.blueprints.metrics.routes import metrics_bp
 from presentation.app.blueprints.transactions.routes import transactions_bp
+from presentation.app.utils.database import with_request_session
+from presentation.app.utils.metrics import init_metrics
+from presentation.app.utils.query_statistics import init_query_statistics
+from presentation.app.utils.serialization import init_json_provider
+from presentation.app.utils.tools import start_background_workers
+from presentation.app.utils.worker_loop import (
+    WorkerLoopAsgiApp,
+    get_worker_loop,
+    run_on_worker_loop,
+)
+
+
+class FinanceFlowApp(Flask):
+    def ensure_sync(self, func: Callable) -> Callable:
+        # Under ASGI async views and hooks run on the server's event loop.
+        # Under WSGI every one of them gets an event loop of its own. The
+        # request database session is released on the loop that used it.
+        if not iscoroutinefunction(func):
+            return func
+        func = with_request_session(func)
+        loop = get_worker_loop()
+        if loop is None:
+            return self.async_to_sync(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return run_on_worker_loop(loop, func(*args, **kwargs))
+
+        return wrapper
 
 
-app = Flask(__name__)
+app = FinanceFlowApp(__name__)
+init_json_provider(app, JSON_PROVIDER)
 app.json.ensure_ascii = False  # type: ignore[attr-defined]
 app.secret_key = SESSION_SECRET_KEY
 
 swagger = Swagger(app)
+init_query_statistics(app)
+init_metrics(app)
 app.register_blueprint(auth_bp, url_prefix="")
 app.register_blueprint(admin_bp, url_prefix="/admin")
 app.register_blueprint(transactions_bp, url_prefix="/transactions")
@@ -24,6 +65,12 @@ app.register_blueprint(operation_api_bp, url_prefix="/api/v1/operations")
 app.register_blueprint(category_api_bp, url_prefix="/api/v1/categories")
 app.register_blueprint(currency_api_bp, url_prefix="/api/v1/currencies")
 app.register_blueprint(transaction_api_bp, url_prefix="/api/v1/transactions")
+app.register_blueprint(
+    recurring_transaction_api_bp, url_prefix="/api/v1/recurring-transactions"
+)
+app.register_blueprint(budget_api_bp, url_prefix="/api/v1/budgets")
+app.register_blueprint(system_api_bp, url_prefix="/api/v1/system")
+app.register_blueprint(metrics_bp, url_prefix="/metrics")
 
 
 @app.errorhandler(404)
@@ -46,4 +93,6 @@ def chart():
     return render_template("statistics.html")
 
 
-asgi_app = WsgiToAsgi(app)
+asgi_app = WorkerLoopAsgiApp(
+    app, max_threads=ASGI_MAX_THREADS, on_startup=[start_background_workers]
+)
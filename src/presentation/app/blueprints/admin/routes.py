@@ -1,9 +1,10 @@
 from flask import Blueprint, abort, render_template, session
 
 from core.application.user.use_cases.get_user import GetUserUseCase
-from core.infrastructure.database.core import SessionContextManager
 from core.infrastructure.repositories.user import UserRepository
+from presentation.app.utils.database import RequestSessionContextManager
 from presentation.app.utils.permissions import has_permissions
+from presentation.app.utils.tools import user_cache
 
 
 admin_bp = Blueprint(
@@ -17,9 +18,9 @@ async def check_admin():
     user_id = session.get("user_id")
     if user_id is None:
         abort(404)
-    async with SessionContextManager() as db_session:
+    async with RequestSessionContextManager() as db_session:
         user_repository = UserRepository(db_session)
-        use_case = GetUserUseCase(user_repository)
+        use_case = GetUserUseCase(user_repository, user_cache)
         user = await use_case.execute(user_id)
         if not has_permissions(user, ["admin"]):
             abort(404)
@@ -3,18 +3,21 @@ from loguru import logger
 from pydantic import ValidationError
 
 from core.application.user.dto.user import LoginUserDTO, RegisterUserDTO
+from core.application.user.exceptions.cryptography_busy import (
+    CryptographyServiceBusyException,
+)
 from core.application.user.exceptions.invalid_credentials import (
     UserInvalidCredentialsException,
 )
 from core.application.user.factories.user import UserFactory
 from core.application.user.use_cases.login import LoginUserUseCase
 from core.application.user.use_cases.register import RegisterUserUseCase
-from core.infrastructure.database.core import SessionContextManager
 from core.infrastructure.repositories.role import RoleRepository
 from core.infrastructure.repositories.user import UserRepository
-from core.infrastructure.services.cryptography import CryptographyService
 from core.shared.exceptions import AlreadyExistsException
 from presentation.app.blueprints.auth.forms import LoginForm, RegistrationForm
+from presentation.app.utils.database import RequestSessionContextManager
+from presentation.app.utils.tools import cryptography_service, user_cache
 
 
 auth_bp = Blueprint(
@@ -25,6 +28,9 @@ auth_bp = Blueprint(
 
 @auth_bp.route("/logout", methods=["POST"])
 def logout():
+    user_id = session.get("user_id")
+    if user_id is not None:
+        user_cache.invalidate(user_id)
     session.clear()
     return redirect(url_for("home"))
 
@@ -52,8 +58,7 @@ async def login():
                 flash("Invalid data", "error")
                 return render_template("auth/login.html", form=form)
 
-            cryptography_service = CryptographyService()
-            async with SessionContextManager() as db_session:
+            async with RequestSessionContextManager() as db_session:
                 user_repo = UserRepository(db_session)
                 use_case = LoginUserUseCase(user_repo, cryptography_service)
 
@@ -66,6 +71,12 @@ async def login():
                 except UserInvalidCredentialsException as e:
                     flash(str(e), "error")
                     return render_template("auth/login.html", form=form)
+                except CryptographyServiceBusyException:
+                    flash("Server is busy, please try again later", "error")
+                    return (
+                        render_template("auth/login.html", form=form),
+                        503,
+                    )
 
             return redirect(url_for("home"))
         except Exception as e:
@@ -101,9 +112,8 @@ async def register():
                 flash("Invalid data", "error")
                 return render_template("auth/login.html", form=form)
 
-            cryptography_service = CryptographyService()
             user_factory = UserFactory(cryptography_service)
-            async with SessionContextManager() as db_session:
+            async with RequestSessionContextManager() as db_session:
                 user_repo = UserRepository(db_session)
                 role_repo = RoleRepository(db_session)
                 use_case = RegisterUserUseCase(
@@ -122,6 +132,12 @@ async def register():
                     if "username" in str(e).lower():
                         form.username.errors.append(str(e))
                     return render_template("auth/register.html", form=form)
+                except CryptographyServiceBusyException:
+                    flash("Server is busy, please try again later", "error")
+                    return (
+                        render_template("auth/register.html", form=form),
+                        503,
+                    )
 
             return redirect(url_for("home"))
         except Exception as e:
@@ -0,0 +1,23 @@
+import hmac
+
+from flask import Blueprint, Response, request
+
+from config import METRICS_TOKEN
+from core.infrastructure.services.metrics import registry
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_bp = Blueprint(
+    "metrics",
+    __name__,
+)
+
+
+@metrics_bp.route("", methods=["GET"])
+def get_metrics():
+    if METRICS_TOKEN and not hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {METRICS_TOKEN}"
+    ):
+        return Response("Unauthorized\n", 401, content_type="text/plain")
+    return Response(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
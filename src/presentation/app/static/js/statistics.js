@@ -0,0 +1,104 @@
+import {showToast} from "./toast.js";
+
+const operationTypeNames = {
+    income: 'Дохід',
+    expense: 'Витрата',
+    investment: 'Інвестиція'
+};
+
+function buildQuery(form) {
+    const formData = new FormData(form);
+    const params = new URLSearchParams();
+    params.set('period', formData.get('period'));
+    params.set('group_by', formData.get('group_by'));
+    if (formData.get('date_from')) {
+        params.set('date_from', new Date(`${formData.get('date_from')}T00:00:00`).toISOString());
+    }
+    if (formData.get('date_to')) {
+        params.set('date_to', new Date(`${formData.get('date_to')}T23:59:59`).toISOString());
+    }
+    return params;
+}
+
+async function fetchStatistics(params) {
+    try {
+        document.getElementById('loaderContainer').classList.remove('hidden');
+        document.getElementById('statisticsTable').classList.add('hidden');
+
+        const response = await fetch(`/api/v1/transactions/me/statistics?${params}`);
+        if (!response.ok) {
+            console.error('Fetch error:', response);
+            showToast('Помилка завантаження статистики', 'error');
+            return;
+        }
+        const data = await response.json();
+        populateTable(data.period, data.rows);
+    } catch (error) {
+        console.error('Fetch error:', error);
+        showToast('Помилка завантаження статистики', 'error');
+    } finally {
+        document.getElementById('loaderContainer').classList.add('hidden');
+    }
+}
+
+function formatPeriod(dateString, period) {
+    const date = new Date(dateString);
+    const options = {
+        day: {year: 'numeric', month: 'numeric', day: 'numeric'},
+        week: {year: 'numeric', month: 'numeric', day: 'numeric'},
+        month: {year: 'numeric', month: 'long'},
+        year: {year: 'numeric'}
+    };
+    const formatted = date.toLocaleDateString('uk-UA', options[period]);
+    return period === 'week' ? `з ${formatted}` : formatted;
+}
+
+function formatGroup(row) {
+    const parts = [];
+    if (row.operation_type) {
+        parts.push(operationTypeNames[row.operation_type]);
+    }
+    if (row.operation_name) {
+        parts.push(row.operation_name);
+    }
+    if (row.category_name) {
+        parts.push(row.category_name);
+    }
+    parts.push(row.currency_code);
+    return parts.join(' / ');
+}
+
+function populateTable(period, rows) {
+    const table = document.getElementById('statisticsTable');
+    const tbody = table.querySelector('tbody');
+    const emptyMessage = document.querySelector('.no-transactions-message');
+    tbody.innerHTML = '';
+
+    if (rows.length === 0) {
+        emptyMessage.style.display = 'block';
+        return;
+    }
+    emptyMessage.style.display = 'none';
+
+    rows.forEach(row => {
+        const tr = document.createElement('tr');
+        const amountClass = row.operation_type ? `amount-${row.operation_type}` : '';
+        tr.innerHTML = `
+                <td data-label="Період">${formatPeriod(row.period_start, period)}</td>
+                <td data-label="Група">${formatGroup(row)}</td>
+                <td data-label="Кількість">${row.count}</td>
+                <td data-label="Сума" class="${amountClass}">${row.total} ${row.currency_symbol}</td>
+            `;
+        tbody.appendChild(tr);
+    });
+    table.classList.remove('hidden');
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    const form = document.getElementById('statisticsForm');
+    form.addEventListener('submit', event => {
+        event.preventDefault();
+        fetchStatistics(buildQuery(form));
+    });
+    fetchStatistics(buildQuery(form));
+});
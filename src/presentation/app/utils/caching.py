@@ -0,0 +1,32 @@
+from flask import Response, make_response, request
+
+from presentation.app.utils.tools import reference_cache
+
+
+# Reference data may change at any time, so clients always revalidate;
+# the revalidation itself skips the database and serialization
+REFERENCE_DATA_CACHE_CONTROL = "public, no-cache"
+
+
+def get_not_modified_response(etag: str | None) -> Response | None:
+    """Return a 304 response if the client already holds ``etag``."""
+    if etag is None or not request.if_none_match.contains_weak(etag):
+        return None
+    response = make_response("", 304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = REFERENCE_DATA_CACHE_CONTROL
+    return response
+
+
+def set_reference_cache_headers(
+    response: Response, etag: str | None, *kinds: str
+) -> Response:
+    """Add caching headers to a response built from reference data.
+
+    ``etag`` must be read before the data was loaded; it is only sent when
+    the snapshots of ``kinds`` did not change while the response was built.
+    """
+    response.headers["Cache-Control"] = REFERENCE_DATA_CACHE_CONTROL
+    if etag is not None and etag == reference_cache.etag(*kinds):
+        response.set_etag(etag)
+    return response
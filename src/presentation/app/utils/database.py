@@ -0,0 +1,63 @@
+from functools import wraps
+from typing import Any, Callable, Coroutine
+
+from flask import g
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.infrastructure.database.core import async_session_maker
+
+
+def get_request_session() -> AsyncSession:
+    """Return the database session bound to the current request.
+
+    The session is created on first use and does not check out a
+    connection until the first statement is executed, so requests that
+    never touch the database pay nothing.
+    """
+    if "db_session" not in g:
+        g.db_session = async_session_maker()
+    return g.db_session
+
+
+async def close_request_session() -> None:
+    db_session: AsyncSession | None = g.pop("db_session", None)
+    if db_session is not None:
+        await db_session.close()
+
+
+def with_request_session(
+    func: Callable[..., Coroutine[Any, Any, Any]]
+) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """Close the request session when the wrapped coroutine finishes.
+
+    The session has to be released on the same event loop it was used
+    on, so it is scoped to the coroutine rather than to the app context.
+    """
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            await close_request_session()
+
+    return wrapper
+
+
+class RequestSessionContextManager:
+    """Drop-in for ``SessionContextManager`` that reuses the request session.
+
+    The session is left open on exit, so the authentication check and the
+    handler share one connection and one transaction.
+    """
+
+    def __init__(self):
+        self.session: AsyncSession
+
+    async def __aenter__(self) -> AsyncSession:
+        self.session = get_request_session()
+        return self.session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            await self.session.rollback()
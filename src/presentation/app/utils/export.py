@@ -0,0 +1,155 @@
+import csv
+import importlib.util
+import io
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from core.application.transaction.dto.transaction import TransactionDTO
+
+
+EXPORT_FIELDS = tuple(TransactionDTO.model_fields)
+
+
+def _csv_row(transaction: TransactionDTO) -> list[Any]:
+    return [
+        str(transaction.transaction_id),
+        str(transaction.user_id),
+        str(transaction.category_id),
+        transaction.category_name,
+        str(transaction.operation_id),
+        transaction.operation_name,
+        transaction.operation_type.value,
+        str(transaction.currency_id),
+        transaction.currency_name,
+        transaction.currency_code,
+        transaction.currency_symbol,
+        str(transaction.amount),
+        transaction.description or "",
+        transaction.date.isoformat(),
+    ]
+
+
+def write_csv(chunks: Iterable[list[TransactionDTO]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for chunk in chunks:
+        writer.writerows(_csv_row(transaction) for transaction in chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    # Only the header is left when there were no transactions
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def write_ndjson(chunks: Iterable[list[TransactionDTO]]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield b"".join(
+            transaction.model_dump_json().encode() + b"\n"
+            for transaction in chunk
+        )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out what was written since last asked."""
+
+    def __init__(self):
+        super().__init__()
+        self._parts: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def write_parquet(chunks: Iterable[list[TransactionDTO]]) -> Iterator[bytes]:
+    """Write one row group per chunk, sending each as soon as it is done.
+
+    Requires ``pyarrow``.
+    """
+    import pyarrow as pa  # type: ignore[import-not-found]
+    import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+    schema = pa.schema(
+        [
+            ("transaction_id", pa.string()),
+            ("user_id", pa.string()),
+            ("category_id", pa.string()),
+            ("category_name", pa.string()),
+            ("operation_id", pa.string()),
+            ("operation_name", pa.string()),
+            ("operation_type", pa.string()),
+            ("currency_id", pa.string()),
+            ("currency_name", pa.string()),
+            ("currency_code", pa.string()),
+            ("currency_symbol", pa.string()),
+            ("amount", pa.decimal128(10, 2)),
+            ("description", pa.string()),
+            ("date", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for chunk in chunks:
+            columns = {
+                "transaction_id": [str(t.transaction_id) for t in chunk],
+                "user_id": [str(t.user_id) for t in chunk],
+                "category_id": [str(t.category_id) for t in chunk],
+                "category_name": [t.category_name for t in chunk],
+                "operation_id": [str(t.operation_id) for t in chunk],
+                "operation_name": [t.operation_name for t in chunk],
+                "operation_type": [t.operation_type.value for t in chunk],
+                "currency_id": [str(t.currency_id) for t in chunk],
+                "currency_name": [t.currency_name for t in chunk],
+                "currency_code": [t.currency_code for t in chunk],
+                "currency_symbol": [t.currency_symbol for t in chunk],
+                "amount": [t.amount for t in chunk],
+                "description": [t.description for t in chunk],
+                "date": [t.date for t in chunk],
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            yield sink.drain()
+    # The footer is written on close
+    yield sink.drain()
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    mimetype: str
+    extension: str
+    write: Callable[[Iterable[list[TransactionDTO]]], Iterator[bytes]]
+    requires: str | None = None
+
+    @property
+    def available(self) -> bool:
+        return (
+            self.requires is None
+            or importlib.util.find_spec(self.requires) is not None
+        )
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    "csv": ExportFormat("text/csv", "csv", write_csv),
+    "ndjson": ExportFormat("application/x-ndjson", "ndjson", write_ndjson),
+    "parquet": ExportFormat(
+        "application/vnd.apache.parquet",
+        "parquet",
+        write_parquet,
+        requires="pyarrow",
+    ),
+}
@@ -0,0 +1,79 @@
+import time
+
+from flask import Flask, Response, g, request
+
+from core.infrastructure.services.metrics import registry
+
+
+RESPONSE_SIZE_BUCKETS = (
+    100.0,
+    1_000.0,
+    10_000.0,
+    100_000.0,
+    1_000_000.0,
+    10_000_000.0,
+)
+
+request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Time spent handling requests, up to the start of streamed bodies.",
+    labels=("blueprint", "route", "method", "status"),
+)
+response_size_bytes = registry.histogram(
+    "http_response_size_bytes",
+    "Size of response bodies; streamed bodies are not included.",
+    labels=("blueprint", "route"),
+    buckets=RESPONSE_SIZE_BUCKETS,
+)
+api_errors = registry.counter(
+    "api_errors_total",
+    "Error responses of the API by the error type they report.",
+    labels=("blueprint", "route", "type"),
+)
+
+
+def _get_error_type(response: Response) -> str | None:
+    if response.status_code < 400 or not response.is_json:
+        return None
+    body = response.get_json(silent=True)
+    if not isinstance(body, dict):
+        return None
+    error = body.get("error")
+    if isinstance(error, dict) and isinstance(error.get("type"), str):
+        return error["type"]
+    return None
+
+
+def init_metrics(app: Flask) -> None:
+    """Observe the latency, response size and errors of every request."""
+
+    @app.before_request
+    def start() -> None:
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def observe(response: Response) -> Response:
+        started = g.pop("request_started", None)
+        # Label by route rule, as paths would make a series per id
+        blueprint = request.blueprint or ""
+        route = (
+            request.url_rule.rule if request.url_rule is not None else ""
+        )
+        if started is not None:
+            request_seconds.observe(
+                time.perf_counter() - started,
+                blueprint=blueprint,
+                route=route,
+                method=request.method,
+                status=str(response.status_code),
+            )
+        if not response.is_streamed:
+            response_size_bytes.observe(
+                response.calculate_content_length() or 0,
+                blueprint=blueprint,
+                route=route,
+            )
+        error_type = _get_error_type(response)
+        if error_type is not None:
+            api_errors.inc(blueprint=blueprint, route=route, type=error_type)
+        return response
@@ -0,0 +1,123 @@
+from typing import Callable, TypeVar
+
+from flask import Flask, Response, jsonify, request
+from loguru import logger
+
+from config import (
+    QUERY_BUDGET,
+    QUERY_BUDGET_MODE,
+    QUERY_LOG_LEVEL,
+    QUERY_REPEAT_THRESHOLD,
+)
+from core.infrastructure.database.core import async_engine
+from core.infrastructure.database.instrumentation import (
+    get_query_statistics,
+    instrument_engine,
+    start_query_statistics,
+    stop_query_statistics,
+)
+
+
+F = TypeVar("F", bound=Callable)
+
+QUERY_BUDGET_MODES = ("off", "warn", "raise")
+
+
+def query_budget(limit: int) -> Callable[[F], F]:
+    """Allow a view more (or fewer) queries than ``QUERY_BUDGET``.
+
+    Goes below the ``route`` decorator, so the route registers the
+    function that carries the budget.
+    """
+
+    def decorator(func: F) -> F:
+        func.query_budget = limit  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def _get_query_budget(app: Flask) -> int:
+    view = app.view_functions.get(request.endpoint or "")
+    return getattr(view, "query_budget", QUERY_BUDGET)
+
+
+def init_query_statistics(app: Flask) -> None:
+    """Report the SQL queries of every request.
+
+    The number of queries and the time spent on them are sent in a
+    ``Server-Timing`` header and logged. Statements repeated within one
+    request are logged as possible N+1 queries, and with
+    ``QUERY_BUDGET_MODE`` set requests over their budget are logged or
+    failed. Streamed responses are reported as of when the body starts.
+    """
+    if QUERY_BUDGET_MODE not in QUERY_BUDGET_MODES:
+        raise ValueError(
+            f"Unknown query budget mode {QUERY_BUDGET_MODE!r}, "
+            f"expected one of {QUERY_BUDGET_MODES!r}"
+        )
+    instrument_engine(async_engine)
+
+    @app.before_request
+    def start() -> None:
+        start_query_statistics()
+
+    @app.teardown_request
+    def stop(exc: BaseException | None) -> None:
+        stop_query_statistics()
+
+    @app.after_request
+    def report(response: Response) -> Response:
+        statistics = get_query_statistics()
+        if statistics is None:
+            return response
+        milliseconds = round(statistics.seconds * 1000, 2)
+        request_logger = logger.bind(
+            method=request.method,
+            path=request.path,
+            endpoint=request.endpoint,
+            status=response.status_code,
+            queries=statistics.count,
+            db_ms=milliseconds,
+        )
+        request_logger.log(
+            QUERY_LOG_LEVEL,
+            f"{request.method} {request.path} ran {statistics.count} "
+            f"queries in {milliseconds} ms",
+        )
+        for statement, count in statistics.get_repeated_statements(
+            QUERY_REPEAT_THRESHOLD
+        ).items():
+            request_logger.warning(
+                f"Possible N+1 query in {request.endpoint}, "
+                f"run {count} times: {' '.join(statement.split())[:200]}"
+            )
+
+        budget = _get_query_budget(app)
+        if (
+            QUERY_BUDGET_MODE != "off"
+            and not response.is_streamed
+            and statistics.count > budget
+        ):
+            message = (
+                f"{request.endpoint} ran {statistics.count} queries, "
+                f"over its budget of {budget}"
+            )
+            request_logger.warning(message)
+            if QUERY_BUDGET_MODE == "raise":
+                response = jsonify(
+                    {
+                        "ok": False,
+                        "error": {
+                            "type": "QUERY_BUDGET_EXCEEDED",
+                            "message": message,
+                        },
+                    }
+                )
+                response.status_code = 500
+
+        response.headers.add(
+            "Server-Timing",
+            f'db;dur={milliseconds};desc="{statistics.count} queries"',
+        )
+        return response
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any, AsyncGenerator, Coroutine, Iterator, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from presentation.app.utils.worker_loop import (
+    get_worker_loop,
+    run_on_worker_loop,
+)
+
+
+T = TypeVar("T")
+
+
+class EventLoopStream:
+    """Run a synchronous view and the response it streams on one loop.
+
+    Under WSGI async views get a fresh event loop that is gone by the
+    time a streamed response body is produced, while a database session
+    has to be used and released on a single loop. A view that streams
+    from an async generator is therefore written as a plain function that
+    runs its coroutines here, and closes the stream when the response
+    closes. Under ASGI the server's event loop is used instead.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self._db_session = db_session
+        self._worker_loop = get_worker_loop()
+        self._loop = self._worker_loop or asyncio.new_event_loop()
+        self._generators: list[AsyncGenerator[Any, None]] = []
+        self._closed = False
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        if self._worker_loop is not None:
+            return run_on_worker_loop(self._worker_loop, coroutine)
+        return self._loop.run_until_complete(coroutine)
+
+    def iterate(self, generator: AsyncGenerator[T, None]) -> Iterator[T]:
+        """Start ``generator`` and return an iterator over its items.
+
+        The first item is fetched right away, so errors raised before it
+        propagate from here while the view can still choose a response.
+        """
+        self._generators.append(generator)
+        try:
+            first = self.run(anext(generator))
+        except StopAsyncIteration:
+            return iter(())
+        return self._iterate(first, generator)
+
+    def _iterate(
+        self, first: T, generator: AsyncGenerator[T, None]
+    ) -> Iterator[T]:
+        yield first
+        while True:
+            try:
+                yield self.run(anext(generator))
+            except StopAsyncIteration:
+                return
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            for generator in self._generators:
+                self.run(generator.aclose())
+            self.run(self._db_session.close())
+        finally:
+            if self._worker_loop is None:
+                self._loop.close()
@@ -3,11 +3,65 @@ import json
 from flask.sessions import SessionMixin
 from loguru import logger
 from pydantic import ValidationError
+from werkzeug.datastructures import MultiDict
 
+from config import (
+    BUDGET_ALERTS_ENABLED,
+    CRYPTOGRAPHY_EXECUTOR,
+    CRYPTOGRAPHY_MAX_PENDING,
+    CRYPTOGRAPHY_MAX_WORKERS,
+    POSTGRES_URI,
+    RECURRING_SCHEDULER_ENABLED,
+    REFERENCE_CACHE_NOTIFY,
+    REFERENCE_CACHE_TTL,
+    USER_CACHE_MAX_SIZE,
+    USER_CACHE_TTL,
+)
 from core.application.user.dto.user import UserDTO
 from core.application.user.use_cases.get_user import GetUserUseCase
-from core.infrastructure.database.core import SessionContextManager
 from core.infrastructure.repositories.user import UserRepository
+from core.infrastructure.services.budget_alerts import BudgetAlertDispatcher
+from core.infrastructure.services.cryptography import (
+    CryptographyService,
+    ExecutorCryptographyService,
+)
+from core.infrastructure.services.recurring_scheduler import (
+    RecurringTransactionScheduler,
+)
+from core.infrastructure.services.reference_cache import (
+    ReferenceDataCache,
+    ReferenceDataListener,
+)
+from core.infrastructure.services.user_cache import InMemoryUserCacheService
+from presentation.app.utils.database import RequestSessionContextManager
+
+
+user_cache = InMemoryUserCacheService(
+    ttl=USER_CACHE_TTL, max_size=USER_CACHE_MAX_SIZE
+)
+cryptography_service = ExecutorCryptographyService(
+    CryptographyService(),
+    executor_kind=CRYPTOGRAPHY_EXECUTOR,
+    max_workers=CRYPTOGRAPHY_MAX_WORKERS,
+    max_pending=CRYPTOGRAPHY_MAX_PENDING,
+)
+reference_cache = ReferenceDataCache(
+    ttl=REFERENCE_CACHE_TTL, notify=REFERENCE_CACHE_NOTIFY
+)
+if REFERENCE_CACHE_NOTIFY:
+    ReferenceDataListener(reference_cache, POSTGRES_URI).start()
+
+
+def start_background_workers() -> None:
+    """Start the periodic workers enabled in the config.
+
+    Called on ASGI lifespan startup, never on import: scripts and
+    serverless functions run them through their ``__main__`` instead.
+    """
+    if RECURRING_SCHEDULER_ENABLED:
+        RecurringTransactionScheduler().start()
+    if BUDGET_ALERTS_ENABLED:
+        BudgetAlertDispatcher().start()
 
 
 def get_parsed_errors(error: ValidationError) -> dict:
@@ -17,19 +71,41 @@ def get_parsed_errors(error: ValidationError) -> dict:
     for err in errors:
         try:
             parsed_errors[err["loc"][0]] = err.get("msg")
-        except KeyError as e:
+        except (KeyError, IndexError) as e:
             logger.error(f"Error parsing error: {e}")
             parsed_errors["unknown"] = err.get("msg")
 
     return parsed_errors
 
 
+def get_query_dict(
+    args: MultiDict[str, str], list_fields: tuple[str, ...] = ()
+) -> dict:
+    """Convert query arguments to a dict for DTO validation.
+
+    List fields accept both repeated and comma-separated values.
+    """
+    query: dict = args.to_dict()
+    for field in list_fields:
+        values = [
+            value
+            for raw in args.getlist(field)
+            for value in raw.split(",")
+            if value
+        ]
+        if values:
+            query[field] = values
+        else:
+            query.pop(field, None)
+    return query
+
+
 async def get_current_user(session: SessionMixin) -> UserDTO | None:
     user_id = session.get("user_id")
     if user_id is None:
         return None
-    async with SessionContextManager() as db_session:
+    async with RequestSessionContextManager() as db_session:
         user_repository = UserRepository(db_session)
-        use_case = GetUserUseCase(user_repository)
+        use_case = GetUserUseCase(user_repository, user_cache)
         user = await use_case.execute(user_id)
         return user
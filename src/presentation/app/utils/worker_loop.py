@@ -0,0 +1,213 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Callable, Coroutine, Iterable, TypeVar
+
+from loguru import logger
+
+from core.infrastructure.database.core import async_engine
+
+
+T = TypeVar("T")
+
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the event loop of the ASGI server, if the app runs under one.
+
+    ``None`` under WSGI, where every async view gets a loop of its own.
+    """
+    return _worker_loop
+
+
+def set_worker_loop(loop: asyncio.AbstractEventLoop | None) -> None:
+    global _worker_loop
+    _worker_loop = loop
+
+
+def run_on_worker_loop(
+    loop: asyncio.AbstractEventLoop, coroutine: Coroutine[Any, Any, T]
+) -> T:
+    """Run ``coroutine`` on ``loop`` from another thread and wait for it.
+
+    The coroutine sees the caller's context variables, so Flask's
+    ``request``, ``session`` and ``g`` keep working inside it.
+    """
+    context = contextvars.copy_context()
+    future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+    def on_done(task: asyncio.Task[T]) -> None:
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())  # type: ignore[arg-type]
+        else:
+            future.set_result(task.result())
+
+    def start() -> None:
+        task = loop.create_task(coroutine, context=context)
+        task.add_done_callback(on_done)
+
+    loop.call_soon_threadsafe(start)
+    return future.result()
+
+
+def _build_environ(scope: dict, body: IO[bytes]) -> dict[str, Any]:
+    """Build the WSGI environ of an ASGI HTTP request (PEP 3333)."""
+    script_name = scope.get("root_path", "").encode().decode("latin1")
+    path_info = scope["path"].encode().decode("latin1")
+    if path_info.startswith(script_name):
+        path_info = path_info[len(script_name):]
+    server = scope.get("server") or ("localhost", 80)
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": script_name,
+        "PATH_INFO": path_info,
+        "QUERY_STRING": scope["query_string"].decode("ascii"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": body,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client") is not None:
+        environ["REMOTE_ADDR"] = scope["client"][0]
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin1")
+        value = raw_value.decode("latin1")
+        if name == "content-length":
+            key = "CONTENT_LENGTH"
+        elif name == "content-type":
+            key = "CONTENT_TYPE"
+        else:
+            key = "HTTP_" + name.upper().replace("-", "_")
+        if key in environ:
+            value = f"{environ[key]},{value}"
+        environ[key] = value
+    return environ
+
+
+class WorkerLoopAsgiApp:
+    """Serve a Flask app over ASGI with one event loop per worker.
+
+    Flask still dispatches each request on a thread from a pool, but its
+    async views and hooks run on the server's event loop instead of on a
+    new loop per view, so pooled database connections are shared by all
+    requests of the worker. ``on_startup`` callbacks run on the lifespan
+    startup event, e.g. to start background workers.
+    """
+
+    def __init__(
+        self,
+        wsgi_application: Any,
+        max_threads: int,
+        on_startup: Iterable[Callable[[], None]] = (),
+    ):
+        self.wsgi_application = wsgi_application
+        self._on_startup = list(on_startup)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_threads, thread_name_prefix="asgi-request"
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type {scope['type']}")
+        loop = asyncio.get_running_loop()
+        if _worker_loop is None:
+            # Servers that do not send lifespan events
+            set_worker_loop(loop)
+        with SpooledTemporaryFile(max_size=65536) as body:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                body.write(message.get("body", b""))
+                if not message.get("more_body"):
+                    break
+            body.seek(0)
+            environ = _build_environ(scope, body)
+            await loop.run_in_executor(
+                self._executor,
+                contextvars.copy_context().run,
+                self._run_wsgi_app,
+                environ,
+                lambda message: run_on_worker_loop(loop, send(message)),
+            )
+
+    def _run_wsgi_app(
+        self, environ: dict[str, Any], send: Callable[[dict], None]
+    ) -> None:
+        status_line = ""
+        headers: list[tuple[bytes, bytes]] = []
+        started = False
+
+        def start_response(status, response_headers, exc_info=None):
+            nonlocal status_line, headers
+            if exc_info is not None and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            status_line = status
+            headers = [
+                (name.lower().encode("latin1"), value.encode("latin1"))
+                for name, value in response_headers
+            ]
+
+        def start() -> None:
+            nonlocal started
+            if not started:
+                started = True
+                send(
+                    {
+                        "type": "http.response.start",
+                        "status": int(status_line.split(" ", 1)[0]),
+                        "headers": headers,
+                    }
+                )
+
+        output = self.wsgi_application(environ, start_response)
+        try:
+            for chunk in output:
+                start()
+                if chunk:
+                    send(
+                        {
+                            "type": "http.response.body",
+                            "body": chunk,
+                            "more_body": True,
+                        }
+                    )
+            start()
+            send({"type": "http.response.body"})
+        finally:
+            close = getattr(output, "close", None)
+            if close is not None:
+                close()
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                set_worker_loop(asyncio.get_running_loop())
+                for callback in self._on_startup:
+                    callback()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                try:
+                    await async_engine.dispose()
+                except Exception as e:
+                    logger.error(f"Closing database connections failed: {e}")
+                set_worker_loop(None)
+                self._executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return